@@ -10,6 +10,10 @@ Most implementation functionality still lives in component projects.
 
 from __future__ import annotations
 
+import importlib
+import importlib.util
+from typing import Any
+
 __version__ = "0.1.11"
 __author__ = "Laurent-Philippe Albou"
 __license__ = "MIT"
@@ -59,27 +63,44 @@ CORE_DEFAULT_EXTRAS = [
 ]
 
 # Convenience re-exports (AbstractCore is a base dependency of this meta-package).
-# Keep this import lightweight: do not import optional tool/media deps here.
-try:
-    from abstractcore import GenerateResponse, create_llm  # type: ignore
-
-    __all__ = [
-        "CORE_DEFAULT_EXTRAS",
-        "RELEASE_VERSIONS",
-        "GenerateResponse",
-        "create_llm",
-        "get_installed_packages",
-        "get_release_profile",
-        "print_status",
-    ]
-except Exception:  # pragma: no cover
-    __all__ = [
-        "CORE_DEFAULT_EXTRAS",
-        "RELEASE_VERSIONS",
-        "get_installed_packages",
-        "get_release_profile",
-        "print_status",
-    ]
+# These resolve lazily on first attribute access (PEP 562) so `import abstractframework`
+# and the CLI never pay the AbstractCore import cost unless the caller asks for them.
+_LAZY_REEXPORTS: dict[str, str] = {
+    "GenerateResponse": "abstractcore",
+    "create_llm": "abstractcore",
+}
+
+__all__ = [
+    "CORE_DEFAULT_EXTRAS",
+    "RELEASE_VERSIONS",
+    "get_installed_packages",
+    "get_release_profile",
+    "print_status",
+]
+
+# Star-import resolves every name in `__all__`, so only list the re-exports when their
+# module can be found (`find_spec` locates it without importing it).
+if importlib.util.find_spec("abstractcore") is not None:
+    __all__ += list(_LAZY_REEXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_REEXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as exc:
+        raise AttributeError(
+            f"{name} is re-exported from {module_name}, which is not installed"
+        ) from exc
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_REEXPORTS))
 
 
 def get_release_profile() -> dict[str, object]:
@@ -99,28 +120,75 @@ def get_release_profile() -> dict[str, object]:
     }
 
 
-def get_installed_packages() -> dict[str, str]:
-    """Return a dict of installed AbstractFramework Python packages and versions."""
+DEEP_IMPORT_TIMEOUT_S = 30.0
+
+_DEEP_IMPORT_SCRIPT = (
+    "import importlib, sys\n"
+    "module = importlib.import_module(sys.argv[1])\n"
+    "print(getattr(module, '__version__', 'installed'))\n"
+)
+
+
+def _deep_import_version(import_name: str, timeout: float) -> str | None:
+    import subprocess
+    import sys
+
+    try:
+        result = subprocess.run(
+            [sys.executable, "-c", _DEEP_IMPORT_SCRIPT, import_name],
+            check=False,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    lines = result.stdout.strip().splitlines()
+    return lines[-1] if lines else "installed"
+
+
+def get_installed_packages(
+    *, deep: bool = False, timeout: float = DEEP_IMPORT_TIMEOUT_S
+) -> dict[str, str]:
+    """Return a dict of installed AbstractFramework Python packages and versions.
+
+    By default versions are read from distribution metadata only, so no component
+    (and none of its torch/audio/vision stacks) is imported. With ``deep=True`` each
+    component is imported in its own subprocess, bounded by ``timeout`` seconds, and
+    the reported version is the module's ``__version__``; a component that fails or
+    times out is reported as not installed.
+    """
 
     packages: dict[str, str] = {}
 
-    def _maybe_add(import_name: str) -> None:
-        try:
-            mod = __import__(import_name)
-            packages[import_name] = getattr(mod, "__version__", "installed")
-        except Exception:
-            return
+    if not deep:
+        from .distributions import lookup_version, scan_distributions
+
+        index = scan_distributions()
+        for name, distribution in PACKAGE_DISTRIBUTIONS.items():
+            version = lookup_version(index, distribution)
+            if version is not None:
+                packages[name] = version
+        return packages
+
+    from concurrent.futures import ThreadPoolExecutor
 
-    for name in PACKAGE_DISTRIBUTIONS:
-        _maybe_add(name)
+    names = list(PACKAGE_DISTRIBUTIONS)
+    with ThreadPoolExecutor(max_workers=min(8, len(names))) as pool:
+        versions = pool.map(lambda name: _deep_import_version(name, timeout), names)
+        for name, version in zip(names, versions):
+            if version is not None:
+                packages[name] = version
 
     return packages
 
 
-def print_status() -> None:
+def print_status(*, deep: bool = False) -> None:
     """Print installation status of the main AbstractFramework Python packages."""
 
-    installed = get_installed_packages()
+    installed = get_installed_packages(deep=deep)
     all_packages = list(PACKAGE_DISTRIBUTIONS)
 
     print("AbstractFramework installation status")
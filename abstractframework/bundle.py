@@ -0,0 +1,356 @@
+"""Offline wheelhouse bundles for air-gapped installs.
+
+`build_bundle()` resolves install profiles into hash-pinned locks (see `locks`) from
+local wheel sources only, and gathers exactly the locked wheels, plus npm tarballs
+of the pinned UI apps, into one directory:
+
+    bundle.json          bundle manifest: profiles, locks, artifacts, digests
+    SHA256SUMS           checksums of every artifact (`sha256sum -c SHA256SUMS`)
+    install-manifest.json
+    locks/               one lock per profile and target, plus index.json
+    wheels/              every wheel once, shared by all profiles
+    npm/                 `npm pack` tarballs of the pinned npm apps
+
+Rebuilding into an existing bundle keeps the profiles it already holds, reuses
+wheels that are already present, and drops wheels that no lock references anymore.
+`install_bundle()` installs a profile straight from the bundle with no index lookup.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+from . import NPM_RELEASE_VERSIONS, __version__
+from .install_manifest import LOCK_INSTALL_COMMAND, manifest_bytes, manifest_digest
+from .locks import DEFAULT_LOCK_TIMEOUT_S, LockError, LockTarget, current_target, write_lock
+from .npmwarm import npm_tarball_name
+
+BUNDLE_FORMAT = 1
+BUNDLE_MANIFEST = "bundle.json"
+CHECKSUMS = "SHA256SUMS"
+
+
+class BundleError(RuntimeError):
+    """Raised when a bundle cannot be built, verified, or installed."""
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _place(source: Path, destination: Path) -> None:
+    """Hard-link `source` to `destination` when possible (same file system), else copy."""
+
+    destination.unlink(missing_ok=True)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+def pip_cache_wheels() -> Path | None:
+    """Return pip's locally built wheel store (`<pip cache dir>/wheels`), if any."""
+
+    try:
+        result = subprocess.run(
+            [sys.executable, "-m", "pip", "cache", "dir"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    wheels = Path(result.stdout.strip()) / "wheels"
+    return wheels if result.returncode == 0 and wheels.is_dir() else None
+
+
+def _wheel_sources(sources: Iterable[Path]) -> dict[str, Path]:
+    """Return wheel file name -> path across `sources` (searched recursively, first wins)."""
+
+    wheels: dict[str, Path] = {}
+    for source in sources:
+        for path in sorted(Path(source).rglob("*.whl")):
+            wheels.setdefault(path.name, path)
+    return wheels
+
+
+def _npm_dependencies(path: Path) -> dict[str, str]:
+    try:
+        with tarfile.open(path, "r:gz") as archive:
+            member = archive.extractfile("package/package.json")
+            data = json.loads(member.read()) if member is not None else {}
+    except (OSError, KeyError, ValueError, tarfile.TarError):
+        return {}
+    bundled = set(data.get("bundleDependencies") or data.get("bundledDependencies") or [])
+    return {
+        name: spec
+        for name, spec in (data.get("dependencies") or {}).items()
+        if name not in bundled
+    }
+
+
+def _gather_npm(destination: Path, sources: Sequence[Path], npm: str | None) -> dict[str, Any]:
+    destination.mkdir(parents=True, exist_ok=True)
+    entries: dict[str, Any] = {}
+    for package, version in NPM_RELEASE_VERSIONS.items():
+        name = npm_tarball_name(package, version)
+        target = destination / name
+        found = next((Path(s) / name for s in sources if (Path(s) / name).is_file()), None)
+        if found is not None:
+            if found.resolve() != target.resolve():
+                _place(found, target)
+        elif not target.is_file():
+            if npm is None:
+                raise BundleError(
+                    f"no tarball {name} in the npm sources and npm is not available"
+                )
+            # `npm pack` reads from the npm cache first, so a warm cache needs no network.
+            result = subprocess.run(
+                [npm, "pack", f"{package}@{version}", "--pack-destination", str(destination)],
+                capture_output=True,
+                text=True,
+                timeout=DEFAULT_LOCK_TIMEOUT_S,
+                check=False,
+            )
+            if result.returncode != 0 or not target.is_file():
+                raise BundleError(f"npm pack {package}@{version} failed: {result.stderr.strip()}")
+        entries[package] = {
+            "version": version,
+            "path": f"npm/{name}",
+            "sha256": _sha256(target),
+            "size": target.stat().st_size,
+            "dependencies": _npm_dependencies(target),
+        }
+    wanted = {Path(entry["path"]).name for entry in entries.values()}
+    for stale in destination.glob("*.tgz"):
+        if stale.name not in wanted:
+            stale.unlink()
+    return entries
+
+
+def read_bundle(directory: str | Path) -> dict[str, Any]:
+    """Return the bundle manifest of `directory`; raise `BundleError` when unreadable."""
+
+    path = Path(directory) / BUNDLE_MANIFEST
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        raise BundleError(f"cannot read {path}: {exc}") from exc
+    if not isinstance(data, dict) or data.get("format") != BUNDLE_FORMAT:
+        raise BundleError(f"{path} has an unsupported format")
+    return data
+
+
+def build_bundle(
+    directory: str | Path,
+    profiles: Sequence[str],
+    *,
+    wheel_dirs: Sequence[str | Path] = (),
+    npm_dirs: Sequence[str | Path] = (),
+    include_npm: bool = True,
+    target: LockTarget | None = None,
+    timeout: float = DEFAULT_LOCK_TIMEOUT_S,
+) -> dict[str, Any]:
+    """Build or update the bundle in `directory` for `profiles` and return its manifest.
+
+    Profiles are resolved offline against `wheel_dirs` (searched recursively, so pip's
+    wheel cache works too). npm tarballs come from `npm_dirs`, or `npm pack` otherwise.
+    """
+
+    directory = Path(directory)
+    wheels_dir = directory / "wheels"
+    # Wheels already in the bundle count as a source, so profiles can be added later.
+    sources = _wheel_sources([*(Path(source) for source in wheel_dirs), wheels_dir])
+    if not sources:
+        raise BundleError("no wheels found in the given wheel directories")
+    try:
+        previous = read_bundle(directory)
+    except BundleError:
+        previous = {}
+    if previous.get("framework_version") != __version__:
+        previous = {}
+
+    wheels_dir.mkdir(parents=True, exist_ok=True)
+    locked: dict[str, list[dict[str, Any]]] = dict(previous.get("profiles", {}))
+    with tempfile.TemporaryDirectory(prefix="abstractframework-bundle-") as scratch:
+        # pip's --find-links does not recurse; give it one flat view of every source.
+        links = Path(scratch)
+        for name, path in sources.items():
+            try:
+                (links / name).symlink_to(path.resolve())
+            except OSError:
+                shutil.copy2(path, links / name)
+        for profile_id in profiles:
+            try:
+                entry = write_lock(
+                    directory / "locks",
+                    profile_id,
+                    find_links=links,
+                    target=target,
+                    timeout=timeout,
+                )
+            except LockError as exc:
+                raise BundleError(str(exc)) from exc
+            entries = [
+                lock
+                for lock in locked.get(profile_id, [])
+                if lock["target"]["tag"] != entry["target"]["tag"]
+            ]
+            entries.append(entry)
+            locked[profile_id] = sorted(entries, key=lambda lock: lock["target"]["tag"])
+
+    wheels: dict[str, dict[str, Any]] = {}
+    for profile_id, entries in sorted(locked.items()):
+        for entry in entries:
+            for wheel in entry["wheels"]:
+                record = wheels.setdefault(
+                    wheel["filename"],
+                    {
+                        "name": wheel["name"],
+                        "version": wheel["version"],
+                        "sha256": wheel["sha256"],
+                        "profiles": [],
+                    },
+                )
+                if profile_id not in record["profiles"]:
+                    record["profiles"].append(profile_id)
+
+    reused = 0
+    for filename, record in wheels.items():
+        destination = wheels_dir / filename
+        known = previous.get("wheels", {}).get(filename)
+        if known and known["sha256"] == record["sha256"] and destination.is_file():
+            reused += 1
+        else:
+            source = sources.get(filename)
+            if source is None:
+                raise BundleError(f"{filename} is locked but missing from the wheel sources")
+            if not destination.is_file() or not os.path.samefile(source, destination):
+                _place(source, destination)
+            if _sha256(destination) != record["sha256"]:
+                raise BundleError(f"{filename} does not match its locked sha256")
+        record["size"] = destination.stat().st_size
+    for stale in wheels_dir.glob("*.whl"):
+        if stale.name not in wheels:
+            stale.unlink()
+
+    npm = previous.get("npm", {})
+    if include_npm:
+        npm_sources = [Path(source) for source in npm_dirs]
+        npm = _gather_npm(directory / "npm", npm_sources, shutil.which("npm"))
+    (directory / "install-manifest.json").write_bytes(manifest_bytes())
+
+    manifest = {
+        "format": BUNDLE_FORMAT,
+        "framework_version": __version__,
+        "install_manifest": {"path": "install-manifest.json", "digest": manifest_digest()},
+        "profiles": locked,
+        "wheels": dict(sorted(wheels.items())),
+        "npm": npm,
+    }
+    (directory / BUNDLE_MANIFEST).write_text(
+        json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    _write_checksums(directory, manifest)
+    manifest["reused_wheels"] = reused
+    return manifest
+
+
+def _artifacts(manifest: dict[str, Any]) -> list[tuple[str, str | None]]:
+    """Return `(relative path, expected sha256 or None)` for every bundled artifact."""
+
+    artifacts: list[tuple[str, str | None]] = [("install-manifest.json", None)]
+    for name, wheel in manifest["wheels"].items():
+        artifacts.append((f"wheels/{name}", wheel["sha256"]))
+    artifacts += [(entry["path"], entry["sha256"]) for entry in manifest["npm"].values()]
+    artifacts += [("locks/index.json", None)]
+    for entries in manifest["profiles"].values():
+        artifacts += [(f"locks/{entry['path']}", entry["sha256"]) for entry in entries]
+    return sorted(set(artifacts))
+
+
+def _write_checksums(directory: Path, manifest: dict[str, Any]) -> None:
+    lines = []
+    for relative, expected in _artifacts(manifest):
+        lines.append(f"{expected or _sha256(directory / relative)}  {relative}")
+    (directory / CHECKSUMS).write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def verify_bundle(directory: str | Path) -> list[str]:
+    """Return the problems found checking every artifact in `SHA256SUMS`; empty when intact."""
+
+    directory = Path(directory)
+    try:
+        lines = (directory / CHECKSUMS).read_text(encoding="utf-8").splitlines()
+    except OSError as exc:
+        return [f"cannot read {directory / CHECKSUMS}: {exc}"]
+    problems = []
+    for line in lines:
+        expected, _, relative = line.partition("  ")
+        try:
+            actual = _sha256(directory / relative)
+        except OSError:
+            problems.append(f"{relative} is missing")
+            continue
+        if actual != expected:
+            problems.append(f"{relative} does not match its checksum")
+    return problems
+
+
+def install_command(directory: str | Path, profile_id: str, tag: str | None = None) -> list[str]:
+    """Return the pip command installing `profile_id` from the bundle, with no index lookup.
+
+    Without `tag`, the lock for this interpreter is used, or the profile's only lock.
+    """
+
+    directory = Path(directory)
+    manifest = read_bundle(directory)
+    if profile_id not in manifest["profiles"]:
+        known = ", ".join(manifest["profiles"]) or "none"
+        raise BundleError(f"bundle has no profile {profile_id!r} (available: {known})")
+    entries = {entry["target"]["tag"]: entry for entry in manifest["profiles"][profile_id]}
+    wanted = tag or current_target().tag
+    if wanted not in entries and tag is None and len(entries) == 1:
+        wanted = next(iter(entries))
+    if wanted not in entries:
+        available = ", ".join(entries)
+        raise BundleError(f"bundle has no {profile_id} lock for {wanted} (available: {available})")
+    lock = directory / "locks" / entries[wanted]["path"]
+    return [
+        sys.executable,
+        *LOCK_INSTALL_COMMAND[1:-1],
+        "--no-index",
+        "--find-links",
+        str(directory / "wheels"),
+        "-r",
+        str(lock),
+    ]
+
+
+def install_bundle(
+    directory: str | Path,
+    profile_id: str,
+    tag: str | None = None,
+    extra_args: Sequence[str] = (),
+) -> int:
+    """Verify the bundle, then install `profile_id` from it with pip; return pip's exit code."""
+
+    command = install_command(directory, profile_id, tag)
+    problems = verify_bundle(directory)
+    if problems:
+        raise BundleError("bundle failed verification: " + "; ".join(problems))
+    return subprocess.run([*command, *extra_args], check=False).returncode
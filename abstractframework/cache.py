@@ -0,0 +1,143 @@
+"""Small on-disk cache for doctor probe results.
+
+Entries are keyed on the identity of what was probed (resolved executable path plus
+mtime/size, or the mtimes of the `sys.path` directories) so a changed install
+invalidates them naturally; the TTL bounds how long an unchanged key is trusted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+DEFAULT_CACHE_TTL_S = 24 * 60 * 60
+CACHE_ENV_VAR = "ABSTRACTFRAMEWORK_CACHE_DIR"
+_CACHE_FORMAT = 1
+
+
+def user_cache_dir() -> Path:
+    """Return the per-user cache directory for AbstractFramework helpers."""
+
+    override = os.environ.get(CACHE_ENV_VAR)
+    if override:
+        return Path(override).expanduser()
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "abstractframework"
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or str(Path.home() / "AppData" / "Local")
+        return Path(base) / "abstractframework" / "Cache"
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "abstractframework"
+
+
+def executable_key(executable: str) -> str | None:
+    """Return a cache key for an executable: resolved path plus mtime and size."""
+
+    resolved = os.path.realpath(executable)
+    try:
+        stat = os.stat(resolved)
+    except OSError:
+        return None
+    return f"{resolved}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def paths_fingerprint(paths: Iterable[str]) -> str:
+    """Return a digest of the given directories and their mtimes.
+
+    Installing, upgrading, or removing a distribution adds or renames its metadata
+    directory, which bumps the mtime of the containing `site-packages` directory.
+    """
+
+    digest = hashlib.sha256()
+    for path in paths:
+        try:
+            mtime = os.stat(path or ".").st_mtime_ns
+        except OSError:
+            mtime = -1
+        digest.update(f"{path}\0{mtime}\n".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+class ProbeCache:
+    """JSON-file cache of probe values with a TTL.
+
+    With `refresh=True` existing entries are ignored but new results are still
+    written, so the next run is warm again.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        ttl: float = DEFAULT_CACHE_TTL_S,
+        refresh: bool = False,
+    ) -> None:
+        self.path = Path(path) if path is not None else user_cache_dir() / "doctor-probes.json"
+        self.ttl = ttl
+        self.refresh = refresh
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._dirty = False
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = None
+            if isinstance(data, dict) and data.get("format") == _CACHE_FORMAT:
+                entries = data.get("entries")
+                if isinstance(entries, dict):
+                    self._entries = entries
+        return self._entries
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for `key`, or None when missing, expired, or refreshing."""
+
+        if self.refresh:
+            return None
+        entry = self._load().get(key)
+        if not isinstance(entry, dict) or "value" not in entry:
+            return None
+        stored_at = entry.get("stored_at")
+        if not isinstance(stored_at, (int, float)) or time.time() - stored_at > self.ttl:
+            return None
+        return entry["value"]
+
+    def put(self, key: str, value: Any) -> None:
+        self._load()[key] = {"stored_at": time.time(), "value": value}
+        self._dirty = True
+
+    def save(self) -> None:
+        """Persist pending entries atomically, dropping expired ones. Errors are ignored."""
+
+        if not self._dirty or self._entries is None:
+            return
+        now = time.time()
+        entries = {
+            key: entry
+            for key, entry in self._entries.items()
+            if isinstance(entry, dict)
+            and isinstance(entry.get("stored_at"), (int, float))
+            and now - entry["stored_at"] <= self.ttl
+        }
+        payload = json.dumps({"format": _CACHE_FORMAT, "entries": entries}, sort_keys=True)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=f".{self.path.name}-", dir=self.path.parent)
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(payload)
+            os.replace(tmp, self.path)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            return
+        self._dirty = False
@@ -0,0 +1,374 @@
+"""Hardware capacity probe and install-profile recommendation.
+
+Reads what a local-inference decision actually depends on: CPU count, topology and
+SIMD flags, total and available memory, cgroup CPU/memory limits (containers), GPU
+presence, and a short disk read-throughput sample. The probe uses `/proc`, `/sys`,
+and the cgroup filesystem on Linux, with `os`/`sysctl` fallbacks elsewhere, so it
+works in a plain container without any GPU tooling.
+
+`recommend_profile()` then picks one of the install manifest's `profiles` and
+explains why, alongside the verdict for every other profile.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import platform
+import shutil
+import subprocess
+import time
+from pathlib import Path
+from typing import Any
+
+GIB = 1024**3
+DEFAULT_DISK_SAMPLE_BYTES = 32 * 1024 * 1024
+# Rough floors for running local models next to the framework itself.
+APPLE_MIN_MEMORY = 16 * GIB
+CPU_LOCAL_MIN_CPUS = 8
+CPU_LOCAL_MIN_MEMORY = 16 * GIB
+
+_SIMD_FLAGS = {
+    "sse4_2": "sse4.2",
+    "avx": "avx",
+    "avx2": "avx2",
+    "fma": "fma",
+    "avx512f": "avx512",
+    "avx512_bf16": "avx512-bf16",
+    "avx512_vnni": "avx512-vnni",
+    "amx_tile": "amx",
+    "asimd": "neon",
+    "neon": "neon",
+    "sve": "sve",
+}
+# cgroup v1 reports "no limit" as a huge page-aligned number.
+_UNLIMITED = 1 << 60
+
+
+def _read(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None
+
+
+def _cpuinfo(root: Path) -> dict[str, Any]:
+    text = _read(root / "proc" / "cpuinfo") or ""
+    flags: set[str] = set()
+    cores: set[tuple[str, str]] = set()
+    sockets: set[str] = set()
+    model: str | None = None
+    block: dict[str, str] = {}
+    for line in [*text.splitlines(), ""]:
+        if not line.strip():
+            if "core id" in block:
+                cores.add((block.get("physical id", "0"), block["core id"]))
+            if "physical id" in block:
+                sockets.add(block["physical id"])
+            block = {}
+            continue
+        key, _, value = line.partition(":")
+        key, value = key.strip(), value.strip()
+        block[key] = value
+        if key in {"flags", "Features"}:
+            flags.update(value.split())
+        elif key in {"model name", "Processor"} and model is None:
+            model = value
+    return {
+        "model": model,
+        "physical_cores": len(cores) or None,
+        "sockets": len(sockets) or None,
+        "flags": flags,
+    }
+
+
+def _sysctl(name: str) -> str | None:
+    executable = shutil.which("sysctl")
+    if executable is None:
+        return None
+    try:
+        result = subprocess.run(
+            [executable, "-n", name], capture_output=True, text=True, timeout=2, check=False
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def probe_cpu(root: Path = Path("/")) -> dict[str, Any]:
+    """Return logical/physical CPU counts, socket count, model, and SIMD features."""
+
+    info = _cpuinfo(root)
+    logical = os.cpu_count()
+    try:
+        usable = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        usable = logical
+    physical = info["physical_cores"]
+    if physical is None and platform.system() == "Darwin":
+        value = _sysctl("hw.physicalcpu")
+        physical = int(value) if value and value.isdigit() else None
+    simd = sorted({label for flag, label in _SIMD_FLAGS.items() if flag in info["flags"]})
+    machine = platform.machine().lower()
+    if machine in {"arm64", "aarch64"} and "neon" not in simd:
+        # NEON is mandatory on 64-bit ARM; macOS does not list it anywhere.
+        simd = sorted([*simd, "neon"])
+    return {
+        "model": info["model"],
+        "machine": machine,
+        "logical": logical,
+        "usable": usable,
+        "physical_cores": physical,
+        "sockets": info["sockets"],
+        "simd": simd,
+    }
+
+
+def probe_memory(root: Path = Path("/")) -> dict[str, int | None]:
+    """Return total and available memory in bytes (available is None when unknown)."""
+
+    fields: dict[str, int] = {}
+    for line in (_read(root / "proc" / "meminfo") or "").splitlines():
+        key, _, value = line.partition(":")
+        parts = value.split()
+        if parts and parts[0].isdigit():
+            fields[key] = int(parts[0]) * (1024 if parts[1:] == ["kB"] else 1)
+    total = fields.get("MemTotal")
+    available = fields.get("MemAvailable")
+    if total is None:
+        if platform.system() == "Darwin":
+            value = _sysctl("hw.memsize")
+            total = int(value) if value and value.isdigit() else None
+        else:
+            try:
+                total = os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+            except (AttributeError, OSError, ValueError):
+                total = None
+    return {"total_bytes": total, "available_bytes": available}
+
+
+def _cgroup_dirs(root: Path, controller: str) -> list[Path]:
+    """Return candidate directories for `controller` ("" for the v2 unified hierarchy)."""
+
+    base = root / "sys" / "fs" / "cgroup"
+    mount = base / controller if controller else base
+    candidates = []
+    for line in (_read(root / "proc" / "self" / "cgroup") or "").splitlines():
+        parts = line.split(":", 2)
+        if len(parts) != 3:
+            continue
+        _, controllers, path = parts
+        if (controllers == "" and not controller) or controller in controllers.split(","):
+            candidates.append(mount / path.lstrip("/"))
+    # Inside a cgroup namespace the mount root already is this process's cgroup.
+    candidates.append(mount)
+    return candidates
+
+
+def _first_int(directories: list[Path], name: str) -> int | None:
+    for directory in directories:
+        text = _read(directory / name)
+        if text is not None:
+            text = text.strip()
+            return int(text) if text.lstrip("-").isdigit() else None
+    return None
+
+
+def probe_cgroup(root: Path = Path("/")) -> dict[str, Any]:
+    """Return cgroup v2 or v1 CPU quota (in CPUs) and memory limit/usage in bytes.
+
+    Limits are None when the process is not constrained (or not on Linux).
+    """
+
+    for directory in _cgroup_dirs(root, ""):
+        if not (directory / "cgroup.controllers").is_file():
+            continue
+        quota, _, period = (_read(directory / "cpu.max") or "max").strip().partition(" ")
+        cpus = int(quota) / int(period) if quota.isdigit() and period.isdigit() else None
+        memory = _first_int([directory], "memory.max")
+        return {
+            "version": 2,
+            "cpu_limit": cpus,
+            "memory_limit_bytes": memory,
+            "memory_usage_bytes": _first_int([directory], "memory.current"),
+        }
+
+    cpu_dirs = _cgroup_dirs(root, "cpu")
+    memory_dirs = _cgroup_dirs(root, "memory")
+    quota = _first_int(cpu_dirs, "cpu.cfs_quota_us")
+    period = _first_int(cpu_dirs, "cpu.cfs_period_us")
+    memory = _first_int(memory_dirs, "memory.limit_in_bytes")
+    if quota is None and memory is None:
+        return {
+            "version": None,
+            "cpu_limit": None,
+            "memory_limit_bytes": None,
+            "memory_usage_bytes": None,
+        }
+    return {
+        "version": 1,
+        "cpu_limit": quota / period if quota and quota > 0 and period else None,
+        "memory_limit_bytes": memory if memory is not None and memory < _UNLIMITED else None,
+        "memory_usage_bytes": _first_int(memory_dirs, "memory.usage_in_bytes"),
+    }
+
+
+def sample_disk_read(directory: Path, size: int = DEFAULT_DISK_SAMPLE_BYTES) -> dict[str, Any]:
+    """Write `size` bytes under `directory`, evict them from the page cache, and time a read.
+
+    Eviction uses `posix_fadvise(DONTNEED)`; where that is unavailable the result may
+    reflect the page cache rather than the disk, and `cached` is True.
+    """
+
+    chunk = os.urandom(1024 * 1024)
+    path = directory / f".capacity-{os.getpid()}.bin"
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        flags = os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(path, flags, 0o600)
+    except OSError as exc:
+        return {"path": str(directory), "error": str(exc)}
+    try:
+        written = 0
+        while written < size:
+            written += os.write(fd, chunk[: size - written])
+        os.fsync(fd)
+        evicted = hasattr(os, "posix_fadvise")
+        if evicted:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        os.lseek(fd, 0, os.SEEK_SET)
+        started = time.perf_counter()
+        read = 0
+        while True:
+            data = os.read(fd, 1024 * 1024)
+            if not data:
+                break
+            read += len(data)
+        elapsed = max(time.perf_counter() - started, 1e-9)
+    except OSError as exc:
+        return {"path": str(directory), "error": str(exc)}
+    finally:
+        os.close(fd)
+        path.unlink(missing_ok=True)
+    return {
+        "path": str(directory),
+        "bytes": read,
+        "seconds": round(elapsed, 6),
+        "read_mb_s": round(read / elapsed / (1024 * 1024), 1),
+        "cached": not evicted,
+    }
+
+
+def probe_capacity(
+    root: Path = Path("/"),
+    disk_dir: Path | None = None,
+    disk_sample_bytes: int = DEFAULT_DISK_SAMPLE_BYTES,
+) -> dict[str, Any]:
+    """Return the raw capacity numbers plus the effective CPU/memory after cgroup limits.
+
+    `root` relocates `/proc` and `/sys` (for tests); `disk_dir` is where the read
+    sample is taken, skipped when None.
+    """
+
+    cpu = probe_cpu(root)
+    memory = probe_memory(root)
+    cgroup = probe_cgroup(root)
+
+    cpus = [value for value in (cpu["logical"], cpu["usable"]) if value]
+    if cgroup["cpu_limit"]:
+        cpus.append(max(1, math.ceil(cgroup["cpu_limit"])))
+    total = [value for value in (memory["total_bytes"], cgroup["memory_limit_bytes"]) if value]
+    available = [memory["available_bytes"]] if memory["available_bytes"] is not None else []
+    if cgroup["memory_limit_bytes"] and cgroup.get("memory_usage_bytes") is not None:
+        available.append(max(0, cgroup["memory_limit_bytes"] - cgroup["memory_usage_bytes"]))
+
+    system = platform.system()
+    return {
+        "system": system,
+        "cpu": cpu,
+        "memory": memory,
+        "cgroup": cgroup,
+        "gpu": {
+            "nvidia_smi": shutil.which("nvidia-smi") is not None,
+            "apple_silicon": system == "Darwin" and cpu["machine"] in {"arm64", "aarch64"},
+        },
+        "disk": sample_disk_read(disk_dir, disk_sample_bytes) if disk_dir is not None else None,
+        "effective": {
+            "cpus": min(cpus) if cpus else None,
+            "memory_bytes": min(total) if total else None,
+            "available_memory_bytes": min(available) if available else None,
+        },
+    }
+
+
+def _gib(value: int | None) -> str:
+    return "unknown" if value is None else f"{value / GIB:.1f} GiB"
+
+
+def _platform_id(system: str) -> str:
+    return {"Darwin": "macos", "Windows": "windows"}.get(system, system.lower())
+
+
+def recommend_profile(capacity: dict[str, Any], profiles: list[dict[str, Any]]) -> dict[str, Any]:
+    """Pick an install profile for `capacity` from the manifest `profiles`, with reasons.
+
+    A local-inference profile is chosen only when its platform matches and its
+    accelerator is present (Apple Silicon with enough memory, or an NVIDIA driver);
+    otherwise the remote-first profile is recommended.
+    """
+
+    effective = capacity["effective"]
+    cpus, memory = effective["cpus"], effective["memory_bytes"]
+    platform_id = _platform_id(capacity["system"])
+    summary = f"{cpus or 'unknown'} usable CPUs, {_gib(memory)} memory"
+    if capacity["cgroup"]["cpu_limit"] or capacity["cgroup"]["memory_limit_bytes"]:
+        summary += " (cgroup-limited)"
+
+    verdicts: list[dict[str, Any]] = []
+    for profile in profiles:
+        reasons: list[str] = []
+        if platform_id not in profile.get("platforms", [platform_id]):
+            reasons.append(f"{profile['id']} does not support {platform_id}")
+        prerequisites = profile.get("prerequisites", [])
+        if "apple-silicon" in prerequisites:
+            if not capacity["gpu"]["apple_silicon"]:
+                reasons.append("no Apple Silicon")
+            elif memory is not None and memory < APPLE_MIN_MEMORY:
+                reasons.append(f"{_gib(memory)} memory is below {_gib(APPLE_MIN_MEMORY)}")
+        if "gpu-driver" in prerequisites and not capacity["gpu"]["nvidia_smi"]:
+            reasons.append("no GPU driver (nvidia-smi) found")
+        verdicts.append(
+            {
+                "id": profile["id"],
+                "suitable": not reasons,
+                "local_inference": bool(profile.get("local_inference")),
+                "reasons": reasons or [f"{profile['id']} prerequisites are met"],
+            }
+        )
+
+    local = [verdict for verdict in verdicts if verdict["suitable"] and verdict["local_inference"]]
+    remote = [
+        verdict for verdict in verdicts if verdict["suitable"] and not verdict["local_inference"]
+    ]
+    chosen = (local or remote or verdicts)[0]
+    if chosen["local_inference"]:
+        reasoning = [f"{chosen['id']} accelerator detected", summary]
+    else:
+        reasoning = ["no supported local accelerator detected", summary]
+        simd = set(capacity["cpu"]["simd"])
+        if (
+            cpus is not None
+            and cpus >= CPU_LOCAL_MIN_CPUS
+            and memory is not None
+            and memory >= CPU_LOCAL_MIN_MEMORY
+            and simd & {"avx2", "avx512", "neon"}
+        ):
+            reasoning.append(
+                "enough CPU and memory for CPU-only local models through an endpoint server "
+                "such as llama.cpp or Ollama"
+            )
+        else:
+            reasoning.append("use remote or OpenAI-compatible endpoints for inference")
+    return {"profile": chosen["id"], "reasoning": reasoning, "profiles": verdicts}
@@ -3,18 +3,51 @@
 from __future__ import annotations
 
 import argparse
-import importlib.metadata
 import json
 import platform
 import shutil
 import subprocess
 import sys
-from dataclasses import dataclass
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Sequence
+from typing import TYPE_CHECKING, Any, Callable, Sequence
 
 from . import PACKAGE_DISTRIBUTIONS, RELEASE_VERSIONS, __version__
-from .install_manifest import check_install_manifest, manifest_json, write_install_manifest
+from .cache import (
+    DEFAULT_CACHE_TTL_S,
+    ProbeCache,
+    executable_key,
+    paths_fingerprint,
+    user_cache_dir,
+)
+from .distributions import lookup_version, normalize_name, scan_distributions
+from .gitstatus import RepoStatus, workspace_status
+from .importtime import (
+    DEFAULT_IMPORT_TIMEOUT_S,
+    DEFAULT_TOP_OFFENDERS,
+    ImportProfile,
+    check_budget,
+    load_budget,
+    profile_imports,
+)
+from .install_manifest import (
+    build_install_manifest,
+    check_install_manifest,
+    diff_install_manifest,
+    digest_path,
+    manifest_digest,
+    manifest_json,
+    write_install_manifest,
+)
+from .npmwarm import NpmWarmError, warm_npm_apps, warm_prefix, warm_status
+from .timing import Span, TimingRecorder
+from .workspace import DEFAULT_JOBS, BuildResult, WorkspaceError, build_workspace
+
+if TYPE_CHECKING:
+    from .launch import Launch
 
 
 @dataclass(frozen=True)
@@ -23,22 +56,41 @@ class Check:
     status: str
     message: str
     detail: str | None = None
+    cached: bool = False
+    timing: Span | None = None
 
-    def as_dict(self) -> dict[str, str]:
-        data = {"id": self.id, "status": self.status, "message": self.message}
+    def as_dict(self) -> dict[str, object]:
+        data: dict[str, object] = {"id": self.id, "status": self.status, "message": self.message}
         if self.detail:
             data["detail"] = self.detail
+        if self.cached:
+            data["cached"] = True
+        if self.timing is not None:
+            data["timing"] = self.timing.as_dict()
         return data
 
 
-def _distribution_version(distribution: str) -> str | None:
-    try:
-        return importlib.metadata.version(distribution)
-    except importlib.metadata.PackageNotFoundError:
-        return None
+DEFAULT_PROBE_TIMEOUT_S = 5.0
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    value: str | None
+    elapsed: float
+    timed_out: bool = False
+    cached: bool = False
+    started: float = 0.0
+    cpu: float = 0.0
+    thread_id: int | None = None
+    thread_name: str | None = None
+
+
+def _command_version(command: str, timeout: float = DEFAULT_PROBE_TIMEOUT_S) -> str | None:
+    """Return the first line of `<command> --version`, or None when not on PATH.
 
+    Raises `subprocess.TimeoutExpired` when the command does not answer in time.
+    """
 
-def _command_version(command: str) -> str | None:
     executable = shutil.which(command)
     if not executable:
         return None
@@ -48,111 +100,482 @@ def _command_version(command: str) -> str | None:
             check=False,
             capture_output=True,
             text=True,
-            timeout=5,
+            timeout=timeout,
         )
+    except subprocess.TimeoutExpired:
+        raise
     except Exception:
         return "available"
     text = (result.stdout or result.stderr).strip().splitlines()
     return text[0] if text else "available"
 
 
-def build_doctor_report(include_environment: bool = True) -> dict[str, object]:
-    """Return a doctor report without importing heavy local inference stacks."""
+def _which(command: str) -> str | None:
+    return shutil.which(command)
 
-    checks: list[Check] = []
 
-    python_version = ".".join(str(part) for part in sys.version_info[:3])
-    if sys.version_info >= (3, 10):
-        checks.append(Check("python", "ok", f"Python {python_version} satisfies >=3.10"))
-    else:
-        checks.append(Check("python", "error", f"Python {python_version} is below required >=3.10"))
+def _run_probes(
+    probes: dict[str, Callable[[float], str | None]], timeout: float
+) -> dict[str, ProbeResult]:
+    """Run external probes concurrently under one overall deadline.
 
-    installed_framework = _distribution_version("abstractframework")
-    if installed_framework in {None, __version__}:
-        status = "ok" if installed_framework == __version__ else "warn"
-        message = (
-            f"abstractframework {installed_framework} matches release profile"
-            if installed_framework
-            else "abstractframework distribution metadata is not installed"
+    Each probe receives the deadline as its own timeout. Probes that have not finished
+    when the deadline passes are reported as timed out; the report never waits on them.
+    """
+
+    started = time.perf_counter()
+
+    def _timed(probe: Callable[[float], str | None]) -> ProbeResult:
+        begin = time.perf_counter()
+        cpu_begin = time.thread_time()
+        timed_out = False
+        try:
+            value = probe(timeout)
+        except subprocess.TimeoutExpired:
+            value, timed_out = None, True
+        return ProbeResult(
+            value,
+            time.perf_counter() - begin,
+            timed_out=timed_out,
+            started=begin,
+            cpu=time.thread_time() - cpu_begin,
+            thread_id=threading.get_native_id(),
+            thread_name=threading.current_thread().name,
         )
-        checks.append(Check("abstractframework", status, message))
-    else:
-        checks.append(
-            Check(
-                "abstractframework",
-                "error",
-                f"abstractframework {installed_framework} does not match {__version__}",
+
+    pool = ThreadPoolExecutor(max_workers=max(1, len(probes)), thread_name_prefix="doctor-probe")
+    try:
+        futures = {name: pool.submit(_timed, probe) for name, probe in probes.items()}
+        wait(futures.values(), timeout=timeout)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    results: dict[str, ProbeResult] = {}
+    for name, future in futures.items():
+        if future.done() and not future.cancelled():
+            results[name] = future.result()
+        else:
+            results[name] = ProbeResult(
+                None, time.perf_counter() - started, timed_out=True, started=started
             )
-        )
+    return results
 
-    for package_id, expected in RELEASE_VERSIONS.items():
-        distribution = PACKAGE_DISTRIBUTIONS[package_id]
-        actual = _distribution_version(distribution)
-        if actual is None:
+
+def _run_cached_probes(
+    probes: dict[str, Callable[[float], str | None]],
+    timeout: float,
+    cache: ProbeCache | None,
+    cacheable: set[str],
+) -> dict[str, ProbeResult]:
+    """Serve `cacheable` command probes from `cache` and run only the misses.
+
+    Cache keys are the resolved executable path plus its mtime and size, so replacing
+    or upgrading node/npm invalidates the entry. Timeouts are never cached.
+    """
+
+    results: dict[str, ProbeResult] = {}
+    keys: dict[str, str] = {}
+    if cache is not None:
+        for name in cacheable & set(probes):
+            executable = _which(name)
+            identity = executable_key(executable) if executable else None
+            if identity is None:
+                continue
+            keys[name] = f"command:{name}:{identity}"
+            value = cache.get(keys[name])
+            if isinstance(value, str):
+                results[name] = ProbeResult(value, 0.0, cached=True)
+
+    pending = {name: probe for name, probe in probes.items() if name not in results}
+    if pending:
+        results.update(_run_probes(pending, timeout))
+
+    if cache is not None:
+        for name, key in keys.items():
+            result = results[name]
+            if not result.cached and not result.timed_out and result.value is not None:
+                cache.put(key, result.value)
+    return results
+
+
+def _probe_timeout_check(check_id: str, label: str, result: ProbeResult) -> Check:
+    return Check(
+        check_id,
+        "warn",
+        f"{label} probe timed out after {result.elapsed:.1f}s",
+        "Raise --probe-timeout if this host is slow to answer",
+    )
+
+
+def build_doctor_report(
+    include_environment: bool = True,
+    probe_timeout: float = DEFAULT_PROBE_TIMEOUT_S,
+    cache: ProbeCache | None = None,
+    recorder: TimingRecorder | None = None,
+    deps: bool = False,
+    profile: str | None = None,
+    capacity: bool = False,
+) -> dict[str, object]:
+    """Return a doctor report without importing heavy local inference stacks.
+
+    External probes (node, npm, nvidia-smi) run concurrently and share one
+    `probe_timeout` deadline in seconds. With a `cache`, the distribution scan and
+    node/npm versions are reused while their inputs are unchanged; checks served
+    from the cache are marked `cached` in the report.
+
+    Every check carries the wall-clock and CPU time spent on it, and the report a
+    total. Pass a `recorder` to keep the underlying spans, e.g. for a Chrome trace.
+
+    With `deps`, the `Requires-Dist` of every installed distribution (plus the
+    `pip_requirements` of install `profile`, if given) is checked against what is
+    installed; the structured result is added as `deps`. With `capacity`, CPU, memory,
+    cgroup limits, and disk read throughput are measured and a profile is recommended
+    (`capacity` in the report).
+    """
+
+    recorder = recorder if recorder is not None else TimingRecorder()
+    report_started = time.perf_counter()
+    report_cpu_started = time.process_time()
+    checks: list[Check] = []
+
+    with recorder.measure("python"):
+        python_version = ".".join(str(part) for part in sys.version_info[:3])
+        if sys.version_info >= (3, 10):
+            checks.append(Check("python", "ok", f"Python {python_version} satisfies >=3.10"))
+        else:
             checks.append(
-                Check(
-                    f"package:{package_id}",
-                    "error",
-                    f"{distribution} is not installed",
-                    f"Expected {distribution}=={expected}",
-                )
+                Check("python", "error", f"Python {python_version} is below required >=3.10")
+            )
+
+    # One scan of sys.path serves every distribution check below; with a cache the scan
+    # is skipped entirely while no sys.path directory has changed.
+    with recorder.measure("distributions", "scan"):
+        distributions_key = f"distributions:{paths_fingerprint(sys.path)}"
+        cached_distributions = cache.get(distributions_key) if cache is not None else None
+        distributions_cached = isinstance(cached_distributions, dict)
+        if distributions_cached:
+            distributions = cached_distributions
+        else:
+            distributions = scan_distributions()
+            if cache is not None:
+                cache.put(distributions_key, distributions)
+
+    with recorder.measure("abstractframework"):
+        installed_framework = lookup_version(distributions, "abstractframework")
+        if installed_framework in {None, __version__}:
+            status = "ok" if installed_framework == __version__ else "warn"
+            message = (
+                f"abstractframework {installed_framework} matches release profile"
+                if installed_framework
+                else "abstractframework distribution metadata is not installed"
+            )
+            checks.append(
+                Check("abstractframework", status, message, cached=distributions_cached)
             )
-        elif actual == expected:
-            checks.append(Check(f"package:{package_id}", "ok", f"{distribution}=={actual}"))
         else:
             checks.append(
                 Check(
-                    f"package:{package_id}",
+                    "abstractframework",
                     "error",
-                    f"{distribution}=={actual} does not match pinned {expected}",
+                    f"abstractframework {installed_framework} does not match {__version__}",
+                    cached=distributions_cached,
                 )
             )
 
-    if include_environment:
-        node_version = _command_version("node")
-        npm_version = _command_version("npm")
-        if node_version:
-            checks.append(Check("node", "ok", f"Node is available: {node_version}"))
-        else:
-            checks.append(Check("node", "warn", "Node is not available; browser UIs need Node/npm"))
-        if npm_version:
-            checks.append(Check("npm", "ok", f"npm is available: {npm_version}"))
-        else:
-            checks.append(Check("npm", "warn", "npm is not available; browser UIs need npm/npx"))
+    for package_id, expected in RELEASE_VERSIONS.items():
+        with recorder.measure(f"package:{package_id}"):
+            distribution = PACKAGE_DISTRIBUTIONS[package_id]
+            actual = lookup_version(distributions, distribution)
+            if actual is None:
+                checks.append(
+                    Check(
+                        f"package:{package_id}",
+                        "error",
+                        f"{distribution} is not installed",
+                        f"Expected {distribution}=={expected}",
+                        cached=distributions_cached,
+                    )
+                )
+            elif actual == expected:
+                checks.append(
+                    Check(
+                        f"package:{package_id}",
+                        "ok",
+                        f"{distribution}=={actual}",
+                        cached=distributions_cached,
+                    )
+                )
+            else:
+                checks.append(
+                    Check(
+                        f"package:{package_id}",
+                        "error",
+                        f"{distribution}=={actual} does not match pinned {expected}",
+                        cached=distributions_cached,
+                    )
+                )
 
-        system = platform.system()
-        machine = platform.machine().lower()
-        if system == "Darwin" and machine in {"arm64", "aarch64"}:
-            checks.append(Check("hardware:apple", "ok", "Apple Silicon local profile can be used"))
-        elif system == "Darwin":
-            checks.append(
-                Check("hardware:apple", "warn", "Apple local profile expects Apple Silicon")
-            )
-        else:
-            checks.append(Check("hardware:apple", "warn", "Apple local profile is macOS-only"))
+    # The install profiles feed both the `--profile` roots and the capacity verdicts.
+    install_profiles = (
+        build_install_manifest()["profiles"] if capacity or (deps and profile) else []
+    )
 
-        if shutil.which("nvidia-smi"):
-            checks.append(Check("hardware:gpu", "ok", "nvidia-smi is available"))
-        else:
+    dependency_report: dict[str, object] | None = None
+    if deps:
+        with recorder.measure("deps"):
+            dependency_report, deps_cached = _dependency_report(profile, cache, install_profiles)
+            checks.extend(_dependency_checks(dependency_report, deps_cached))
+
+    capacity_report: dict[str, object] | None = None
+    if capacity:
+        with recorder.measure("capacity"):
+            # Only needed here; the probe reads /proc and /sys and samples the disk.
+            from .capacity import probe_capacity, recommend_profile
+
+            capacity_report = probe_capacity(disk_dir=user_cache_dir())
+            recommendation = recommend_profile(capacity_report, install_profiles)
+            capacity_report["recommendation"] = recommendation
             checks.append(
                 Check(
-                    "hardware:gpu",
-                    "warn",
-                    "No nvidia-smi found; GPU profile may still work with another supported stack",
+                    "capacity",
+                    "ok",
+                    f"Recommended install profile: {recommendation['profile']}",
+                    "; ".join(recommendation["reasoning"]),
                 )
             )
 
+    # Probe spans are named after the check they feed, so a check's timing covers both
+    # the probe (on its worker thread) and the evaluation below.
+    probe_checks = {"node": "node", "npm": "npm", "nvidia-smi": "hardware:gpu"}
+    if include_environment:
+        with recorder.measure("probes", "phase"):
+            probes = _run_cached_probes(
+                {
+                    "node": lambda timeout: _command_version("node", timeout),
+                    "npm": lambda timeout: _command_version("npm", timeout),
+                    "nvidia-smi": lambda timeout: _which("nvidia-smi"),
+                },
+                probe_timeout,
+                cache,
+                cacheable={"node", "npm"},
+            )
+        for name, result in probes.items():
+            if not result.cached:
+                recorder.add(
+                    probe_checks[name],
+                    "probe",
+                    result.started,
+                    result.elapsed,
+                    result.cpu,
+                    thread_id=result.thread_id,
+                    thread_name=result.thread_name,
+                    probe=name,
+                    timed_out=result.timed_out,
+                )
+
+        with recorder.measure("node"):
+            node = probes["node"]
+            if node.timed_out:
+                checks.append(_probe_timeout_check("node", "Node", node))
+            elif node.value:
+                checks.append(
+                    Check("node", "ok", f"Node is available: {node.value}", cached=node.cached)
+                )
+            else:
+                checks.append(
+                    Check("node", "warn", "Node is not available; browser UIs need Node/npm")
+                )
+        with recorder.measure("npm"):
+            npm = probes["npm"]
+            if npm.timed_out:
+                checks.append(_probe_timeout_check("npm", "npm", npm))
+            elif npm.value:
+                checks.append(
+                    Check("npm", "ok", f"npm is available: {npm.value}", cached=npm.cached)
+                )
+            else:
+                checks.append(
+                    Check("npm", "warn", "npm is not available; browser UIs need npm/npx")
+                )
+        # Warming needs Node/npm; their own checks already report them missing.
+        if node.value and npm.value:
+            with recorder.measure("npm:warm"):
+                checks.append(_npm_warm_check())
+
+        with recorder.measure("hardware:apple"):
+            system = platform.system()
+            machine = platform.machine().lower()
+            if system == "Darwin" and machine in {"arm64", "aarch64"}:
+                checks.append(
+                    Check("hardware:apple", "ok", "Apple Silicon local profile can be used")
+                )
+            elif system == "Darwin":
+                checks.append(
+                    Check("hardware:apple", "warn", "Apple local profile expects Apple Silicon")
+                )
+            else:
+                checks.append(Check("hardware:apple", "warn", "Apple local profile is macOS-only"))
+
+        with recorder.measure("hardware:gpu"):
+            nvidia_smi = probes["nvidia-smi"]
+            if nvidia_smi.timed_out:
+                checks.append(_probe_timeout_check("hardware:gpu", "nvidia-smi", nvidia_smi))
+            elif nvidia_smi.value:
+                checks.append(Check("hardware:gpu", "ok", "nvidia-smi is available"))
+            else:
+                checks.append(
+                    Check(
+                        "hardware:gpu",
+                        "warn",
+                        "No nvidia-smi found; GPU profile may still work with another "
+                        "supported stack",
+                    )
+                )
+
+    if cache is not None:
+        with recorder.measure("cache:save", "phase"):
+            cache.save()
+
+    checks = [replace(check, timing=recorder.timing(check.id)) for check in checks]
+    total = recorder.add(
+        "doctor",
+        "report",
+        report_started,
+        time.perf_counter() - report_started,
+        time.process_time() - report_cpu_started,
+    )
+
     status_rank = {"error": 2, "warn": 1, "ok": 0}
     worst = max((status_rank[check.status] for check in checks), default=0)
     status = "error" if worst == 2 else "warn" if worst == 1 else "ok"
-    return {
+    check_ids = {check.id for check in checks}
+    report: dict[str, object] = {
         "abstractframework": __version__,
         "status": status,
         "checks": [check.as_dict() for check in checks],
+        "timing": {
+            "wall_ms": total.as_dict()["wall_ms"],
+            "cpu_ms": total.as_dict()["cpu_ms"],
+            "phases": {
+                span.name: span.as_dict()
+                for span in recorder.spans
+                if span.category in {"scan", "phase"} and span.name not in check_ids
+            },
+        },
     }
+    if dependency_report is not None:
+        report["deps"] = dependency_report
+    if capacity_report is not None:
+        report["capacity"] = capacity_report
+    return report
+
+
+def _npm_warm_check() -> Check:
+    """Check that the `npm warm` prefix holds the pinned npm apps launch will run.
 
+    Warming is optional (launch falls back to npx), so only a stale or partially warmed
+    prefix is a warning.
+    """
 
-def _print_doctor(report: dict[str, object]) -> None:
+    status = warm_status()
+    remedy = "Run `abstractframework npm warm`; until then UIs start through npx"
+    stale = [
+        f"{package} {entry['version']} (pinned {entry['pinned']})"
+        for package, entry in status.items()
+        if entry["status"] == "stale"
+    ]
+    missing = [package for package, entry in status.items() if entry["status"] == "missing"]
+    if stale:
+        return Check(
+            "npm:warm", "warn", f"Warmed npm apps do not match the pins: {', '.join(stale)}", remedy
+        )
+    if len(missing) == len(status):
+        return Check(
+            "npm:warm",
+            "ok",
+            "npm apps are not pre-warmed; UIs start through npx",
+            "Run `abstractframework npm warm` to skip npx fetches on launch",
+        )
+    if missing:
+        message = f"npm apps missing from the warm prefix: {', '.join(missing)}"
+        return Check("npm:warm", "warn", message, remedy)
+    versions = ", ".join(f"{package} {entry['version']}" for package, entry in status.items())
+    return Check("npm:warm", "ok", f"npm apps are pre-warmed: {versions}", str(warm_prefix()))
+
+
+def _dependency_report(
+    profile: str | None,
+    cache: ProbeCache | None,
+    install_profiles: Sequence[dict[str, Any]] = (),
+) -> tuple[dict[str, object], bool]:
+    """Return the dependency check result and whether it was served from `cache`.
+
+    Results are keyed on the interpreter and the `sys.path` fingerprint, so installing
+    or removing anything invalidates them.
+    """
+
+    key = f"deps:{profile or ''}:{sys.executable}:{paths_fingerprint(sys.path)}"
+    cached = cache.get(key) if cache is not None else None
+    if isinstance(cached, dict):
+        return cached, True
+
+    # packaging is only needed here; keep it off the default doctor path.
+    from .deps import check_dependencies
+
+    roots: list[str] = []
+    if profile is not None:
+        profiles = {entry["id"]: entry for entry in install_profiles}
+        roots = profiles[profile]["pip_requirements"]
+    result = check_dependencies(roots=roots, root_name=f"profile:{profile}")
+    result["profile"] = profile
+    if cache is not None:
+        cache.put(key, result)
+    return result, False
+
+
+def _dependency_checks(result: dict[str, object], cached: bool) -> list[Check]:
+    problems: list[dict[str, str]] = result["problems"]  # type: ignore[assignment]
+    # One check per distribution, so check ids stay unique when it has several problems.
+    by_requirer: dict[str, list[dict[str, str]]] = {}
+    for problem in problems:
+        by_requirer.setdefault(normalize_name(problem["requirer"]), []).append(problem)
+    checks = []
+    for requirer, group in by_requirer.items():
+        status = "warn" if all(problem["kind"] == "invalid" for problem in group) else "error"
+        label = "Requirement" if len(group) == 1 else "Requirements"
+        checks.append(
+            Check(
+                f"deps:{requirer}",
+                status,
+                "; ".join(problem["message"] for problem in group),
+                f"{label}: " + " | ".join(problem["requirement"] for problem in group),
+                cached=cached,
+            )
+        )
+    if not checks:
+        checks.append(
+            Check(
+                "deps",
+                "ok",
+                f"{result['requirements']} requirements of {result['distributions']} "
+                "distributions are satisfied",
+                cached=cached,
+            )
+        )
+    if result["evaluator"] != "packaging":
+        checks.append(
+            Check(
+                "deps:evaluator",
+                "warn",
+                "packaging is not installed; version specifiers and markers were not evaluated",
+                "Only missing distributions are reported",
+                cached=cached,
+            )
+        )
+    return checks
+
+
+def _print_doctor(report: dict[str, object], timings: bool = False) -> None:
     print(f"AbstractFramework doctor ({report['status']})")
     print("=" * 40)
     for raw in report["checks"]:  # type: ignore[index]
@@ -161,31 +584,660 @@ def _print_doctor(report: dict[str, object]) -> None:
         print(f"[{marker}] {check['message']}")
         if check.get("detail"):
             print(f"       {check['detail']}")
+    if timings:
+        _print_timings(report)
+
+
+def _print_timings(report: dict[str, object]) -> None:
+    timing = report["timing"]  # type: ignore[index]
+    rows = [
+        (check["id"], check["timing"])  # type: ignore[index]
+        for check in report["checks"]  # type: ignore[union-attr]
+        if "timing" in check
+    ]
+    rows.extend((f"({name})", span) for name, span in timing["phases"].items())
+    rows.sort(key=lambda row: row[1]["wall_ms"], reverse=True)
+    width = max([len(name) for name, _ in rows] + [len("total")])
+    print()
+    print(f"{'Timings':<{width}}  {'wall ms':>10}  {'cpu ms':>10}")
+    print("-" * (width + 24))
+    for name, span in rows:
+        print(f"{name:<{width}}  {span['wall_ms']:>10.2f}  {span['cpu_ms']:>10.2f}")
+    print("-" * (width + 24))
+    print(f"{'total':<{width}}  {timing['wall_ms']:>10.2f}  {timing['cpu_ms']:>10.2f}")
+
+
+def _print_capacity(capacity: dict[str, object]) -> None:
+    cpu = capacity["cpu"]  # type: ignore[index]
+    effective = capacity["effective"]  # type: ignore[index]
+    cgroup = capacity["cgroup"]  # type: ignore[index]
+    disk = capacity["disk"]  # type: ignore[index]
+    recommendation = capacity["recommendation"]  # type: ignore[index]
+    gib = 1024**3
+    print()
+    print("Capacity")
+    print("-" * 40)
+    print(
+        f"CPU:     {effective['cpus']} usable of {cpu['logical']} logical, "
+        f"{cpu['physical_cores'] or '?'} physical cores, {cpu['sockets'] or '?'} socket(s)"
+    )
+    print(f"SIMD:    {', '.join(cpu['simd']) or 'none detected'}")
+    memory = effective["memory_bytes"]
+    available = effective["available_memory_bytes"]
+    print(
+        f"Memory:  {memory / gib:.1f} GiB" if memory else "Memory:  unknown",
+        f"({available / gib:.1f} GiB available)" if available is not None else "",
+    )
+    if cgroup["version"]:
+        limit = cgroup["memory_limit_bytes"]
+        print(
+            f"cgroup:  v{cgroup['version']}, CPU limit {cgroup['cpu_limit'] or 'none'}, "
+            f"memory limit {f'{_mb(limit)} MB' if limit else 'none'}"
+        )
+    if disk and "read_mb_s" in disk:
+        print(f"Disk:    {disk['read_mb_s']} MB/s read ({disk['path']})")
+    elif disk:
+        print(f"Disk:    not sampled: {disk['error']}")
+    print(f"Profile: {recommendation['profile']}")
+    for line in recommendation["reasoning"]:
+        print(f"         - {line}")
+
+
+def _mb(value: object) -> str:
+    return f"{value / (1024 * 1024):.1f}" if isinstance(value, int) else "-"
+
+
+def _print_footprint(footprint: dict[str, object]) -> None:
+    components = footprint["components"]  # type: ignore[index]
+    profiles = footprint["profiles"]  # type: ignore[index]
+    print()
+    print("Footprint (MB; closure = the component plus everything it requires)")
+    print("-" * 40)
+    if not components:
+        print("No AbstractFramework components are installed")
+    else:
+        width = max(len(component["component"]) for component in components)
+        row = "{:<%d}  {:>8}  {:>8}  {:>12}  {:>10}  {:>10}" % width
+        print(row.format("", "own MB", "dists", "closure MB", "files", "import MB"))
+        for component in components:
+            print(
+                row.format(
+                    component["component"],
+                    _mb(component["disk_bytes"]),
+                    len(component["closure"]),
+                    _mb(component["closure_disk_bytes"]),
+                    component["closure_files"],
+                    _mb(component["import_rss_bytes"]),
+                )
+            )
+    print()
+    row = "{:<8}  {:>8}  {:>10}  {:>10}  {:>10}  {:>8}"
+    print(row.format("profile", "dists", "disk MB", "files", "import MB", "missing"))
+    for profile in profiles:
+        if not profile["resolved"]:
+            print(f"{profile['id']:<8}  not measured: {profile['reason']}")
+            continue
+        print(
+            row.format(
+                profile["id"],
+                profile["distributions"],
+                _mb(profile["disk_bytes"]),
+                profile["files"],
+                _mb(profile["import_rss_bytes"]),
+                len(profile["missing"]),
+            )
+        )
 
 
 def _doctor(args: argparse.Namespace) -> int:
-    report = build_doctor_report(include_environment=not args.no_environment)
+    cache = None if args.no_cache else ProbeCache(ttl=args.cache_ttl, refresh=args.refresh)
+    recorder = TimingRecorder()
+    report = build_doctor_report(
+        include_environment=not args.no_environment,
+        probe_timeout=args.probe_timeout,
+        cache=cache,
+        recorder=recorder,
+        deps=args.deps or args.profile is not None,
+        profile=args.profile,
+        capacity=args.capacity,
+    )
+    if args.footprint:
+        # importlib.metadata and packaging are only needed here; keep them off CLI start-up.
+        from .footprint import build_footprint_report
+
+        with recorder.measure("footprint", "phase"):
+            report["footprint"] = build_footprint_report()
+    if args.trace:
+        recorder.write_chrome_trace(
+            args.trace, abstractframework=__version__, status=report["status"]
+        )
     if args.json:
         print(json.dumps(report, indent=2, sort_keys=True))
     else:
-        _print_doctor(report)
+        _print_doctor(report, timings=args.timings)
+        if args.capacity:
+            _print_capacity(report["capacity"])  # type: ignore[arg-type]
+        if args.footprint:
+            _print_footprint(report["footprint"])  # type: ignore[arg-type]
+        if args.trace:
+            print(f"Wrote trace to {args.trace}")
     return 1 if report["status"] == "error" else 0
 
 
+def _manifest_lock(args: argparse.Namespace) -> int:
+    # pip is driven in a subprocess; keep the lock machinery off CLI start-up.
+    from .locks import LockError, lock_target, write_lock
+
+    try:
+        target = lock_target(args.python_version, args.platform or ())
+    except LockError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 2
+    for profile_id in args.lock:
+        try:
+            entry = write_lock(
+                args.lock_dir,
+                profile_id,
+                find_links=args.find_links,
+                index_url=args.index_url,
+                target=target,
+            )
+        except (LockError, OSError) as exc:
+            print(f"ERROR: {exc}", file=sys.stderr)
+            return 2
+        print(
+            f"Wrote {args.lock_dir / entry['path']} "
+            f"({entry['distributions']} distributions, {entry['target']['tag']})"
+        )
+    return 0
+
+
 def _manifest(args: argparse.Namespace) -> int:
+    if args.lock:
+        return _manifest_lock(args)
     if args.write:
         write_install_manifest(args.write)
-        print(f"Wrote {args.write}")
+        print(f"Wrote {args.write} and {digest_path(args.write)}")
         return 0
     if args.check:
         ok, message = check_install_manifest(args.check)
         print(message)
         return 0 if ok else 1
+    if args.digest:
+        print(manifest_digest())
+        return 0
+    if args.diff:
+        try:
+            old = json.loads(args.diff.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            print(f"Cannot read manifest {args.diff}: {exc}", file=sys.stderr)
+            return 2
+        if not isinstance(old, dict):
+            print(f"Cannot read manifest {args.diff}: not a JSON object", file=sys.stderr)
+            return 2
+        print(json.dumps(diff_install_manifest(old), indent=2, sort_keys=True))
+        return 0
     print(manifest_json(), end="")
     return 0
 
 
+def _print_import_profiles(profiles: list[ImportProfile]) -> None:
+    def _ms(value: float | None) -> str:
+        return f"{value:.1f}" if value is not None else "-"
+
+    width = max([len(profile.component) for profile in profiles] + [len("component")])
+    row = "{:<%d}  {:<7}  {:>10}  {:>8}  {:>8}" % width
+    print(row.format("component", "status", "import ms", "self ms", "peak MB"))
+    print("-" * (width + 43))
+    for profile in profiles:
+        print(
+            row.format(
+                profile.component,
+                profile.status,
+                _ms(profile.cumulative_ms),
+                _ms(profile.self_ms),
+                _ms(profile.peak_rss_mb),
+            )
+        )
+    for profile in profiles:
+        if profile.status in {"error", "timeout"}:
+            print(f"\n{profile.component} ({profile.status}): {profile.error}")
+        offenders = profile.offenders()
+        if profile.status != "ok" or not offenders:
+            continue
+        print(f"\n{profile.component}: top imports by self time")
+        for node in offenders:
+            print(
+                f"  {node.self_us / 1000:>8.1f} ms self  {node.cumulative_us / 1000:>8.1f} ms cum"
+                f"  {node.module}"
+            )
+
+
+def _profile_imports(args: argparse.Namespace) -> int:
+    components = args.components or list(PACKAGE_DISTRIBUTIONS)
+    unknown = [component for component in components if component not in PACKAGE_DISTRIBUTIONS]
+    if unknown:
+        print(f"Unknown component(s): {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    try:
+        budget = load_budget(args.budget) if args.budget else None
+    except (OSError, ValueError) as exc:
+        print(f"Cannot read budget file: {exc}", file=sys.stderr)
+        return 2
+
+    profiles = profile_imports(components, timeout=args.timeout, top=args.top)
+    violations = check_budget(profiles, budget) if budget is not None else []
+    if args.json:
+        payload: dict[str, object] = {
+            "python": platform.python_version(),
+            "components": [profile.as_dict(include_tree=args.tree) for profile in profiles],
+        }
+        if budget is not None:
+            payload["budget_violations"] = violations
+        print(json.dumps(payload, indent=2, sort_keys=True))
+    else:
+        _print_import_profiles(profiles)
+        if budget is not None:
+            print()
+            if violations:
+                print("Import budget exceeded:")
+                for violation in violations:
+                    print(f"  {violation}")
+            else:
+                print("All components are within the import budget")
+    return 1 if violations else 0
+
+
+def _print_build_result(result: BuildResult) -> None:
+    marker = {"ok": "OK", "skipped": "SKIPPED", "failed": "FAILED", "blocked": "BLOCKED"}[
+        result.status
+    ]
+    timing = f"{result.elapsed:6.1f}s" if result.status in {"ok", "failed"} else "      -"
+    line = f"[{marker}] {timing}  {result.name}"
+    if result.detail:
+        line += f"  ({result.detail})"
+    print(line, flush=True)
+
+
+def _workspace_build(args: argparse.Namespace) -> int:
+    try:
+        summary = build_workspace(
+            args.root,
+            args.profile,
+            jobs=args.jobs,
+            python=not args.npm_only,
+            npm=not args.python_only,
+            log_dir=args.log_dir,
+            on_result=None if args.json else _print_build_result,
+            force=args.force,
+        )
+    except WorkspaceError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 2
+    if args.json:
+        print(json.dumps(summary.as_dict(), indent=2, sort_keys=True))
+        return 0 if summary.ok else 1
+
+    for warning in summary.warnings:
+        print(f"WARNING: {warning}")
+    print()
+    width = max([len(result.name) for result in summary.results] + [len("package")])
+    print(f"{'package':<{width}}  {'status':<8}  {'start s':>8}  {'took s':>8}")
+    print("-" * (width + 30))
+    for result in summary.results:
+        ran = result.status in {"ok", "failed"}
+        started = f"{result.started:.1f}" if ran else "-"
+        took = f"{result.elapsed:.1f}" if ran else "-"
+        print(f"{result.name:<{width}}  {result.status:<8}  {started:>8}  {took:>8}")
+    print("-" * (width + 30))
+    serial = sum(result.elapsed for result in summary.results)
+    print(f"Wall time {summary.elapsed:.1f}s (sequential sum {serial:.1f}s)")
+    failed = [result for result in summary.results if result.status == "failed"]
+    for result in failed:
+        print(f"\n{result.name} failed; log: {result.log}")
+        if result.log is not None and result.log.exists():
+            for line in result.log.read_text(encoding="utf-8", errors="replace").splitlines()[-15:]:
+                print(f"  {line}")
+    return 0 if summary.ok else 1
+
+
+_ANSI = {"bold": "1", "dim": "2", "red": "31", "green": "32", "yellow": "33", "cyan": "36"}
+
+
+def _paint(text: str, styles: str, color: bool) -> str:
+    """Wrap `text` in the ANSI codes for space-separated `styles` when `color` is on."""
+
+    if not color:
+        return text
+    codes = ";".join(_ANSI[style] for style in styles.split())
+    return f"\033[{codes}m{text}\033[0m"
+
+
+def _status_line(status: RepoStatus, color: bool = False) -> list[str]:
+    if not status.cloned:
+        return [f"  {_paint(f'{status.name:<24}  (not cloned)', 'dim', color)}"]
+    details = [
+        _paint(text, style, color)
+        for count, text, style in (
+            (status.staged, f"{status.staged} staged", "green"),
+            (status.unstaged, f"{status.unstaged} modified", "red"),
+            (status.untracked, f"{status.untracked} untracked", "red"),
+            (status.ahead, f"↑{status.ahead} unpushed", "yellow"),
+            (status.behind, f"↓{status.behind} behind", "yellow"),
+        )
+        if count
+    ]
+    if status.error:
+        details.append(_paint(f"error: {status.error}", "red", color))
+    summary = ", ".join(details) if details else _paint("✓ clean", "green", color)
+    name_style = "bold yellow" if status.has_changes else "bold green"
+    name = _paint(f"{status.name:<24}", name_style, color)
+    lines = [f"  {name}  {_paint(status.branch or '', 'cyan', color)}  {summary}"]
+    lines.extend(f"      {_paint(commit, 'dim', color)}" for commit in status.unpushed)
+    return lines
+
+
+def _workspace_status(args: argparse.Namespace) -> int:
+    groups = workspace_status(args.root, jobs=args.jobs)
+    total = sum(len(statuses) for _, statuses in groups)
+    dirty = sum(status.has_changes for _, statuses in groups for status in statuses)
+
+    def _shown(status: RepoStatus) -> bool:
+        return not args.short or (status.cloned and status.has_changes)
+
+    if args.json:
+        payload = {
+            "root": str(args.root.resolve()),
+            "total": total,
+            "dirty": dirty,
+            "groups": [
+                {
+                    "title": title,
+                    "repos": [status.as_dict() for status in statuses if _shown(status)],
+                }
+                for title, statuses in groups
+            ],
+        }
+        print(json.dumps(payload, indent=2, ensure_ascii=False))
+        return 0
+
+    color = args.color == "always" or (args.color == "auto" and sys.stdout.isatty())
+    for title, statuses in groups:
+        shown = [status for status in statuses if _shown(status)]
+        if not shown:
+            continue
+        print(f"  {_paint(title, 'bold', color)}")
+        print(f"  {'─' * 56}\n")
+        for status in shown:
+            print("\n".join(_status_line(status, color)))
+        print()
+    print("=" * 60)
+    if dirty == 0:
+        print(f"  {_paint(f'All {total} repositories are clean.', 'bold green', color)}")
+    else:
+        print(
+            f"  {_paint(f'{total} repos scanned:', 'bold', color)}  "
+            f"{_paint(f'{total - dirty} clean', 'green', color)}, "
+            f"{_paint(f'{dirty} with pending work', 'yellow', color)}"
+        )
+    print("=" * 60)
+    return 0
+
+
+def _print_launch(launch: Launch) -> None:
+    width = max([len(report.name) for report in launch.reports.values()] + [len("service")])
+    print(f"{'service':<{width}}  {'status':<8}  {'spawn ms':>8}  {'ready s':>8}  stages")
+    print("-" * (width + 60))
+    for report in launch.reports.values():
+        ready = f"{report.ready_at:.3f}" if report.ready_at is not None else "-"
+        stages = ", ".join(
+            f"{stage.label} {stage.ready_at:.3f}s ({stage.attempts} probes)"
+            for stage in report.stages
+        )
+        if report.detail:
+            stages = f"{stages}; {report.detail}" if stages else report.detail
+        print(
+            f"{report.name:<{width}}  {report.status:<8}  {report.spawn * 1000:>8.1f}  "
+            f"{ready:>8}  {stages}"
+        )
+    if launch.ready:
+        print(f"\nAll services ready in {launch.elapsed:.3f}s")
+
+
+def _launch(args: argparse.Namespace) -> int:
+    from .launch import (
+        DEFAULT_SERVICES,
+        LaunchError,
+        connect_host,
+        default_services,
+        launch_services,
+        log_tail,
+        resolve_token,
+        wait_for_exit,
+    )
+
+    runtime_dir = args.runtime_dir.resolve()
+    ports = {"gateway": args.gateway_port, "flow": args.flow_port, "observer": args.observer_port}
+    try:
+        services = default_services(
+            args.services or DEFAULT_SERVICES,
+            host=args.host,
+            ports=ports,
+            token=resolve_token(runtime_dir),
+            data_dir=runtime_dir,
+        )
+    except LaunchError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 2
+    if not args.json:
+        names = ", ".join(service.name for service in services)
+        print(f"Starting {names} (logs: {args.log_dir or runtime_dir / 'logs'})")
+    launch = launch_services(services, args.log_dir or runtime_dir / "logs", args.timeout)
+    if args.json:
+        print(json.dumps(launch.as_dict(), indent=2), flush=True)
+    else:
+        print()
+        _print_launch(launch)
+    if not launch.ready:
+        for report in launch.reports.values():
+            if report.status not in {"ready", "aborted"}:
+                print(f"\n{report.name} is {report.status}; last log lines:", file=sys.stderr)
+                for line in log_tail(report.log):
+                    print(f"  {line}", file=sys.stderr)
+        return 1
+    if args.until_ready:
+        launch.stop()
+        return 0
+
+    if not args.json:
+        for service in services:
+            url = f"http://{connect_host(service.host)}:{service.port}"
+            print(f"{service.name.capitalize():<9} {url}")
+        print("\nPress Ctrl-C to stop all services.", flush=True)
+    try:
+        name = wait_for_exit(launch)
+    finally:
+        launch.stop()
+    if name is None:
+        return 0
+    report = launch.reports[name]
+    print(f"\n{name} exited; last log lines:", file=sys.stderr)
+    for line in log_tail(report.log):
+        print(f"  {line}", file=sys.stderr)
+    return 1
+
+
+def _docs_list(args: argparse.Namespace) -> int:
+    from .llms_full import LlmsFull, LlmsFullError
+
+    try:
+        docs = LlmsFull(args.file)
+    except LlmsFullError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 2
+    if args.json:
+        payload = [section.as_dict() for section in docs.sections.values()]
+        print(json.dumps(payload, indent=2))
+        return 0
+    for section in docs.sections.values():
+        print(f"{section.length / 1024:8.1f} KB  {section.path}")
+    print(f"{len(docs.sections)} sections, {docs.size / 1024:.1f} KB in {docs.path}")
+    return 0
+
+
+def _docs_show(args: argparse.Namespace) -> int:
+    from .llms_full import LlmsFull, LlmsFullError
+
+    try:
+        with LlmsFull(args.file) as docs:
+            sections = docs.select(*args.patterns, verify=args.verify)
+    except (LlmsFullError, KeyError) as exc:
+        message = exc.args[0] if isinstance(exc, KeyError) else exc
+        print(f"ERROR: {message}", file=sys.stderr)
+        return 2
+    if args.json:
+        print(json.dumps(sections, indent=2, ensure_ascii=False))
+        return 0
+    for path, text in sections.items():
+        sys.stdout.write(f"--- {path} ---\n{text}")
+    return 0
+
+
+def _docs_pack(args: argparse.Namespace) -> int:
+    from .llms_full import LlmsFull, LlmsFullError
+
+    try:
+        with LlmsFull(args.file) as docs:
+            if args.name is None:
+                packs = [pack.as_dict() for pack in docs.packs.values()]
+                if args.json:
+                    print(json.dumps(packs, indent=2))
+                    return 0
+                for pack in packs:
+                    print(
+                        f"{pack['name']:>6}  ~{pack['tokens']:>7} / {pack['budget']:>7} tokens  "
+                        f"{len(pack['sections'])} sections"
+                    )
+                return 0
+            text = docs.pack(args.name, verify=args.verify)
+    except (LlmsFullError, KeyError) as exc:
+        message = exc.args[0] if isinstance(exc, KeyError) else exc
+        print(f"ERROR: {message}", file=sys.stderr)
+        return 2
+    if args.output is None:
+        sys.stdout.write(text)
+    else:
+        args.output.write_text(text, encoding="utf-8")
+        print(f"Wrote {args.output}")
+    return 0
+
+
+def _docs_search(args: argparse.Namespace) -> int:
+    from .docsearch import DocsSearch
+    from .llms_full import LlmsFullError
+
+    started = time.perf_counter()
+    try:
+        search = DocsSearch(args.file)
+        try:
+            hits = search.search(" ".join(args.query), limit=args.limit)
+        finally:
+            search.close()
+    except LlmsFullError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 2
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if args.json:
+        payload = {"query": " ".join(args.query), "elapsed_ms": round(elapsed_ms, 3)}
+        payload["hits"] = [hit.as_dict() for hit in hits]
+        print(json.dumps(payload, indent=2, ensure_ascii=False))
+        return 0 if hits else 1
+    for hit in hits:
+        print(f"{hit.score:7.2f}  {hit.path}:{hit.line}")
+        print(f"         {hit.snippet}")
+    print(f"{len(hits)} results in {elapsed_ms:.1f} ms")
+    return 0 if hits else 1
+
+
+def _bundle(args: argparse.Namespace) -> int:
+    # Bundling drives pip/npm in subprocesses; keep it off CLI start-up.
+    from .bundle import BundleError, build_bundle, install_bundle, pip_cache_wheels
+    from .locks import LockError, lock_target
+
+    if not args.profile:
+        print("ERROR: --profile is required", file=sys.stderr)
+        return 2
+    try:
+        if args.install is not None:
+            if len(args.profile) != 1:
+                print("ERROR: --install takes exactly one --profile", file=sys.stderr)
+                return 2
+            return install_bundle(args.install, args.profile[0], tag=args.tag)
+        wheel_dirs = list(args.wheel_dir or [])
+        if args.pip_cache:
+            cache = pip_cache_wheels()
+            if cache is not None:
+                wheel_dirs.append(cache)
+        manifest = build_bundle(
+            args.output,
+            args.profile,
+            wheel_dirs=wheel_dirs,
+            npm_dirs=args.npm_dir or [],
+            include_npm=not args.no_npm,
+            target=lock_target(args.python_version, args.platform or ()),
+        )
+    except (BundleError, LockError) as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 2
+    wheels = manifest["wheels"]
+    size = sum(wheel["size"] for wheel in wheels.values())
+    if args.json:
+        print(json.dumps(manifest, indent=2, sort_keys=True))
+        return 0
+    print(f"Bundle {args.output} ({', '.join(sorted(manifest['profiles']))})")
+    print(
+        f"  wheels: {len(wheels)} ({size / (1024 * 1024):.1f} MB, "
+        f"{manifest['reused_wheels']} already present)"
+    )
+    for profile_id, entries in sorted(manifest["profiles"].items()):
+        for entry in entries:
+            print(f"  {profile_id}: {entry['distributions']} wheels for {entry['target']['tag']}")
+    for package, entry in manifest["npm"].items():
+        print(f"  npm: {package}@{entry['version']}")
+        if entry["dependencies"]:
+            print(
+                f"    WARN: needs {len(entry['dependencies'])} npm dependencies "
+                "that are not in the bundle"
+            )
+    return 0
+
+
+def _npm_warm(args: argparse.Namespace) -> int:
+    prefix = args.prefix or warm_prefix()
+    started = time.perf_counter()
+    try:
+        record = warm_npm_apps(
+            args.prefix,
+            sources=args.sources or [],
+            offline=args.offline,
+            prune=not args.keep_old,
+        )
+    except NpmWarmError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 2
+    if args.json:
+        print(json.dumps({**record, "prefix": str(prefix)}, indent=2, sort_keys=True))
+        return 0
+    elapsed = time.perf_counter() - started
+    print(f"Warmed {len(record['apps'])} npm apps into {prefix} in {elapsed:.1f}s")
+    for package, app in record["apps"].items():
+        print(f"  {package}@{app['version']}: {app['bin']}")
+    return 0
+
+
 def main(argv: Sequence[str] | None = None) -> int:
+    # Built once for every subparser's `choices`; the manifest is not memoized.
+    profile_ids = [entry["id"] for entry in build_install_manifest()["profiles"]]
     parser = argparse.ArgumentParser(prog="abstractframework")
     subparsers = parser.add_subparsers(dest="command")
 
@@ -196,13 +1248,409 @@ def main(argv: Sequence[str] | None = None) -> int:
         action="store_true",
         help="Skip Node/npm/hardware probes and only check Python package profile consistency",
     )
+    doctor.add_argument(
+        "--probe-timeout",
+        type=float,
+        default=DEFAULT_PROBE_TIMEOUT_S,
+        metavar="SECONDS",
+        help=(
+            "Overall deadline for the concurrent Node/npm/hardware probes "
+            f"(default: {DEFAULT_PROBE_TIMEOUT_S:g})"
+        ),
+    )
+    cache_mode = doctor.add_mutually_exclusive_group()
+    cache_mode.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the on-disk probe cache",
+    )
+    cache_mode.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached probe results and re-probe, then update the cache",
+    )
+    doctor.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL_S,
+        metavar="SECONDS",
+        help=f"Maximum age of cached probe results (default: {DEFAULT_CACHE_TTL_S})",
+    )
+    doctor.add_argument(
+        "--footprint",
+        action="store_true",
+        help=(
+            "Measure disk size, file count, and import RSS of each installed component and "
+            "install profile (imports components in subprocesses; slow)"
+        ),
+    )
+    doctor.add_argument(
+        "--deps",
+        action="store_true",
+        help=(
+            "Check every installed distribution's requirements (markers, specifiers, extras) "
+            "against the environment, like a fast `pip check`"
+        ),
+    )
+    doctor.add_argument(
+        "--profile",
+        choices=profile_ids,
+        help="Also check the pip requirements of this install profile (implies --deps)",
+    )
+    doctor.add_argument(
+        "--capacity",
+        action="store_true",
+        help=(
+            "Measure CPU topology and SIMD flags, memory, cgroup limits, and disk read "
+            "throughput, and recommend an install profile"
+        ),
+    )
+    doctor.add_argument(
+        "--timings",
+        action="store_true",
+        help="Show wall-clock and CPU time per check (always included in --json output)",
+    )
+    doctor.add_argument(
+        "--trace",
+        type=Path,
+        metavar="PATH",
+        help="Write the run as Chrome trace-event JSON (chrome://tracing, Perfetto)",
+    )
     doctor.set_defaults(func=_doctor)
 
     manifest = subparsers.add_parser("manifest", help="Print or validate the install manifest")
     manifest.add_argument("--write", type=Path, help="Write the generated manifest to a path")
     manifest.add_argument("--check", type=Path, help="Check a manifest file against the generator")
+    manifest.add_argument(
+        "--digest",
+        action="store_true",
+        help="Print the sha256 content digest of the generated manifest (usable as an ETag)",
+    )
+    manifest.add_argument(
+        "--diff",
+        type=Path,
+        metavar="OLD_MANIFEST",
+        help="Print the JSON delta and per-profile upgrade commands from an older manifest",
+    )
+    lock = manifest.add_argument_group("lock files")
+    lock.add_argument(
+        "--lock",
+        action="append",
+        metavar="PROFILE",
+        choices=profile_ids,
+        help=(
+            "Resolve an install profile into a hash-pinned lock file and record it in the "
+            "lock index (repeatable)"
+        ),
+    )
+    lock.add_argument(
+        "--lock-dir",
+        type=Path,
+        default=Path("locks"),
+        metavar="DIR",
+        help="Directory for lock files and their index.json (default: ./locks)",
+    )
+    lock.add_argument(
+        "--find-links",
+        type=Path,
+        metavar="WHEEL_DIR",
+        help="Resolve against a local wheel directory (offline unless --index-url is given)",
+    )
+    lock.add_argument("--index-url", metavar="URL", help="Package index to resolve against")
+    lock.add_argument(
+        "--platform",
+        action="append",
+        metavar="TAG",
+        help="Target platform tag, e.g. manylinux2014_x86_64 (repeatable; default: this host)",
+    )
+    lock.add_argument(
+        "--python-version",
+        metavar="X.Y",
+        help="Target Python version (default: this interpreter)",
+    )
     manifest.set_defaults(func=_manifest)
 
+    profile = subparsers.add_parser(
+        "profile-imports",
+        help="Measure the import time and peak RSS of each pinned component",
+    )
+    profile.add_argument(
+        "components",
+        nargs="*",
+        metavar="COMPONENT",
+        help="Components to profile (default: every pinned component)",
+    )
+    profile.add_argument("--json", action="store_true", help="Emit machine-readable JSON")
+    profile.add_argument(
+        "--tree", action="store_true", help="Include the full import tree in --json output"
+    )
+    profile.add_argument(
+        "--top",
+        type=int,
+        default=DEFAULT_TOP_OFFENDERS,
+        metavar="N",
+        help=f"Number of slowest modules to list per component (default: {DEFAULT_TOP_OFFENDERS})",
+    )
+    profile.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_IMPORT_TIMEOUT_S,
+        metavar="SECONDS",
+        help=f"Per-component import deadline (default: {DEFAULT_IMPORT_TIMEOUT_S:g})",
+    )
+    profile.add_argument(
+        "--budget",
+        type=Path,
+        metavar="PATH",
+        help="JSON budget file; exit 1 when a component exceeds its import_ms/peak_rss_mb",
+    )
+    profile.set_defaults(func=_profile_imports)
+
+    launch = subparsers.add_parser(
+        "launch",
+        help="Start Gateway, Flow, and Observer concurrently and report time to ready",
+    )
+    launch.add_argument(
+        "services",
+        nargs="*",
+        metavar="SERVICE",
+        help="Services to start: gateway, flow, observer (default: all three)",
+    )
+    launch.add_argument(
+        "--host", default="0.0.0.0", help="Bind address for every service (default: 0.0.0.0)"
+    )
+    launch.add_argument("--gateway-port", type=int, default=8080)
+    launch.add_argument("--flow-port", type=int, default=3000)
+    launch.add_argument("--observer-port", type=int, default=3001)
+    launch.add_argument(
+        "--runtime-dir",
+        type=Path,
+        default=Path("runtime"),
+        help="Gateway data directory; logs go to its logs/ subdirectory (default: ./runtime)",
+    )
+    launch.add_argument("--log-dir", type=Path, help="Directory for per-service logs")
+    launch.add_argument(
+        "--timeout",
+        type=float,
+        default=90.0,
+        help="Seconds for every service to become ready (default: 90)",
+    )
+    launch.add_argument(
+        "--until-ready",
+        action="store_true",
+        help="Stop the services and exit 0 once all of them are ready",
+    )
+    launch.add_argument("--json", action="store_true", help="Print the readiness report as JSON")
+    launch.set_defaults(func=_launch)
+
+    bundle = subparsers.add_parser(
+        "bundle",
+        help="Build an offline wheelhouse bundle for install profiles, or install from one",
+    )
+    bundle.add_argument(
+        "--profile",
+        action="append",
+        choices=profile_ids,
+        help="Install profile to bundle (repeatable; wheels are shared across profiles)",
+    )
+    bundle.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=Path("abstractframework-bundle"),
+        help="Bundle directory, created or updated (default: ./abstractframework-bundle)",
+    )
+    bundle.add_argument(
+        "--wheel-dir",
+        action="append",
+        type=Path,
+        metavar="DIR",
+        help="Directory searched recursively for wheels (repeatable)",
+    )
+    bundle.add_argument(
+        "--pip-cache",
+        action="store_true",
+        help="Also take wheels from pip's cache of locally built wheels",
+    )
+    bundle.add_argument(
+        "--npm-dir",
+        action="append",
+        type=Path,
+        metavar="DIR",
+        help="Directory holding npm tarballs (default: `npm pack` from the npm cache)",
+    )
+    bundle.add_argument("--no-npm", action="store_true", help="Do not bundle the npm apps")
+    bundle.add_argument(
+        "--platform",
+        action="append",
+        metavar="TAG",
+        help="Target platform tag (repeatable; default: this host)",
+    )
+    bundle.add_argument("--python-version", metavar="X.Y", help="Target Python version")
+    bundle.add_argument(
+        "--install",
+        type=Path,
+        metavar="BUNDLE",
+        help="Verify BUNDLE and install --profile from it with no index lookups",
+    )
+    bundle.add_argument(
+        "--tag", help="Lock target to install, e.g. cp311-linux_x86_64 (default: this host)"
+    )
+    bundle.add_argument("--json", action="store_true", help="Print the bundle manifest as JSON")
+    bundle.set_defaults(func=_bundle)
+
+    npm = subparsers.add_parser("npm", help="Manage the local installs of the pinned npm apps")
+    npm_commands = npm.add_subparsers(dest="npm_command")
+    npm_warm = npm_commands.add_parser(
+        "warm",
+        help="Install the pinned npm apps into a local prefix so launches skip npx fetches",
+    )
+    npm_warm.add_argument(
+        "--from",
+        dest="sources",
+        action="append",
+        type=Path,
+        metavar="DIR",
+        help="Directory of `npm pack` tarballs to install from, e.g. a bundle's npm/ (repeatable)",
+    )
+    npm_warm.add_argument(
+        "--prefix",
+        type=Path,
+        help="Install prefix (default: a per-pins directory under the user cache)",
+    )
+    npm_warm.add_argument(
+        "--offline", action="store_true", help="Install from tarballs and the npm cache only"
+    )
+    npm_warm.add_argument(
+        "--keep-old", action="store_true", help="Keep prefixes warmed for earlier pins"
+    )
+    npm_warm.add_argument("--json", action="store_true", help="Print the warm record as JSON")
+    npm_warm.set_defaults(func=_npm_warm)
+    npm.set_defaults(func=lambda args: npm.print_help() or 0)
+
+    docs = subparsers.add_parser(
+        "docs", help="Read sections of llms-full.txt through its offset index"
+    )
+    docs_commands = docs.add_subparsers(dest="docs_command")
+    docs_file_help = (
+        "Generated llms-full.txt (default: $ABSTRACTFRAMEWORK_LLMS_FULL, else the packaged copy)"
+    )
+    docs_list = docs_commands.add_parser("list", help="List the sections and their sizes")
+    docs_list.add_argument("--file", type=Path, help=docs_file_help)
+    docs_list.add_argument("--json", action="store_true", help="Emit the index entries as JSON")
+    docs_list.set_defaults(func=_docs_list)
+    docs_show = docs_commands.add_parser(
+        "show", help="Print the sections matching paths or globs, reading only those bytes"
+    )
+    docs_show.add_argument(
+        "patterns", nargs="+", metavar="PATH", help="Section path or glob, e.g. 'docs/guide/*'"
+    )
+    docs_show.add_argument("--file", type=Path, help=docs_file_help)
+    docs_show.add_argument(
+        "--verify", action="store_true", help="Check each section against its index hash"
+    )
+    docs_show.add_argument("--json", action="store_true", help="Emit {path: text} as JSON")
+    docs_show.set_defaults(func=_docs_show)
+    docs_pack = docs_commands.add_parser(
+        "pack", help="Print a token-budgeted context pack, or list the packs"
+    )
+    docs_pack.add_argument("name", nargs="?", metavar="NAME", help="Pack name, e.g. 32k")
+    docs_pack.add_argument("--file", type=Path, help=docs_file_help)
+    docs_pack.add_argument("--output", "-o", type=Path, help="Write the pack to a file")
+    docs_pack.add_argument(
+        "--verify", action="store_true", help="Check each section against its index hash"
+    )
+    docs_pack.add_argument("--json", action="store_true", help="List the packs as JSON")
+    docs_pack.set_defaults(func=_docs_pack)
+    docs_search = docs_commands.add_parser(
+        "search", help="Rank sections for a query with the prebuilt BM25 index"
+    )
+    docs_search.add_argument("query", nargs="+", metavar="WORD", help="Query words")
+    docs_search.add_argument(
+        "--limit", "-n", type=int, default=10, help="Maximum results (default: 10)"
+    )
+    docs_search.add_argument("--file", type=Path, help=docs_file_help)
+    docs_search.add_argument("--json", action="store_true", help="Emit the hits as JSON")
+    docs_search.set_defaults(func=_docs_search)
+    docs.set_defaults(func=lambda args: docs.print_help() or 0)
+
+    workspace = subparsers.add_parser(
+        "workspace", help="Development workspace helpers (sibling repositories)"
+    )
+    workspace_commands = workspace.add_subparsers(dest="workspace_command")
+    workspace_build = workspace_commands.add_parser(
+        "build",
+        help="Editable-install the sibling Python packages and build the npm UIs in parallel",
+    )
+    workspace_build.add_argument(
+        "--root",
+        type=Path,
+        default=Path.cwd(),
+        help="Workspace root holding the sibling repositories (default: current directory)",
+    )
+    workspace_build.add_argument(
+        "--profile",
+        default="light",
+        help="Dependency profile: light, apple, gpu, all-apple, all-gpu, or auto (default: light)",
+    )
+    workspace_build.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=DEFAULT_JOBS,
+        metavar="N",
+        help=f"Maximum concurrent package builds (default: {DEFAULT_JOBS})",
+    )
+    only = workspace_build.add_mutually_exclusive_group()
+    only.add_argument("--python-only", action="store_true", help="Build Python packages only")
+    only.add_argument("--npm-only", action="store_true", help="Build npm packages only")
+    workspace_build.add_argument(
+        "--log-dir",
+        type=Path,
+        help="Directory for per-package logs (default: inside the workspace .venv)",
+    )
+    workspace_build.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild every package even when its fingerprint is unchanged",
+    )
+    workspace_build.add_argument("--json", action="store_true", help="Emit a JSON summary")
+    workspace_build.set_defaults(func=_workspace_build)
+
+    workspace_status_parser = workspace_commands.add_parser(
+        "status",
+        help="Concurrent git status of every workspace repository, in build order",
+    )
+    workspace_status_parser.add_argument(
+        "--root",
+        type=Path,
+        default=Path.cwd(),
+        help="Workspace root holding the sibling repositories (default: current directory)",
+    )
+    workspace_status_parser.add_argument(
+        "--short",
+        "-s",
+        action="store_true",
+        help="Only show repos with pending changes or unpushed commits",
+    )
+    workspace_status_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=DEFAULT_JOBS,
+        metavar="N",
+        help=f"Maximum concurrent git processes (default: {DEFAULT_JOBS})",
+    )
+    workspace_status_parser.add_argument(
+        "--color",
+        choices=("auto", "always", "never"),
+        default="auto",
+        help="Colour the report (default: auto, only when stdout is a terminal)",
+    )
+    workspace_status_parser.add_argument("--json", action="store_true", help="Emit JSON")
+    workspace_status_parser.set_defaults(func=_workspace_status)
+    workspace.set_defaults(func=lambda args: workspace.print_help() or 0)
+
     args = parser.parse_args(argv)
     if not hasattr(args, "func"):
         parser.print_help()
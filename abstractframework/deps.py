@@ -0,0 +1,182 @@
+"""Dependency consistency check over the installed Python distributions.
+
+A fast stand-in for `pip check`: one pass over every installed distribution's
+`Requires-Dist` metadata (`distributions.scan_requirements`), with environment
+markers and version specifiers evaluated for the running interpreter. Extras are
+followed the way an installer would: those requested by an install profile, and by
+installed distributions' own requirements, activate the matching conditional
+requirements of the distribution that provides them.
+
+Markers and specifiers are evaluated with `packaging` (see `requirements`). Without
+it, only missing distributions are detected and `extra == "..."` is the only marker
+honoured.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from .distributions import scan_requirements
+from .requirements import ParsedRequirement, evaluator, parse_requirement, parse_version
+
+
+@dataclass(frozen=True)
+class DependencyProblem:
+    """One requirement that the installed distributions do not satisfy.
+
+    `kind` is `missing` (not installed), `conflict` (installed version outside the
+    specifier), or `invalid` (unparseable requirement or installed version).
+    """
+
+    kind: str
+    requirer: str
+    requirer_version: str | None
+    requirement: str
+    dependency: str | None = None
+    installed: str | None = None
+
+    @property
+    def message(self) -> str:
+        requirer = f"{self.requirer} {self.requirer_version or ''}".strip()
+        if self.kind == "missing":
+            return f"{requirer} requires {self.requirement}, which is not installed"
+        if self.kind == "conflict":
+            return (
+                f"{requirer} requires {self.requirement}, but {self.dependency} "
+                f"{self.installed} is installed"
+            )
+        if self.installed is not None:
+            return f"{self.dependency} has an unparseable version {self.installed!r}"
+        return f"{requirer} declares an unparseable requirement {self.requirement!r}"
+
+    def as_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "kind": self.kind,
+            "requirer": self.requirer,
+            "requirer_version": self.requirer_version,
+            "requirement": self.requirement,
+            "message": self.message,
+        }
+        if self.dependency is not None:
+            data["dependency"] = self.dependency
+        if self.installed is not None:
+            data["installed"] = self.installed
+        return data
+
+
+class _Evaluator:
+    """Parses requirements and evaluates markers once per distinct text and extra."""
+
+    def __init__(self) -> None:
+        self._parsed: dict[str, ParsedRequirement | None] = {}
+        self._applies: dict[tuple[str, str], bool] = {}
+        self._versions: dict[str, Any] = {}
+
+    def parse(self, text: str) -> ParsedRequirement | None:
+        if text not in self._parsed:
+            self._parsed[text] = parse_requirement(text)
+        return self._parsed[text]
+
+    def applies(self, parsed: ParsedRequirement, extra: str) -> bool:
+        """Return whether `parsed` applies when `extra` ("" for none) is active."""
+
+        key = (parsed.text, extra)
+        if key not in self._applies:
+            self._applies[key] = parsed.applies(extra)
+        return self._applies[key]
+
+    def satisfies(self, parsed: ParsedRequirement, version: str) -> bool | None:
+        """Return whether `version` meets the specifier; None when it cannot be parsed."""
+
+        if parsed.requirement is None or not parsed.requirement.specifier:
+            return True
+        if version not in self._versions:
+            self._versions[version] = parse_version(version)
+        parsed_version = self._versions[version]
+        if parsed_version is None:
+            return None
+        return parsed.contains(parsed_version)
+
+
+def check_dependencies(
+    paths: Iterable[str] | None = None,
+    roots: Iterable[str] = (),
+    root_name: str = "profile",
+) -> dict[str, Any]:
+    """Check every installed distribution's requirements against what is installed.
+
+    `roots` are additional requirement lines to check, such as an install profile's
+    `pip_requirements`; their problems are attributed to `root_name`. Requested extras
+    propagate to the distributions that provide them. Returns a JSON-serializable
+    summary with a `problems` list (see `DependencyProblem.as_dict`).
+    """
+
+    index = scan_requirements(paths)
+    requirements = _Evaluator()
+    active: dict[str, set[str]] = {name: {""} for name in index}
+    queue: list[tuple[str | None, str]] = [(None, "")]
+    queue.extend((name, "") for name in index)
+    problems: dict[tuple[str, str], DependencyProblem] = {}
+    evaluated = 0
+
+    while queue:
+        name, extra = queue.pop()
+        if name is None:
+            requirer, requirer_version, requires = root_name, None, list(roots)
+        else:
+            requirer, requirer_version, requires = index[name]
+        for text in requires:
+            parsed = requirements.parse(text)
+            if parsed is None:
+                problems.setdefault(
+                    (requirer, text), DependencyProblem("invalid", requirer, requirer_version, text)
+                )
+                continue
+            # Requirements without an extra marker were settled in the base pass.
+            if extra and not parsed.marker_has_extra:
+                continue
+            if not requirements.applies(parsed, extra):
+                continue
+            evaluated += 1
+            dependency = index.get(parsed.name)
+            if dependency is None:
+                problems.setdefault(
+                    (requirer, text),
+                    DependencyProblem("missing", requirer, requirer_version, text, parsed.name),
+                )
+                continue
+            satisfied = requirements.satisfies(parsed, dependency[1])
+            if satisfied is None:
+                # Reported once per distribution rather than once per requirer.
+                problems.setdefault(
+                    ("", parsed.name),
+                    DependencyProblem(
+                        "invalid", requirer, requirer_version, text, dependency[0], dependency[1]
+                    ),
+                )
+            elif satisfied is False:
+                problems.setdefault(
+                    (requirer, text),
+                    DependencyProblem(
+                        "conflict", requirer, requirer_version, text, dependency[0], dependency[1]
+                    ),
+                )
+            for wanted in parsed.extras - active[parsed.name]:
+                active[parsed.name].add(wanted)
+                queue.append((parsed.name, wanted))
+
+    return {
+        "evaluator": evaluator(),
+        "distributions": len(index),
+        "requirements": evaluated,
+        "extras": {
+            index[name][0]: sorted(extras - {""})
+            for name, extras in sorted(active.items())
+            if extras - {""}
+        },
+        "problems": [
+            problem.as_dict()
+            for problem in sorted(problems.values(), key=lambda p: (p.requirer, p.requirement))
+        ],
+    }
@@ -0,0 +1,174 @@
+"""Single-pass index of installed Python distributions.
+
+`importlib.metadata.version()` rescans every `sys.path` entry on each call, which
+adds up when doctor checks a dozen pins in an environment with hundreds of
+distributions. This module scans the path once and answers every lookup from the
+resulting normalized-name -> version map. `scan_requirements()` makes the same
+single pass but also collects each distribution's `Requires-Dist` lines.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+from typing import Iterable
+
+_NORMALIZE_RE = re.compile(r"[-_.]+")
+_METADATA_SUFFIXES = (".dist-info", ".egg-info")
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a distribution name per PEP 503 (`AbstractRuntime` -> `abstractruntime`)."""
+
+    return _NORMALIZE_RE.sub("-", name).lower()
+
+
+def _read_header(path: str) -> tuple[str | None, str | None]:
+    name: str | None = None
+    version: str | None = None
+    try:
+        with open(path, encoding="utf-8", errors="replace") as handle:
+            for line in handle:
+                if not line.strip():
+                    break
+                key, _, value = line.partition(":")
+                if key == "Name":
+                    name = value.strip()
+                elif key == "Version":
+                    version = value.strip()
+                if name and version:
+                    break
+    except OSError:
+        return None, None
+    return name, version
+
+
+def _metadata_entry(entry: os.DirEntry[str]) -> tuple[str, str] | None:
+    suffix = ".dist-info" if entry.name.endswith(".dist-info") else ".egg-info"
+    parts = entry.name[: -len(suffix)].split("-")
+    if len(parts) >= 2 and parts[0] and parts[1]:
+        return parts[0], parts[1]
+
+    # Legacy `setup.py develop` installs write `<name>.egg-info` without a version,
+    # either as a directory (with PKG-INFO) or as a bare PKG-INFO file.
+    if entry.is_dir():
+        header = os.path.join(entry.path, "METADATA" if suffix == ".dist-info" else "PKG-INFO")
+    else:
+        header = entry.path
+    name, version = _read_header(header)
+    if not name or not version:
+        return None
+    return name, version
+
+
+def scan_distributions(paths: Iterable[str] | None = None) -> dict[str, str]:
+    """Return a normalized distribution name -> version map from one pass over `paths`.
+
+    Defaults to `sys.path`. As with `importlib.metadata`, the first path entry that
+    provides a distribution wins.
+    """
+
+    index: dict[str, str] = {}
+    for path in sys.path if paths is None else paths:
+        try:
+            entries = os.scandir(path or ".")
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(_METADATA_SUFFIXES):
+                    continue
+                found = _metadata_entry(entry)
+                if found is not None:
+                    index.setdefault(normalize_name(found[0]), found[1])
+    return index
+
+
+def lookup_version(index: dict[str, str], distribution: str) -> str | None:
+    """Return the installed version of `distribution` from a `scan_distributions()` index."""
+
+    return index.get(normalize_name(distribution))
+
+
+def _read_metadata(path: str) -> tuple[str | None, str | None, list[str]]:
+    name: str | None = None
+    version: str | None = None
+    requires: list[str] = []
+    try:
+        with open(path, encoding="utf-8", errors="replace") as handle:
+            for line in handle:
+                if not line.strip():
+                    break
+                key, _, value = line.partition(":")
+                if key == "Name":
+                    name = value.strip()
+                elif key == "Version":
+                    version = value.strip()
+                elif key == "Requires-Dist":
+                    requires.append(value.strip())
+    except OSError:
+        pass
+    return name, version, requires
+
+
+def _egg_requires(path: str) -> list[str]:
+    """Translate an egg-info `requires.txt` into `Requires-Dist` lines.
+
+    Sections are `[extra]`, `[:marker]`, or `[extra:marker]`.
+    """
+
+    requires: list[str] = []
+    markers: list[str] = []
+    try:
+        with open(path, encoding="utf-8", errors="replace") as handle:
+            for raw in handle:
+                line = raw.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if line.startswith("[") and line.endswith("]"):
+                    extra, _, marker = line[1:-1].partition(":")
+                    markers = [f"({marker})"] if marker else []
+                    if extra:
+                        markers.append(f'extra == "{extra}"')
+                    continue
+                requires.append(f"{line}; {' and '.join(markers)}" if markers else line)
+    except OSError:
+        pass
+    return requires
+
+
+def scan_requirements(
+    paths: Iterable[str] | None = None,
+) -> dict[str, tuple[str, str, list[str]]]:
+    """Return normalized name -> `(name, version, Requires-Dist lines)` from one pass.
+
+    Defaults to `sys.path`; the first path entry that provides a distribution wins.
+    Only the metadata headers are read, never the long description.
+    """
+
+    index: dict[str, tuple[str, str, list[str]]] = {}
+    for path in sys.path if paths is None else paths:
+        try:
+            entries = os.scandir(path or ".")
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(_METADATA_SUFFIXES):
+                    continue
+                dist_info = entry.name.endswith(".dist-info")
+                if entry.is_dir():
+                    header = os.path.join(entry.path, "METADATA" if dist_info else "PKG-INFO")
+                else:
+                    header = entry.path
+                name, version, requires = _read_metadata(header)
+                if not dist_info and entry.is_dir():
+                    requires = _egg_requires(os.path.join(entry.path, "requires.txt"))
+                if not name or not version:
+                    found = _metadata_entry(entry)
+                    if found is None:
+                        continue
+                    name, version = found
+                index.setdefault(normalize_name(name), (name, version, requires))
+    return index
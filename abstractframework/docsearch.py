@@ -0,0 +1,249 @@
+"""BM25 full-text search over the `llms-full.txt` sections.
+
+`scripts/gen_llms_full.py` builds an inverted index next to `llms-full.txt`
+(`llms-full.search.json`): for every term, the sections containing it and how
+often. The index is updated incrementally; only sections whose text changed are
+re-tokenized. Searching loads the index on first use, scores sections with Okapi
+BM25, and reads snippets for the top hits only, through the `llms_full` offset
+index. The index is shipped with the package next to the packaged `llms-full.txt`,
+so search works from a wheel install.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+from .llms_full import LlmsFull, LlmsFullError
+
+SEARCH_FORMAT = 1
+DEFAULT_LIMIT = 10
+K1 = 1.2
+B = 0.75
+SNIPPET_CHARS = 160
+
+_WORDS = re.compile(r"[^\W_]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to "
+    "was were will with".split()
+)
+
+
+def _normalize(word: str) -> str:
+    # Light plural folding so "providers" matches "provider"; no full stemming.
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+def tokenize(text: str) -> list[str]:
+    """Return the index terms of `text`: lowercased words, stopwords dropped, plurals folded."""
+
+    return [
+        _normalize(word) for word in _WORDS.findall(text.lower()) if word not in STOPWORDS
+    ]
+
+
+def search_index_path(path: str | Path) -> Path:
+    """Return the search index path (`llms-full.txt` -> `llms-full.search.json`)."""
+
+    path = Path(path)
+    return path.with_name(f"{path.stem}.search.json")
+
+
+def build_search_index(
+    sections: Sequence[tuple[str, str]],
+    read_text: Callable[[str], str],
+    previous: dict[str, Any] | None = None,
+    *,
+    source_sha256: str = "",
+) -> tuple[dict[str, Any], list[str]]:
+    """Return `(index, re-tokenized paths)` for `(path, sha256)` sections, in order.
+
+    Postings of sections whose hash matches `previous` are carried over (renumbered if
+    sections moved); only the others are read with `read_text` and tokenized.
+    """
+
+    old_docs: dict[str, tuple[int, str, int]] = {}
+    old_postings: dict[str, list[int]] = {}
+    if previous is not None and previous.get("format") == SEARCH_FORMAT:
+        old_docs = {
+            doc["path"]: (doc_id, doc["sha256"], doc["length"])
+            for doc_id, doc in enumerate(previous["docs"])
+        }
+        old_postings = previous["postings"]
+    new_ids = {path: doc_id for doc_id, (path, _) in enumerate(sections)}
+    kept = {
+        old_docs[path][0]: new_ids[path]
+        for path, sha in sections
+        if path in old_docs and old_docs[path][1] == sha
+    }
+
+    postings: dict[str, list[int]] = {}
+    if kept:
+        for term, flat in old_postings.items():
+            carried = [
+                value
+                for old_id, tf in zip(flat[::2], flat[1::2])
+                if old_id in kept
+                for value in (kept[old_id], tf)
+            ]
+            if carried:
+                postings[term] = carried
+
+    docs: list[dict[str, Any]] = []
+    tokenized: list[str] = []
+    for doc_id, (path, sha) in enumerate(sections):
+        if path in old_docs and old_docs[path][0] in kept:
+            length = old_docs[path][2]
+        else:
+            counts = Counter(tokenize(read_text(path)))
+            length = sum(counts.values())
+            for term, tf in counts.items():
+                postings.setdefault(term, []).extend((doc_id, tf))
+            tokenized.append(path)
+        docs.append({"path": path, "sha256": sha, "length": length})
+
+    for term, flat in postings.items():
+        pairs = sorted(zip(flat[::2], flat[1::2]))
+        postings[term] = [value for pair in pairs for value in pair]
+    index = {
+        "format": SEARCH_FORMAT,
+        "source_sha256": source_sha256,
+        "docs": docs,
+        "postings": dict(sorted(postings.items())),
+    }
+    return index, tokenized
+
+
+def dump_search_index(index: dict[str, Any]) -> str:
+    """Serialize `index` as compact JSON with one posting list per line (diff-friendly)."""
+
+    lines = [
+        "{",
+        f'"format":{index["format"]},',
+        f'"source_sha256":{json.dumps(index["source_sha256"])},',
+        '"docs":[',
+        ",\n".join(
+            json.dumps(doc, separators=(",", ":"), ensure_ascii=False) for doc in index["docs"]
+        ),
+        "],",
+        '"postings":{',
+        ",\n".join(
+            f"{json.dumps(term, ensure_ascii=False)}:{json.dumps(flat, separators=(',', ':'))}"
+            for term, flat in index["postings"].items()
+        ),
+        "}}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    path: str
+    score: float
+    line: int
+    snippet: str
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "path": self.path,
+            "score": round(self.score, 4),
+            "line": self.line,
+            "snippet": self.snippet,
+        }
+
+
+def _snippet(text: str, terms: set[str]) -> tuple[int, str]:
+    best = (0, 1, "")
+    for number, line in enumerate(text.splitlines(), start=1):
+        hits = len(terms.intersection(tokenize(line)))
+        if hits > best[0]:
+            best = (hits, number, line)
+    _, number, line = best
+    line = line.strip()
+    if len(line) > SNIPPET_CHARS:
+        lowered = line.lower()
+        first = min((lowered.find(term) for term in terms if term in lowered), default=0)
+        start = max(0, min(first - SNIPPET_CHARS // 4, len(line) - SNIPPET_CHARS))
+        line = ("…" if start else "") + line[start : start + SNIPPET_CHARS].strip() + "…"
+    return number, line
+
+
+class DocsSearch:
+    """Search the sections of a generated `llms-full.txt` through its search index.
+
+    The index is read on the first `search()`; it must have been built from the same
+    `llms-full.txt` (matching digest), or `LlmsFullError` is raised.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.docs = LlmsFull(path)
+        self.path = search_index_path(self.docs.path)
+        self._index: dict[str, Any] | None = None
+
+    def close(self) -> None:
+        self.docs.close()
+
+    def _load(self) -> dict[str, Any]:
+        if self._index is None:
+            try:
+                index = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                raise LlmsFullError(
+                    f"cannot read {self.path}: {exc}; run scripts/gen_llms_full.py"
+                ) from exc
+            if index.get("format") != SEARCH_FORMAT or (
+                index.get("source_sha256") != self.docs.sha256
+            ):
+                raise LlmsFullError(
+                    f"{self.path} does not match {self.docs.path.name}; "
+                    "run scripts/gen_llms_full.py"
+                )
+            self._index = index
+        return self._index
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT) -> list[SearchHit]:
+        """Return up to `limit` sections ranked by BM25 score for `query`, with snippets."""
+
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        index = self._load()
+        docs = index["docs"]
+        count = len(docs)
+        average = sum(doc["length"] for doc in docs) / count if count else 0.0
+        scores: dict[int, float] = {}
+        for term in terms:
+            flat = index["postings"].get(term)
+            if not flat:
+                continue
+            frequency = len(flat) // 2
+            idf = math.log(1 + (count - frequency + 0.5) / (frequency + 0.5))
+            for doc_id, tf in zip(flat[::2], flat[1::2]):
+                norm = K1 * (1 - B + B * docs[doc_id]["length"] / average)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        hits = []
+        for doc_id, score in ranked:
+            path = docs[doc_id]["path"]
+            line, snippet = _snippet(self.docs.read(path), set(terms))
+            hits.append(SearchHit(path, score, line, snippet))
+        return hits
+
+
+def search_docs(
+    query: str, limit: int = DEFAULT_LIMIT, path: str | Path | None = None
+) -> list[SearchHit]:
+    """Return the top `limit` BM25 hits for `query` in `llms-full.txt`."""
+
+    search = DocsSearch(path)
+    try:
+        return search.search(query, limit)
+    finally:
+        search.close()
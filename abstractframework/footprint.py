@@ -0,0 +1,217 @@
+"""Resource footprint of the installed components and install profiles.
+
+For every installed component this measures the on-disk size and file count of its
+distribution and of everything it transitively requires (from `Requires-Dist`
+metadata and `RECORD` files), plus the RSS growth from importing it in a fresh
+interpreter. The same numbers are then aggregated per install profile, counting each
+shared distribution once and importing the profile's components together.
+
+Environment markers are evaluated for the running interpreter and platform, and only
+installed distributions can be measured; required distributions that are not
+installed are listed as `missing`.
+"""
+
+from __future__ import annotations
+
+import importlib.metadata
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable
+
+from . import PACKAGE_DISTRIBUTIONS
+from .distributions import normalize_name
+from .importtime import DEFAULT_IMPORT_TIMEOUT_S, import_rss
+from .install_manifest import build_install_manifest
+from .requirements import parse_requirement
+
+
+def installed_distributions() -> dict[str, importlib.metadata.Distribution]:
+    """Return installed distributions by normalized name, first on `sys.path` winning."""
+
+    index: dict[str, importlib.metadata.Distribution] = {}
+    for distribution in importlib.metadata.distributions():
+        name = distribution.metadata["Name"]
+        if name:
+            index.setdefault(normalize_name(name), distribution)
+    return index
+
+
+def resolve_closure(
+    index: dict[str, importlib.metadata.Distribution],
+    roots: Iterable[tuple[str, Iterable[str]]],
+) -> tuple[set[str], set[str]]:
+    """Return the `(installed, missing)` distribution names reachable from `roots`.
+
+    `roots` are `(distribution, extras)` pairs; requested extras propagate to the
+    requirements they select.
+    """
+
+    installed: set[str] = set()
+    missing: set[str] = set()
+    visited: set[tuple[str, str]] = set()
+    queue = [(normalize_name(name), extra) for name, extras in roots for extra in ("", *extras)]
+    while queue:
+        name, extra = queue.pop()
+        if (name, extra) in visited:
+            continue
+        visited.add((name, extra))
+        distribution = index.get(name)
+        if distribution is None:
+            missing.add(name)
+            continue
+        installed.add(name)
+        for text in distribution.requires or []:
+            parsed = parse_requirement(text)
+            if parsed is None or not parsed.applies(extra):
+                continue
+            queue.append((parsed.name, ""))
+            queue.extend((parsed.name, dependency_extra) for dependency_extra in parsed.extras)
+    return installed, missing
+
+
+def distribution_footprint(distribution: importlib.metadata.Distribution) -> dict[str, Any]:
+    """Return the version, on-disk size in bytes, and file count of one distribution.
+
+    Sizes come from the files listed in `RECORD`; both are None when it is missing.
+    """
+
+    data: dict[str, Any] = {"version": distribution.version, "disk_bytes": None, "files": None}
+    files = distribution.files
+    if files is None:
+        return data
+    size = 0
+    count = 0
+    for path in files:
+        try:
+            stat = os.stat(distribution.locate_file(path))
+        except OSError:
+            continue
+        size += stat.st_size
+        count += 1
+    data["disk_bytes"] = size
+    data["files"] = count
+    return data
+
+
+def _sum(values: Iterable[int | None]) -> int:
+    return sum(value for value in values if value is not None)
+
+
+def _rss_delta(modules: list[str], timeout: float) -> int | None:
+    if not modules:
+        return None
+    measured = import_rss(modules, timeout)
+    return None if measured is None else max(0, measured[1] - measured[0])
+
+
+def build_footprint_report(timeout: float = DEFAULT_IMPORT_TIMEOUT_S) -> dict[str, Any]:
+    """Measure every installed component and aggregate the result per install profile.
+
+    Profiles are taken from the install manifest; when `abstractframework` itself has
+    no installed metadata, only the `light` profile can be resolved and it falls back
+    to the pinned components.
+    """
+
+    index = installed_distributions()
+    sizes: dict[str, dict[str, Any]] = {}
+
+    def _measure(names: list[str]) -> tuple[int, int]:
+        for name in names:
+            if name not in sizes:
+                sizes[name] = distribution_footprint(index[name])
+        disk = _sum(sizes[name]["disk_bytes"] for name in names)
+        files = _sum(sizes[name]["files"] for name in names)
+        return disk, files
+
+    component_closures: dict[str, set[str]] = {}
+    for package_id, distribution in PACKAGE_DISTRIBUTIONS.items():
+        if normalize_name(distribution) in index:
+            component_closures[package_id], _ = resolve_closure(index, [(distribution, ())])
+
+    profile_roots: dict[str, list[tuple[str, frozenset[str]]] | None] = {}
+    framework_installed = "abstractframework" in index
+    for profile in build_install_manifest()["profiles"]:
+        if framework_installed:
+            parsed = [parse_requirement(text) for text in profile["pip_requirements"]]
+            profile_roots[profile["id"]] = [
+                (requirement.name, requirement.extras)
+                for requirement in parsed
+                if requirement is not None and requirement.applies()
+            ]
+        elif profile["id"] == "light":
+            pinned = PACKAGE_DISTRIBUTIONS.values()
+            profile_roots["light"] = [(name, frozenset()) for name in pinned]
+        else:
+            profile_roots[profile["id"]] = None
+
+    profile_closures: dict[str, tuple[set[str], set[str]]] = {
+        profile_id: resolve_closure(index, roots)
+        for profile_id, roots in profile_roots.items()
+        if roots is not None
+    }
+    profile_components = {
+        profile_id: [
+            package_id
+            for package_id, distribution in PACKAGE_DISTRIBUTIONS.items()
+            if normalize_name(distribution) in installed
+        ]
+        for profile_id, (installed, _) in profile_closures.items()
+    }
+
+    # Each measurement is its own interpreter, so they can run side by side.
+    jobs = [[package_id] for package_id in component_closures] + list(profile_components.values())
+    with ThreadPoolExecutor(max_workers=max(1, min(4, len(jobs)))) as pool:
+        deltas = list(pool.map(lambda modules: _rss_delta(modules, timeout), jobs))
+    component_rss = dict(zip(component_closures, deltas))
+    profile_rss = dict(zip(profile_components, deltas[len(component_closures) :]))
+
+    components: list[dict[str, Any]] = []
+    for package_id, closure in component_closures.items():
+        own = normalize_name(PACKAGE_DISTRIBUTIONS[package_id])
+        _measure([own])
+        disk, files = _measure(sorted(closure))
+        components.append(
+            {
+                "component": package_id,
+                "distribution": PACKAGE_DISTRIBUTIONS[package_id],
+                "version": sizes[own]["version"],
+                "disk_bytes": sizes[own]["disk_bytes"],
+                "files": sizes[own]["files"],
+                "closure": sorted(closure),
+                "closure_disk_bytes": disk,
+                "closure_files": files,
+                "import_rss_bytes": component_rss[package_id],
+            }
+        )
+
+    profiles: list[dict[str, Any]] = []
+    for profile_id, roots in profile_roots.items():
+        if roots is None:
+            profiles.append(
+                {
+                    "id": profile_id,
+                    "resolved": False,
+                    "reason": "abstractframework distribution metadata is not installed",
+                }
+            )
+            continue
+        installed, missing = profile_closures[profile_id]
+        disk, files = _measure(sorted(installed))
+        profiles.append(
+            {
+                "id": profile_id,
+                "resolved": True,
+                "distributions": len(installed),
+                "missing": sorted(missing),
+                "components": profile_components[profile_id],
+                "disk_bytes": disk,
+                "files": files,
+                "import_rss_bytes": profile_rss[profile_id],
+            }
+        )
+
+    return {
+        "components": components,
+        "profiles": profiles,
+        "distributions": {name: sizes[name] for name in sorted(sizes)},
+    }
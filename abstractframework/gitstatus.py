@@ -0,0 +1,173 @@
+"""Git status overview of the workspace repositories, queried concurrently.
+
+Each repository costs one `git status --porcelain=v2 --branch` call, which reports
+the branch, its upstream, ahead/behind counts, and every staged, unstaged, and
+untracked path at once. Only repositories with unpushed commits need a second call,
+to list those commits. Repositories are grouped in the `scripts/build.sh` order.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .workspace import DEFAULT_JOBS, PYTHON_TIERS, REPO_ALIASES
+
+_TIER_TITLES = (
+    "Python Tier 0 — No internal dependencies",
+    "Python Tier 1 — Depends on Tier 0",
+    "Python Tier 2 — Depends on Tier 0-1",
+    "Python Tier 3 — Depends on Tier 0-2",
+)
+
+# (group title, ((display name, candidate directories relative to the root), ...)).
+# abstractcode/web is an npm build target inside the abstractcode repository, so the
+# abstractcode repo is only listed once, in Python Tier 3.
+STATUS_GROUPS: tuple[tuple[str, tuple[tuple[str, tuple[str, ...]], ...]], ...] = (
+    *(
+        (title, tuple((repo, (repo, *REPO_ALIASES.get(repo, ()))) for repo in tier))
+        for title, tier in zip(_TIER_TITLES, PYTHON_TIERS)
+    ),
+    ("Python Tier 4 — Meta-package", (("abstractframework", (".",)),)),
+    (
+        "npm — UI package repositories",
+        tuple((repo, (repo,)) for repo in ("abstractuic", "abstractobserver", "abstractflow")),
+    ),
+)
+
+
+@dataclass
+class RepoStatus:
+    name: str
+    path: Path
+    cloned: bool = True
+    branch: str = "???"
+    upstream: str | None = None
+    staged: int = 0
+    unstaged: int = 0
+    untracked: int = 0
+    ahead: int = 0
+    behind: int = 0
+    unpushed: list[str] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def has_changes(self) -> bool:
+        return any((self.staged, self.unstaged, self.untracked, self.ahead, self.behind))
+
+    def as_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "name": self.name,
+            "path": str(self.path),
+            "cloned": self.cloned,
+        }
+        if not self.cloned:
+            return data
+        data.update(
+            {
+                "branch": self.branch,
+                "upstream": self.upstream,
+                "staged": self.staged,
+                "unstaged": self.unstaged,
+                "untracked": self.untracked,
+                "ahead": self.ahead,
+                "behind": self.behind,
+                "unpushed": list(self.unpushed),
+                "has_changes": self.has_changes,
+            }
+        )
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+def parse_porcelain_v2(output: str, status: RepoStatus) -> RepoStatus:
+    """Fill `status` from `git status --porcelain=v2 --branch` output.
+
+    Ordinary, renamed, and unmerged entries count as staged when their index column
+    changed and as unstaged when their worktree column changed, matching
+    `git diff --cached --name-only` and `git diff --name-only`.
+    """
+
+    for line in output.splitlines():
+        if line.startswith("# branch.head "):
+            head = line[len("# branch.head ") :]
+            status.branch = "HEAD" if head == "(detached)" else head
+        elif line.startswith("# branch.upstream "):
+            status.upstream = line[len("# branch.upstream ") :]
+        elif line.startswith("# branch.ab "):
+            ahead, behind = line[len("# branch.ab ") :].split()
+            status.ahead, status.behind = int(ahead), abs(int(behind))
+        elif line[:2] in {"1 ", "2 ", "u "}:
+            xy = line[2:4]
+            status.staged += xy[0] != "."
+            status.unstaged += xy[1] != "."
+        elif line.startswith("? "):
+            status.untracked += 1
+    return status
+
+
+def _git(path: Path, *args: str) -> subprocess.CompletedProcess[str]:
+    # Optional locks would make concurrent runs contend for index.lock refreshes.
+    return subprocess.run(
+        ["git", "--no-optional-locks", "-C", str(path), *args],
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+        check=False,
+    )
+
+
+def repo_status(name: str, path: Path) -> RepoStatus:
+    """Return the status of one repository; `cloned` is False when it has no `.git`."""
+
+    status = RepoStatus(name, path)
+    if not (path / ".git").exists():
+        status.cloned = False
+        return status
+    try:
+        result = _git(path, "status", "--porcelain=v2", "--branch", "--untracked-files=all")
+    except OSError as exc:
+        status.error = str(exc)
+        return status
+    if result.returncode != 0:
+        status.error = result.stderr.strip() or f"git status exited with {result.returncode}"
+        return status
+    parse_porcelain_v2(result.stdout, status)
+    if status.ahead and status.upstream:
+        log = _git(path, "log", "@{upstream}..HEAD", "--format=%h %s")
+        if log.returncode == 0:
+            status.unpushed = log.stdout.splitlines()
+    return status
+
+
+def _repo_path(root: Path, candidates: tuple[str, ...]) -> Path:
+    for candidate in candidates:
+        if (root / candidate / ".git").exists():
+            return (root / candidate).resolve()
+    return (root / candidates[0]).resolve()
+
+
+def workspace_status(
+    root: str | Path, jobs: int = DEFAULT_JOBS
+) -> list[tuple[str, list[RepoStatus]]]:
+    """Return `(group title, statuses)` for every `STATUS_GROUPS` group, in order.
+
+    All repositories are queried concurrently, at most `jobs` at a time.
+    """
+
+    root = Path(root)
+    repos = [
+        (title, name, _repo_path(root, candidates))
+        for title, members in STATUS_GROUPS
+        for name, candidates in members
+    ]
+    with ThreadPoolExecutor(max_workers=max(1, jobs), thread_name_prefix="git-status") as pool:
+        statuses = list(pool.map(lambda repo: repo_status(repo[1], repo[2]), repos))
+    groups: dict[str, list[RepoStatus]] = {title: [] for title, _ in STATUS_GROUPS}
+    for (title, _, _), status in zip(repos, statuses):
+        groups[title].append(status)
+    return list(groups.items())
@@ -0,0 +1,307 @@
+"""Import-time profiling of the pinned components.
+
+Each component is imported in a fresh interpreter started with `-X importtime`, so
+nothing already imported by the caller skews the numbers. The `-X importtime` report
+is parsed back into a tree of modules with self and cumulative times, and the child
+also reports its peak RSS before and after the import.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence
+
+DEFAULT_IMPORT_TIMEOUT_S = 120.0
+DEFAULT_TOP_OFFENDERS = 5
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)\s*$")
+
+# Linux keeps `ru_maxrss` across exec, so a child would inherit its parent's peak; the
+# `VmHWM` high-water mark in /proc is reset by exec and is preferred. Elsewhere
+# `ru_maxrss` is used (bytes on macOS); `resource` does not exist on Windows.
+# The component is loaded with `__import__` because `importlib.import_module` bypasses
+# the interpreter's import timer, so the component itself would be missing from the tree.
+_PROFILE_SCRIPT = (
+    "import sys\n"
+    "try:\n"
+    "    import resource\n"
+    "except ImportError:\n"
+    "    resource = None\n"
+    "def rss():\n"
+    "    try:\n"
+    "        with open('/proc/self/status') as status:\n"
+    "            for line in status:\n"
+    "                if line.startswith('VmHWM:'):\n"
+    "                    return int(line.split()[1]) * 1024\n"
+    "    except (OSError, ValueError, IndexError):\n"
+    "        pass\n"
+    "    if resource is None:\n"
+    "        return -1\n"
+    "    value = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+    "    return value if sys.platform == 'darwin' else value * 1024\n"
+    "before = rss()\n"
+    "for name in sys.argv[1:]:\n"
+    "    __import__(name)\n"
+    "print('abstractframework-rss', before, rss())\n"
+)
+
+
+@dataclass
+class ImportNode:
+    module: str
+    self_us: int
+    cumulative_us: int
+    children: list[ImportNode] = field(default_factory=list)
+
+    def walk(self) -> Iterator[ImportNode]:
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "module": self.module,
+            "self_ms": round(self.self_us / 1000, 3),
+            "cumulative_ms": round(self.cumulative_us / 1000, 3),
+            "children": [child.as_dict() for child in self.children],
+        }
+
+
+def parse_importtime(output: str) -> list[ImportNode]:
+    """Parse `-X importtime` stderr into top-level import trees.
+
+    CPython prints a module after everything it imported, indented two spaces per
+    nesting level, so a line at depth `d` adopts the pending nodes at depth `d + 1`.
+    Lines that are not import-time records (warnings, tracebacks) are ignored.
+    """
+
+    pending: dict[int, list[ImportNode]] = {}
+    for line in output.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        depth = max(0, (len(indent) - 1) // 2)
+        node = ImportNode(module, int(self_us), int(cumulative_us), pending.pop(depth + 1, []))
+        pending.setdefault(depth, []).append(node)
+    roots = pending.pop(0, [])
+    # Orphans only occur in truncated output (e.g. the import raised mid-way).
+    for depth in sorted(pending):
+        roots.extend(pending[depth])
+    return roots
+
+
+@dataclass
+class ImportProfile:
+    component: str
+    status: str
+    tree: ImportNode | None = None
+    baseline_rss: int | None = None
+    peak_rss: int | None = None
+    error: str | None = None
+    top: int = DEFAULT_TOP_OFFENDERS
+
+    @property
+    def self_ms(self) -> float | None:
+        return self.tree.self_us / 1000 if self.tree else None
+
+    @property
+    def cumulative_ms(self) -> float | None:
+        return self.tree.cumulative_us / 1000 if self.tree else None
+
+    @property
+    def peak_rss_mb(self) -> float | None:
+        return self.peak_rss / (1024 * 1024) if self.peak_rss is not None else None
+
+    def offenders(self) -> list[ImportNode]:
+        """Return the modules with the largest self time under this component."""
+
+        if self.tree is None:
+            return []
+        return sorted(self.tree.walk(), key=lambda node: node.self_us, reverse=True)[: self.top]
+
+    def as_dict(self, include_tree: bool = False) -> dict[str, Any]:
+        data: dict[str, Any] = {"component": self.component, "status": self.status}
+        if self.error:
+            data["error"] = self.error
+        if self.tree is not None:
+            data["self_ms"] = round(self.tree.self_us / 1000, 3)
+            data["cumulative_ms"] = round(self.tree.cumulative_us / 1000, 3)
+            data["top_offenders"] = [
+                {
+                    "module": node.module,
+                    "self_ms": round(node.self_us / 1000, 3),
+                    "cumulative_ms": round(node.cumulative_us / 1000, 3),
+                }
+                for node in self.offenders()
+            ]
+            if include_tree:
+                data["tree"] = self.tree.as_dict()
+        if self.peak_rss is not None:
+            data["peak_rss_mb"] = round(self.peak_rss / (1024 * 1024), 3)
+        if self.baseline_rss is not None:
+            data["baseline_rss_mb"] = round(self.baseline_rss / (1024 * 1024), 3)
+        return data
+
+
+def _parse_rss(stdout: str) -> tuple[int | None, int | None]:
+    for line in reversed(stdout.splitlines()):
+        parts = line.split()
+        if len(parts) == 3 and parts[0] == "abstractframework-rss":
+            before, after = int(parts[1]), int(parts[2])
+            if before < 0 or after < 0:
+                return None, None
+            return before, after
+    return None, None
+
+
+def profile_import(
+    component: str,
+    timeout: float = DEFAULT_IMPORT_TIMEOUT_S,
+    top: int = DEFAULT_TOP_OFFENDERS,
+) -> ImportProfile:
+    """Import `component` in a fresh `-X importtime` interpreter and profile it.
+
+    The status is `ok`, `missing` (not importable), `error` (raised while importing),
+    or `timeout`.
+    """
+
+    try:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", _PROFILE_SCRIPT, component],
+            check=False,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return ImportProfile(component, "timeout", error=f"import exceeded {timeout:g}s", top=top)
+    except OSError as exc:
+        return ImportProfile(component, "error", error=str(exc), top=top)
+
+    roots = parse_importtime(result.stderr)
+    tree = next((node for node in reversed(roots) if node.module == component), None)
+    if result.returncode != 0:
+        errors = [
+            line for line in result.stderr.splitlines() if not line.startswith("import time:")
+        ]
+        message = errors[-1] if errors else f"exit status {result.returncode}"
+        missing = f"No module named '{component}'" in message
+        return ImportProfile(
+            component, "missing" if missing else "error", tree, error=message, top=top
+        )
+    baseline, peak = _parse_rss(result.stdout)
+    if tree is None:
+        # Already imported during interpreter start-up (e.g. via a .pth file).
+        tree = ImportNode(component, 0, 0)
+    return ImportProfile(component, "ok", tree, baseline, peak, top=top)
+
+
+def import_rss(
+    modules: Sequence[str], timeout: float = DEFAULT_IMPORT_TIMEOUT_S
+) -> tuple[int, int] | None:
+    """Import `modules` together in a fresh interpreter and return its (baseline, peak) RSS.
+
+    Returns None when the import fails or times out, or when the platform cannot
+    report RSS.
+    """
+
+    try:
+        result = subprocess.run(
+            [sys.executable, "-c", _PROFILE_SCRIPT, *modules],
+            check=False,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    baseline, peak = _parse_rss(result.stdout)
+    if baseline is None or peak is None:
+        return None
+    return baseline, peak
+
+
+def profile_imports(
+    components: Iterable[str],
+    timeout: float = DEFAULT_IMPORT_TIMEOUT_S,
+    top: int = DEFAULT_TOP_OFFENDERS,
+) -> list[ImportProfile]:
+    """Profile each component in turn.
+
+    Components are profiled sequentially so they do not compete for CPU and disk,
+    which would inflate each other's timings.
+    """
+
+    return [profile_import(component, timeout, top) for component in components]
+
+
+def load_budget(path: str | Path) -> dict[str, dict[str, float]]:
+    """Load an import budget file.
+
+    The file maps component names to limits, e.g.
+    `{"abstractcore": {"import_ms": 800, "peak_rss_mb": 200}, "default": {"import_ms": 500}}`.
+    A bare number is shorthand for `{"import_ms": <number>}`. The `default` entry applies
+    to components without their own entry.
+    """
+
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: budget file must be a JSON object")
+    budget: dict[str, dict[str, float]] = {}
+    for component, limits in data.items():
+        if isinstance(limits, (int, float)) and not isinstance(limits, bool):
+            limits = {"import_ms": limits}
+        if not isinstance(limits, dict) or not all(
+            key in {"import_ms", "peak_rss_mb"} and isinstance(value, (int, float))
+            for key, value in limits.items()
+        ):
+            raise ValueError(
+                f"{path}: budget for {component!r} must be a number or an object with "
+                "numeric 'import_ms' / 'peak_rss_mb'"
+            )
+        budget[component] = {key: float(value) for key, value in limits.items()}
+    return budget
+
+
+def check_budget(
+    profiles: Iterable[ImportProfile], budget: dict[str, dict[str, float]]
+) -> list[str]:
+    """Return one message per budget a profiled component exceeds.
+
+    A budgeted component that times out or fails to import is a violation too, since
+    its import time is unknown. So is a component with its own entry that is missing;
+    components covered only by `default` may be absent from the install profile.
+    """
+
+    violations: list[str] = []
+    for profile in profiles:
+        own_limits = budget.get(profile.component)
+        limits = own_limits or budget.get("default")
+        if not limits:
+            continue
+        if profile.status != "ok":
+            if profile.status != "missing" or own_limits:
+                detail = f": {profile.error}" if profile.error else ""
+                violations.append(f"{profile.component}: import {profile.status}{detail}")
+            continue
+        import_ms = profile.cumulative_ms
+        if "import_ms" in limits and import_ms is not None and import_ms > limits["import_ms"]:
+            violations.append(
+                f"{profile.component}: import took {import_ms:.1f} ms, "
+                f"budget {limits['import_ms']:g} ms"
+            )
+        rss_mb = profile.peak_rss_mb
+        if "peak_rss_mb" in limits and rss_mb is not None and rss_mb > limits["peak_rss_mb"]:
+            violations.append(
+                f"{profile.component}: peak RSS {rss_mb:.1f} MB, "
+                f"budget {limits['peak_rss_mb']:g} MB"
+            )
+    return violations
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +12,18 @@ from . import NPM_RELEASE_VERSIONS, PACKAGE_DISTRIBUTIONS, RELEASE_VERSIONS, __v
 
 MANIFEST_SCHEMA_VERSION = 1
 MINIMUM_INSTALLER_VERSION = "0.1.0"
+DIGEST_SUFFIX = ".sha256"
+# No resolver run: every distribution is pinned to one wheel by hash in the lock.
+LOCK_INSTALL_COMMAND = (
+    "python",
+    "-m",
+    "pip",
+    "install",
+    "--no-deps",
+    "--require-hashes",
+    "--only-binary=:all:",
+    "-r",
+)
 
 
 def _python_packages() -> list[dict[str, str]]:
@@ -122,24 +136,179 @@ def build_install_manifest() -> dict[str, Any]:
     }
 
 
+def _diff_entries(
+    old: list[dict[str, Any]], new: list[dict[str, Any]], key: str
+) -> dict[str, list[dict[str, Any]]]:
+    old_by_key = {entry[key]: entry for entry in old}
+    new_by_key = {entry[key]: entry for entry in new}
+    changed = [
+        {key: name, "from": old_by_key[name]["version"], "to": entry["version"]}
+        for name, entry in new_by_key.items()
+        if name in old_by_key and old_by_key[name]["version"] != entry["version"]
+    ]
+    return {
+        "added": [entry for name, entry in new_by_key.items() if name not in old_by_key],
+        "removed": [entry for name, entry in old_by_key.items() if name not in new_by_key],
+        "changed": changed,
+    }
+
+
+def diff_install_manifest(
+    old: dict[str, Any], new: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Return the delta that upgrades an installation from `old` to `new`.
+
+    `new` defaults to the generated manifest. Besides the added, removed, and
+    version-bumped Python packages, npm apps, and profiles, the delta carries a
+    minimal command set per profile: one `pip install` of the profile requirement
+    plus only the changed pins (pip leaves satisfied pins alone), `pip uninstall`
+    for dropped packages, and `npm cache add` to prefetch changed npm apps for `npx`.
+    """
+
+    generated = new is None
+    new = build_install_manifest() if new is None else new
+    python = _diff_entries(old.get("python_packages", []), new["python_packages"], "id")
+    npm = _diff_entries(old.get("npm_apps", []), new["npm_apps"], "package")
+    for entry in python["changed"]:
+        entry["distribution"] = next(
+            item["distribution"] for item in new["python_packages"] if item["id"] == entry["id"]
+        )
+
+    old_profiles = {profile["id"]: profile for profile in old.get("profiles", [])}
+    new_profiles = {profile["id"]: profile for profile in new["profiles"]}
+    changed_profiles = []
+    for profile_id, profile in new_profiles.items():
+        previous = old_profiles.get(profile_id)
+        if previous is None:
+            continue
+        fields = {
+            field: {"from": previous.get(field), "to": value}
+            for field, value in profile.items()
+            if previous.get(field) != value
+        }
+        for field, value in previous.items():
+            if field not in profile:
+                fields[field] = {"from": value, "to": None}
+        if fields:
+            changed_profiles.append({"id": profile_id, "fields": fields})
+
+    old_framework = old.get("framework", {}).get("version")
+    new_framework = new["framework"]["version"]
+    python_changed = bool(
+        old_framework != new_framework or any(python.values()) or changed_profiles
+    )
+
+    upgrades = [f"{entry['distribution']}=={entry['version']}" for entry in python["added"]]
+    upgrades += [f"{entry['distribution']}=={entry['to']}" for entry in python["changed"]]
+    uninstall = [entry["distribution"] for entry in python["removed"]]
+    npm_fetch = [f"{entry['package']}@{entry['version']}" for entry in npm["added"]]
+    npm_fetch += [f"{entry['package']}@{entry['to']}" for entry in npm["changed"]]
+    commands: dict[str, dict[str, list[list[str]]]] = {}
+    for profile_id, profile in new_profiles.items():
+        pip: list[list[str]] = []
+        if uninstall:
+            pip.append(["pip", "uninstall", "-y", *uninstall])
+        if python_changed:
+            pip.append(["pip", "install", *profile["pip_requirements"], *upgrades])
+        commands[profile_id] = {
+            "pip": pip,
+            "npm": [["npm", "cache", "add", *npm_fetch]] if npm_fetch else [],
+        }
+
+    profiles = {
+        "added": sorted(set(new_profiles) - set(old_profiles)),
+        "removed": sorted(set(old_profiles) - set(new_profiles)),
+        "changed": changed_profiles,
+    }
+    target: dict[str, Any] = {"framework_version": new_framework}
+    if generated:
+        target["digest"] = manifest_digest()
+    return {
+        "schema_version": MANIFEST_SCHEMA_VERSION,
+        "from": {"framework_version": old_framework},
+        "to": target,
+        "unchanged": not (python_changed or any(npm.values()) or any(profiles.values())),
+        "python_packages": python,
+        "npm_apps": npm,
+        "profiles": profiles,
+        "commands": commands,
+    }
+
+
+@lru_cache(maxsize=None)
+def manifest_bytes(indent: int = 2) -> bytes:
+    """Return the install manifest as stable UTF-8 JSON, built once per process."""
+
+    text = json.dumps(build_install_manifest(), indent=indent, sort_keys=True) + "\n"
+    return text.encode("utf-8")
+
+
 def manifest_json(indent: int = 2) -> str:
     """Return the install manifest as stable JSON."""
 
-    return json.dumps(build_install_manifest(), indent=indent, sort_keys=True) + "\n"
+    return manifest_bytes(indent).decode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def manifest_digest() -> str:
+    """Return the `sha256:<hex>` content digest of the default manifest serialization.
+
+    Quoted, it doubles as a strong HTTP ETag for mirrors serving the manifest.
+    """
+
+    return "sha256:" + hashlib.sha256(manifest_bytes()).hexdigest()
+
+
+def digest_path(path: str | Path) -> Path:
+    """Return the sidecar digest path for a manifest path (`<name>.sha256`)."""
+
+    manifest_path = Path(path)
+    return manifest_path.with_name(manifest_path.name + DIGEST_SUFFIX)
+
+
+def read_digest(path: str | Path) -> str | None:
+    """Return the digest recorded in a manifest's sidecar, or None when there is none.
+
+    The sidecar uses `sha256sum` format (`<hex>  <file name>`), so it can also be
+    verified with `sha256sum -c`.
+    """
+
+    try:
+        fields = digest_path(path).read_text(encoding="utf-8").split()
+    except OSError:
+        return None
+    return f"sha256:{fields[0].lower()}" if fields else None
 
 
 def write_install_manifest(path: str | Path) -> None:
-    """Write the generated install manifest to a path."""
+    """Write the generated install manifest and its sidecar digest to a path."""
 
-    Path(path).write_text(manifest_json(), encoding="utf-8")
+    manifest_path = Path(path)
+    manifest_path.write_bytes(manifest_bytes())
+    hex_digest = manifest_digest().split(":", 1)[1]
+    digest_path(manifest_path).write_text(
+        f"{hex_digest}  {manifest_path.name}\n", encoding="utf-8"
+    )
 
 
 def check_install_manifest(path: str | Path) -> tuple[bool, str]:
-    """Compare a checked-in manifest file with the generated manifest."""
+    """Compare a checked-in manifest file with the generated manifest.
+
+    The sidecar digest and the file size are compared first, so a stale manifest is
+    usually detected without reading it; otherwise the file is hashed, never parsed.
+    """
 
     manifest_path = Path(path)
-    expected = manifest_json()
-    actual = manifest_path.read_text(encoding="utf-8")
-    if actual == expected:
-        return True, f"{manifest_path} is up to date"
-    return False, f"{manifest_path} differs from generated AbstractFramework install manifest"
+    expected = manifest_digest()
+    stale = f"{manifest_path} differs from generated AbstractFramework install manifest"
+    recorded = read_digest(manifest_path)
+    if recorded is not None and recorded != expected:
+        return False, f"{stale} (digest {recorded}, expected {expected})"
+    if manifest_path.stat().st_size != len(manifest_bytes()):
+        return False, stale
+    actual = "sha256:" + hashlib.sha256(manifest_path.read_bytes()).hexdigest()
+    if actual != expected:
+        return False, stale
+    if recorded is None and digest_path(manifest_path).exists():
+        return False, f"{digest_path(manifest_path)} is not a valid digest file"
+    return True, f"{manifest_path} is up to date ({expected})"
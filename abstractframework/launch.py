@@ -0,0 +1,474 @@
+"""Concurrent launcher for the Gateway + Flow (+ Observer) stack.
+
+The service commands come from `post_install.gateway_flow` in the install manifest
+(plus the Observer npm app); the npm apps run from the `npm warm` prefix when it is
+fresh. All services start at once; each one is then probed on its own thread with
+exponential backoff (a few milliseconds at first) over one reused HTTP connection,
+and a watcher thread per process wakes every waiter as soon as any child exits, so
+neither readiness nor failures wait on a fixed sleep.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import os
+import signal
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Mapping, Sequence
+
+from .install_manifest import build_install_manifest
+from .npmwarm import resolve_npm_command
+
+DEFAULT_STARTUP_TIMEOUT_S = 90.0
+DEFAULT_SERVICES = ("gateway", "flow", "observer")
+DEFAULT_PORTS = {"gateway": 8080, "flow": 3000, "observer": 3001}
+DEFAULT_GATEWAY_TOKEN = "local-dev-token"
+INITIAL_BACKOFF_S = 0.005
+MAX_BACKOFF_S = 0.25
+_PROBE_TIMEOUT_S = 2.0
+
+
+class LaunchError(RuntimeError):
+    """Raised when a service fails to start or does not become ready in time."""
+
+
+def connect_host(host: str) -> str:
+    """Return the address to probe a service bound to `host` on (loopback for wildcards)."""
+
+    return "127.0.0.1" if host in {"0.0.0.0", "::", ""} else host
+
+
+@dataclass(frozen=True)
+class Probe:
+    """One readiness stage: a GET to `path`.
+
+    Like the shell launchers, any answer below 500 counts as up (an auth-protected or
+    missing page still means the server is serving). A probe with `validate` checks a
+    payload instead, so it needs a success status and a body that passes.
+    """
+
+    label: str
+    path: str
+    headers: Mapping[str, str] = field(default_factory=dict)
+    validate: Callable[[bytes], bool] | None = None
+
+
+@dataclass
+class Service:
+    name: str
+    command: list[str]
+    host: str
+    port: int
+    probes: tuple[Probe, ...]
+    env: dict[str, str] = field(default_factory=dict)
+    unset_env: tuple[str, ...] = ()
+
+    @property
+    def connect_host(self) -> str:
+        return connect_host(self.host)
+
+
+@dataclass
+class StageTiming:
+    label: str
+    ready_at: float
+    attempts: int
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "label": self.label,
+            "ready_ms": round(self.ready_at * 1000, 3),
+            "attempts": self.attempts,
+        }
+
+
+@dataclass
+class ServiceReport:
+    name: str
+    status: str = "starting"
+    spawn: float = 0.0
+    stages: list[StageTiming] = field(default_factory=list)
+    ready_at: float | None = None
+    log: Path | None = None
+    detail: str = ""
+
+    def as_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "name": self.name,
+            "status": self.status,
+            "spawn_ms": round(self.spawn * 1000, 3),
+            "stages": [stage.as_dict() for stage in self.stages],
+            "ready_ms": round(self.ready_at * 1000, 3) if self.ready_at is not None else None,
+        }
+        if self.log is not None:
+            data["log"] = str(self.log)
+        if self.detail:
+            data["detail"] = self.detail
+        return data
+
+
+def gateway_contract_ok(body: bytes) -> bool:
+    """Return whether a capabilities payload exposes the contract Flow depends on."""
+
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return False
+    caps = payload.get("capabilities") if isinstance(payload, dict) else None
+    contracts = caps.get("contracts") if isinstance(caps, dict) else None
+    common = contracts.get("common") if isinstance(contracts, dict) else None
+    flow_editor = contracts.get("flow_editor") if isinstance(contracts, dict) else None
+    prompt_cache = common.get("prompt_cache") if isinstance(common, dict) else None
+    durable_blocs = prompt_cache.get("durable_blocs") if isinstance(prompt_cache, dict) else None
+    model_residency = common.get("model_residency") if isinstance(common, dict) else None
+    runs = flow_editor.get("runs") if isinstance(flow_editor, dict) else None
+    ledger = flow_editor.get("ledger") if isinstance(flow_editor, dict) else None
+    return all(
+        (
+            isinstance(contracts, dict),
+            isinstance(common, dict),
+            isinstance(flow_editor, dict) and bool(flow_editor.get("available", True)),
+            bool((runs or {}).get("start", {}).get("endpoint")),
+            bool((ledger or {}).get("stream", {}).get("endpoint")),
+            prompt_cache is None or isinstance(prompt_cache, dict),
+            durable_blocs is None or isinstance(durable_blocs, dict),
+            model_residency is None or isinstance(model_residency, dict),
+        )
+    )
+
+
+def _npx(command: Sequence[str]) -> list[str]:
+    # `npx` prompts before installing a package it has not cached; there is no TTY.
+    if command and command[0] == "npx" and "--yes" not in command:
+        return ["npx", "--yes", *command[1:]]
+    return list(command)
+
+
+def default_services(
+    names: Sequence[str] = DEFAULT_SERVICES,
+    *,
+    host: str = "0.0.0.0",
+    ports: Mapping[str, int] | None = None,
+    token: str = DEFAULT_GATEWAY_TOKEN,
+    data_dir: str | Path | None = None,
+    npm_prefix: str | Path | None = None,
+) -> list[Service]:
+    """Return the manifest's Gateway/Flow commands (and the Observer app) as services.
+
+    Flags and environment match `scripts/gateway-flow.sh`: the Gateway is given the
+    auth token and data directory, and Flow/Observer point at its loopback URL
+    without inheriting the token. Flow and Observer run from the warm prefix
+    (`npm_prefix`, default: the one for the current pins) when it holds the pinned
+    versions, and through `npx` otherwise.
+    """
+
+    manifest = build_install_manifest()
+    commands = {
+        name: list(command) for name, command in manifest["post_install"]["gateway_flow"].items()
+    }
+    for app in manifest["npm_apps"]:
+        commands.setdefault(app["id"], app["command"].split())
+    port = {**DEFAULT_PORTS, **(ports or {})}
+    gateway_url = f"http://{connect_host(host)}:{port['gateway']}"
+
+    services: list[Service] = []
+    for name in names:
+        if name not in DEFAULT_SERVICES or name not in commands:
+            raise LaunchError(f"unknown service {name!r} (expected one of {DEFAULT_SERVICES})")
+        if name == "gateway":
+            env = {
+                "ABSTRACTGATEWAY_HOST": host,
+                "ABSTRACTGATEWAY_PORT": str(port["gateway"]),
+                "ABSTRACTGATEWAY_AUTH_TOKEN": token,
+                "ABSTRACTGATEWAY_USER_AUTH": os.environ.get("ABSTRACTGATEWAY_USER_AUTH", "1"),
+                "ABSTRACTGATEWAY_ALLOWED_ORIGINS": os.environ.get(
+                    "ABSTRACTGATEWAY_ALLOWED_ORIGINS", "http://localhost:*,http://127.0.0.1:*"
+                ),
+            }
+            if data_dir is not None:
+                env["ABSTRACTGATEWAY_DATA_DIR"] = str(data_dir)
+            services.append(
+                Service(
+                    name,
+                    [*commands[name], "--host", host, "--port", str(port["gateway"])],
+                    host,
+                    port["gateway"],
+                    (
+                        Probe("health", "/api/health"),
+                        Probe(
+                            "contract",
+                            "/api/gateway/discovery/capabilities",
+                            {"Authorization": f"Bearer {token}"},
+                            gateway_contract_ok,
+                        ),
+                    ),
+                    env,
+                )
+            )
+        elif name == "flow":
+            services.append(
+                Service(
+                    name,
+                    [
+                        *_npx(resolve_npm_command(commands[name], npm_prefix)),
+                        "--host",
+                        host,
+                        "--port",
+                        str(port["flow"]),
+                        "--gateway-url",
+                        gateway_url,
+                    ],
+                    host,
+                    port["flow"],
+                    (Probe("health", "/api/health"), Probe("ui", "/")),
+                    {"PORT": str(port["flow"])},
+                    ("ABSTRACTGATEWAY_AUTH_TOKEN",),
+                )
+            )
+        else:
+            services.append(
+                Service(
+                    name,
+                    _npx(resolve_npm_command(commands[name], npm_prefix)),
+                    host,
+                    port["observer"],
+                    (Probe("ui", "/"),),
+                    {
+                        "HOST": host,
+                        "PORT": str(port["observer"]),
+                        "ABSTRACTOBSERVER_GATEWAY_URL": os.environ.get(
+                            "ABSTRACTOBSERVER_GATEWAY_URL", gateway_url
+                        ),
+                    },
+                    ("ABSTRACTGATEWAY_AUTH_TOKEN",),
+                )
+            )
+    return services
+
+
+class HttpProber:
+    """Issue readiness GETs to one host/port over a single kept-alive connection.
+
+    A failed request drops the connection; `http.client` reconnects on the next one.
+    """
+
+    def __init__(self, host: str, port: int, timeout: float = _PROBE_TIMEOUT_S) -> None:
+        self.connection = http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def get(
+        self, path: str, headers: Mapping[str, str] | None = None
+    ) -> tuple[int, bytes] | None:
+        try:
+            self.connection.request("GET", path, headers=dict(headers or {}))
+            response = self.connection.getresponse()
+            return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            self.connection.close()
+            return None
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+def wait_ready(
+    service: Service,
+    process: subprocess.Popen[bytes],
+    report: ServiceReport,
+    origin: float,
+    deadline: float,
+    wake: threading.Event,
+) -> None:
+    """Run the service's probes in order, updating `report`.
+
+    Waits between attempts grow from `INITIAL_BACKOFF_S` to `MAX_BACKOFF_S` and end
+    early when `wake` is set (a child exited), so exits are noticed immediately.
+    """
+
+    prober = HttpProber(service.connect_host, service.port)
+    try:
+        for probe in service.probes:
+            delay = INITIAL_BACKOFF_S
+            attempts = 0
+            while True:
+                if process.poll() is not None:
+                    report.status = "exited"
+                    report.detail = f"exited with {process.returncode} before {probe.label}"
+                    return
+                if wake.is_set():
+                    report.status = "aborted"
+                    return
+                attempts += 1
+                result = prober.get(probe.path, probe.headers)
+                if result is not None and (
+                    result[0] < 500
+                    if probe.validate is None
+                    else result[0] < 400 and probe.validate(result[1])
+                ):
+                    report.stages.append(
+                        StageTiming(probe.label, time.perf_counter() - origin, attempts)
+                    )
+                    break
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    report.status = "timeout"
+                    report.detail = f"{probe.label} not ready after {attempts} probes"
+                    return
+                wake.wait(min(delay, remaining))
+                delay = min(delay * 2, MAX_BACKOFF_S)
+        report.status = "ready"
+        report.ready_at = time.perf_counter() - origin
+    finally:
+        prober.close()
+
+
+def _terminate(process: subprocess.Popen[bytes], grace: float = 5.0) -> None:
+    if process.poll() is not None:
+        return
+    try:
+        if os.name == "posix":
+            # npx runs the app as a grandchild; signal the whole session.
+            os.killpg(process.pid, signal.SIGTERM)
+        else:
+            process.terminate()
+        process.wait(timeout=grace)
+    except (OSError, subprocess.TimeoutExpired):
+        process.kill()
+        process.wait()
+
+
+@dataclass
+class Launch:
+    services: list[Service]
+    processes: dict[str, subprocess.Popen[bytes]]
+    reports: dict[str, ServiceReport]
+    exited: threading.Event
+    elapsed: float = 0.0
+
+    @property
+    def ready(self) -> bool:
+        return all(report.status == "ready" for report in self.reports.values())
+
+    def first_exit(self) -> str | None:
+        for name, process in self.processes.items():
+            if process.poll() is not None:
+                return name
+        return None
+
+    def stop(self) -> None:
+        for process in self.processes.values():
+            _terminate(process)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "elapsed_ms": round(self.elapsed * 1000, 3),
+            "services": [report.as_dict() for report in self.reports.values()],
+        }
+
+
+def launch_services(
+    services: Sequence[Service],
+    log_dir: str | Path,
+    timeout: float = DEFAULT_STARTUP_TIMEOUT_S,
+) -> Launch:
+    """Start every service at once and wait until all are ready or one fails.
+
+    Returns with the processes still running. When a service is not ready, every
+    process has been stopped already and the failing report says why.
+    """
+
+    log_dir = Path(log_dir)
+    log_dir.mkdir(parents=True, exist_ok=True)
+    exited = threading.Event()
+    origin = time.perf_counter()
+    deadline = origin + timeout
+    processes: dict[str, subprocess.Popen[bytes]] = {}
+    reports: dict[str, ServiceReport] = {}
+    launch = Launch(list(services), processes, reports, exited)
+
+    def _watch(process: subprocess.Popen[bytes]) -> None:
+        process.wait()
+        exited.set()
+
+    try:
+        for service in services:
+            report = reports[service.name] = ServiceReport(service.name)
+            report.log = log_dir / f"{service.name}.log"
+            env = {k: v for k, v in os.environ.items() if k not in service.unset_env}
+            env.update(service.env)
+            started = time.perf_counter()
+            with open(report.log, "wb") as log:
+                processes[service.name] = subprocess.Popen(
+                    service.command,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    stdin=subprocess.DEVNULL,
+                    env=env,
+                    start_new_session=os.name == "posix",
+                )
+            report.spawn = time.perf_counter() - started
+            threading.Thread(
+                target=_watch,
+                args=(processes[service.name],),
+                name=f"watch-{service.name}",
+                daemon=True,
+            ).start()
+    except OSError as exc:
+        reports[service.name].status = "failed"
+        reports[service.name].detail = f"{service.command[0]}: {exc.strerror or exc}"
+        launch.stop()
+        launch.elapsed = time.perf_counter() - origin
+        return launch
+
+    waiters = [
+        threading.Thread(
+            target=wait_ready,
+            args=(service, processes[name], reports[name], origin, deadline, exited),
+            name=f"ready-{name}",
+        )
+        for service in services
+        for name in (service.name,)
+    ]
+    for waiter in waiters:
+        waiter.start()
+    for waiter in waiters:
+        waiter.join()
+    launch.elapsed = time.perf_counter() - origin
+    if not launch.ready:
+        launch.stop()
+    return launch
+
+
+def log_tail(path: Path | None, lines: int = 40) -> list[str]:
+    if path is None or not path.exists():
+        return []
+    return path.read_text(encoding="utf-8", errors="replace").splitlines()[-lines:]
+
+
+def resolve_token(runtime_dir: Path) -> str:
+    """Return the Gateway token the way `scripts/gateway-flow.sh` picks it."""
+
+    token = os.environ.get("ABSTRACTGATEWAY_AUTH_TOKEN")
+    if token:
+        return token
+    token_file = runtime_dir / "dev" / "gateway-token"
+    try:
+        return token_file.read_text(encoding="utf-8").strip() or DEFAULT_GATEWAY_TOKEN
+    except OSError:
+        return DEFAULT_GATEWAY_TOKEN
+
+
+def wait_for_exit(launch: Launch) -> str | None:
+    """Block until any service exits and return its name (None if interrupted)."""
+
+    try:
+        launch.exited.wait()
+    except KeyboardInterrupt:
+        return None
+    return launch.first_exit()
+
@@ -0,0 +1,236 @@
+"""Random-access reader for `llms-full.txt` sections.
+
+`scripts/gen_llms_full.py` writes `llms-full.index.json` next to `llms-full.txt`,
+mapping every `--- <path> ---` section to its byte offset, length, and SHA-256. The
+reader loads that small index and memory-maps the text file, so fetching a few
+sections touches only their pages instead of reading the whole ~500 KB corpus.
+
+The package build (`setup.py`) copies the three generated files into the package's
+`data/` directory, so installed wheels can read them through `importlib.resources`.
+
+The index also defines token-budgeted context packs (for example `8k`, `32k`,
+`128k`): the highest-priority sections that fit each budget, in a fixed order, so a
+smaller pack is always a byte prefix of a larger one and shares its prompt cache.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import importlib.resources
+import json
+import mmap
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Iterable
+
+INDEX_FORMAT = 3
+LLMS_FULL_ENV = "ABSTRACTFRAMEWORK_LLMS_FULL"
+PACKAGE_DATA_DIR = "data"
+
+
+class LlmsFullError(RuntimeError):
+    """Raised when `llms-full.txt` or its index is missing, unreadable, or stale."""
+
+
+def index_path(path: str | Path) -> Path:
+    """Return the index path for a generated file (`llms-full.txt` -> `llms-full.index.json`)."""
+
+    path = Path(path)
+    return path.with_name(f"{path.stem}.index.json")
+
+
+def packaged_llms_full_path() -> Path:
+    """Return the `llms-full.txt` shipped in the package's `data/` directory."""
+
+    resource = importlib.resources.files(__package__) / PACKAGE_DATA_DIR / "llms-full.txt"
+    # Installed wheels are unpacked on disk; the reader memory-maps a real file.
+    return Path(str(resource))
+
+
+def default_llms_full_path() -> Path:
+    """Return `$ABSTRACTFRAMEWORK_LLMS_FULL`, the packaged copy, or the checkout's file."""
+
+    override = os.environ.get(LLMS_FULL_ENV)
+    if override:
+        return Path(override).expanduser()
+    packaged = packaged_llms_full_path()
+    checkout = Path(__file__).resolve().parents[1] / "llms-full.txt"
+    return checkout if not packaged.is_file() and checkout.is_file() else packaged
+
+
+@dataclass(frozen=True)
+class Section:
+    path: str
+    offset: int
+    length: int
+    sha256: str
+    tokens: int = 0
+    tier: str = "core"
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "path": self.path,
+            "offset": self.offset,
+            "length": self.length,
+            "sha256": self.sha256,
+            "tokens": self.tokens,
+            "tier": self.tier,
+        }
+
+
+@dataclass(frozen=True)
+class ContextPack:
+    name: str
+    budget: int
+    tokens: int
+    sections: tuple[str, ...]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "budget": self.budget,
+            "tokens": self.tokens,
+            "sections": list(self.sections),
+        }
+
+
+class LlmsFull:
+    """Sections of a generated `llms-full.txt`, read through its offset index.
+
+    The text file is memory-mapped on first access; use the reader as a context
+    manager (or call `close()`) to release the mapping.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path is not None else default_llms_full_path()
+        self.index_path = index_path(self.path)
+        try:
+            index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            raise LlmsFullError(
+                f"cannot read {self.index_path}: {exc}; run scripts/gen_llms_full.py"
+            ) from exc
+        if not isinstance(index, dict) or index.get("format") != INDEX_FORMAT:
+            raise LlmsFullError(
+                f"{self.index_path} has an unsupported format; run scripts/gen_llms_full.py"
+            )
+        self.size: int = index["size"]
+        self.sha256: str = index.get("sha256", "")
+        self.sections: dict[str, Section] = {
+            entry["path"]: Section(
+                entry["path"],
+                entry["offset"],
+                entry["length"],
+                entry["sha256"],
+                entry.get("tokens", 0),
+                entry.get("tier", "core"),
+            )
+            for entry in index["sections"]
+        }
+        self.pack_header: str = index.get("pack_header", "")
+        self.packs: dict[str, ContextPack] = {
+            name: ContextPack(name, pack["budget"], pack["tokens"], tuple(pack["sections"]))
+            for name, pack in index.get("packs", {}).items()
+        }
+        self._file: Any = None
+        self._map: mmap.mmap | None = None
+
+    def __enter__(self) -> LlmsFull:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __contains__(self, path: object) -> bool:
+        return path in self.sections
+
+    @property
+    def paths(self) -> list[str]:
+        return list(self.sections)
+
+    def _mapping(self) -> mmap.mmap:
+        if self._map is None:
+            try:
+                handle = open(self.path, "rb")
+            except OSError as exc:
+                raise LlmsFullError(f"cannot open {self.path}: {exc}") from exc
+            size = os.fstat(handle.fileno()).st_size
+            if size != self.size or size == 0:
+                handle.close()
+                raise LlmsFullError(
+                    f"{self.path} is {size} bytes but its index expects {self.size}; "
+                    "run scripts/gen_llms_full.py"
+                )
+            self._file = handle
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def match(self, patterns: Iterable[str]) -> list[str]:
+        """Return the section paths matching any exact path or glob, in file order."""
+
+        patterns = list(patterns)
+        missing = [p for p in patterns if not any(_matches(path, p) for path in self.sections)]
+        if missing:
+            raise KeyError(f"no llms-full section matches {', '.join(map(repr, missing))}")
+        return [path for path in self.sections if any(_matches(path, p) for p in patterns)]
+
+    def read_bytes(self, path: str, *, verify: bool = False) -> bytes:
+        """Return the raw text of one section; `verify` checks it against the index hash."""
+
+        try:
+            section = self.sections[path]
+        except KeyError:
+            raise KeyError(f"no llms-full section {path!r}") from None
+        data = self._mapping()[section.offset : section.offset + section.length]
+        if verify and hashlib.sha256(data).hexdigest() != section.sha256:
+            raise LlmsFullError(f"section {path!r} does not match its index hash")
+        return data
+
+    def read(self, path: str, *, verify: bool = False) -> str:
+        return self.read_bytes(path, verify=verify).decode("utf-8")
+
+    def select(self, *patterns: str, verify: bool = False) -> dict[str, str]:
+        """Return `{path: text}` for the sections matching `patterns` (paths or globs)."""
+
+        return {path: self.read(path, verify=verify) for path in self.match(patterns)}
+
+    def pack(self, name: str, *, verify: bool = False) -> str:
+        """Return the text of context pack `name`: the pack header, then its sections."""
+
+        try:
+            pack = self.packs[name]
+        except KeyError:
+            known = ", ".join(self.packs) or "none"
+            raise KeyError(f"no context pack {name!r} (available: {known})") from None
+        parts = [self.pack_header]
+        for path in pack.sections:
+            parts.append(f"\n--- {path} ---\n")
+            parts.append(self.read(path, verify=verify))
+        return "".join(parts)
+
+
+def _matches(path: str, pattern: str) -> bool:
+    return path == pattern or fnmatch.fnmatchcase(path, pattern)
+
+
+def read_sections(*patterns: str, path: str | Path | None = None) -> dict[str, str]:
+    """Return `{path: text}` for the matching sections of `llms-full.txt`."""
+
+    with LlmsFull(path) as docs:
+        return docs.select(*patterns)
@@ -0,0 +1,335 @@
+"""Hash-pinned, platform-tagged lock files for the install profiles.
+
+A profile's `pip_requirements` are a single `abstractframework[...]==X` line, so every
+install re-runs pip's resolver over the whole dependency tree. `write_lock()` resolves a
+profile once, with `pip install --dry-run --report` against an index or a local wheel
+directory, and writes the result as a requirements file that pins every distribution
+to one wheel by SHA-256:
+
+    python -m pip install --no-deps --require-hashes --only-binary=:all: -r <lock>
+
+Locks are tagged with the target interpreter and platform, and listed in an
+`index.json` next to them.
+Environment markers are evaluated by pip for the machine running the resolve, so a
+lock for another operating system should be produced on that operating system.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import subprocess
+import sys
+import sysconfig
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Sequence
+from urllib.parse import unquote, urlparse
+
+from . import __version__
+from .distributions import normalize_name
+from .install_manifest import LOCK_INSTALL_COMMAND, build_install_manifest
+
+LOCK_INDEX_FORMAT = 1
+LOCK_INDEX_NAME = "index.json"
+DEFAULT_LOCK_TIMEOUT_S = 600.0
+
+
+class LockError(RuntimeError):
+    """Raised when a profile cannot be resolved into a lock."""
+
+
+@dataclass(frozen=True)
+class LockTarget:
+    """The interpreter and platform a lock is resolved for."""
+
+    python_version: str
+    platforms: tuple[str, ...]
+    implementation: str = "cp"
+
+    @property
+    def tag(self) -> str:
+        return f"{self.implementation}{self.python_version.replace('.', '')}-{self.platforms[0]}"
+
+    def pip_options(self, target_dir: str) -> list[str]:
+        options = ["--target", target_dir, "--implementation", self.implementation]
+        options += ["--python-version", self.python_version]
+        options += ["--abi", f"{self.implementation}{self.python_version.replace('.', '')}"]
+        for platform_tag in self.platforms:
+            options += ["--platform", platform_tag]
+        return options
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "tag": self.tag,
+            "implementation": self.implementation,
+            "python_version": self.python_version,
+            "platforms": list(self.platforms),
+        }
+
+
+def current_target() -> LockTarget:
+    """Return the lock target of the running interpreter."""
+
+    platform_tag = sysconfig.get_platform().replace("-", "_").replace(".", "_")
+    implementation = {"cpython": "cp", "pypy": "pp"}.get(sys.implementation.name, "py")
+    python_version = f"{sys.version_info[0]}.{sys.version_info[1]}"
+    return LockTarget(python_version, (platform_tag,), implementation)
+
+
+def supported_platforms() -> tuple[str, ...]:
+    """Return every platform tag this machine's wheels may carry, the native tag first.
+
+    `sysconfig` only names the native tag (`linux_x86_64`), which no index wheel uses on
+    Linux; `packaging.tags` adds the manylinux, musllinux, or older macOS tags that pip
+    accepts for a native install. Raises `LockError` when `packaging` is not installed.
+    """
+
+    try:
+        from packaging import tags
+    except ImportError as exc:
+        raise LockError(
+            "packaging is not installed, so this host's platform tags are unknown; "
+            "pass --platform explicitly"
+        ) from exc
+    native = current_target().platforms[0]
+    platforms = dict.fromkeys([native, *(tag.platform for tag in tags.sys_tags())])
+    platforms.pop("any", None)
+    return tuple(platforms)
+
+
+def lock_target(
+    python_version: str | None = None, platforms: Sequence[str] = ()
+) -> LockTarget | None:
+    """Return the target for `--python-version`/`--platform`, or None for this interpreter.
+
+    Without `platforms`, a target for another Python version takes every platform tag
+    of this host (`supported_platforms()`), so pip still accepts the manylinux wheels a
+    native resolve would pick. The lock tag keeps naming the native platform.
+    """
+
+    if not python_version and not platforms:
+        return None
+    default = current_target()
+    return LockTarget(
+        python_version or default.python_version,
+        tuple(platforms) or supported_platforms(),
+        default.implementation,
+    )
+
+
+@dataclass(frozen=True)
+class LockedDistribution:
+    name: str
+    version: str
+    sha256: str
+    filename: str
+
+    def as_dict(self) -> dict[str, str]:
+        return {
+            "name": self.name,
+            "version": self.version,
+            "sha256": self.sha256,
+            "filename": self.filename,
+        }
+
+
+def _profile_requirements(profile_id: str) -> list[str]:
+    profiles = {entry["id"]: entry for entry in build_install_manifest()["profiles"]}
+    if profile_id not in profiles:
+        raise LockError(f"unknown profile {profile_id!r} (known: {', '.join(profiles)})")
+    return list(profiles[profile_id]["pip_requirements"])
+
+
+def _artifact_sha256(item: dict[str, Any]) -> str:
+    download = item.get("download_info", {})
+    hashes = download.get("archive_info", {}).get("hashes", {})
+    if "sha256" in hashes:
+        return hashes["sha256"]
+    url = urlparse(download.get("url", ""))
+    if url.scheme != "file":
+        raise LockError(f"pip reported no sha256 for {download.get('url')}")
+    digest = hashlib.sha256()
+    with open(unquote(url.path), "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def resolve_profile(
+    profile_id: str,
+    *,
+    find_links: str | Path | None = None,
+    index_url: str | None = None,
+    target: LockTarget | None = None,
+    timeout: float = DEFAULT_LOCK_TIMEOUT_S,
+) -> tuple[list[LockedDistribution], dict[str, Any]]:
+    """Resolve `profile_id` to wheels with pip and return `(distributions, environment)`.
+
+    With only `find_links`, pip runs with `--no-index`, so the resolve is fully offline.
+    `environment` holds the marker values pip evaluated requirements with.
+    """
+
+    requirements = _profile_requirements(profile_id)
+    command = [sys.executable, "-m", "pip", "install", "--dry-run", "--ignore-installed"]
+    command += ["--quiet", "--report", "-", "--only-binary=:all:", "--disable-pip-version-check"]
+    if find_links is not None:
+        command += ["--find-links", str(find_links)]
+        if index_url is None:
+            command.append("--no-index")
+    if index_url is not None:
+        command += ["--index-url", index_url]
+    with tempfile.TemporaryDirectory(prefix="abstractframework-lock-") as scratch:
+        if target is not None:
+            command += target.pip_options(scratch)
+        command += requirements
+        try:
+            result = subprocess.run(
+                command, capture_output=True, text=True, timeout=timeout, check=False
+            )
+        except subprocess.TimeoutExpired as exc:
+            raise LockError(f"resolving {profile_id} timed out after {timeout:g}s") from exc
+    if result.returncode != 0:
+        tail = "\n".join(result.stderr.strip().splitlines()[-5:])
+        raise LockError(f"pip could not resolve profile {profile_id}:\n{tail}")
+    try:
+        report = json.loads(result.stdout)
+    except ValueError as exc:
+        raise LockError(f"pip did not produce an installation report: {exc}") from exc
+
+    distributions = [
+        LockedDistribution(
+            normalize_name(item["metadata"]["name"]),
+            item["metadata"]["version"],
+            _artifact_sha256(item),
+            unquote(urlparse(item["download_info"]["url"]).path.rsplit("/", 1)[-1]),
+        )
+        for item in report.get("install", [])
+    ]
+    distributions.sort(key=lambda distribution: distribution.name)
+    return distributions, report.get("environment", {})
+
+
+def lock_filename(profile_id: str, target: LockTarget) -> str:
+    return f"{profile_id}-{target.tag}.txt"
+
+
+def render_lock(
+    profile_id: str,
+    target: LockTarget,
+    distributions: Sequence[LockedDistribution],
+    environment: dict[str, Any],
+) -> str:
+    """Return the lock as a `--require-hashes` requirements file."""
+
+    markers = ", ".join(
+        f"{key}={environment[key]}"
+        for key in ("sys_platform", "platform_machine", "python_version")
+        if key in environment
+    )
+    lines = [
+        f"# AbstractFramework {__version__} lock for install profile {profile_id!r}",
+        f"# Target: {target.tag} (platforms: {', '.join(target.platforms)})",
+    ]
+    if markers:
+        lines.append(f"# Markers evaluated for: {markers}")
+    lines += [
+        f"# Generated by: abstractframework manifest --lock {profile_id}",
+        f"# Install: {' '.join(LOCK_INSTALL_COMMAND)} {lock_filename(profile_id, target)}",
+    ]
+    for distribution in distributions:
+        lines.append(f"{distribution.name}=={distribution.version} \\")
+        lines.append(f"    --hash=sha256:{distribution.sha256}")
+    return "\n".join(lines) + "\n"
+
+
+def read_lock_index(directory: str | Path) -> dict[str, Any]:
+    """Return the lock index in `directory`, or an empty one when missing or unreadable."""
+
+    try:
+        index = json.loads((Path(directory) / LOCK_INDEX_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        index = None
+    if not isinstance(index, dict) or index.get("format") != LOCK_INDEX_FORMAT:
+        return {"format": LOCK_INDEX_FORMAT, "locks": []}
+    return index
+
+
+def write_lock(
+    directory: str | Path,
+    profile_id: str,
+    *,
+    find_links: str | Path | None = None,
+    index_url: str | None = None,
+    target: LockTarget | None = None,
+    timeout: float = DEFAULT_LOCK_TIMEOUT_S,
+) -> dict[str, Any]:
+    """Resolve `profile_id`, write its lock into `directory`, and update the lock index.
+
+    Index entries from another framework version, or for the same profile and target,
+    are replaced. Returns the new index entry.
+    """
+
+    explicit_target = target
+    target = target or current_target()
+    distributions, environment = resolve_profile(
+        profile_id,
+        find_links=find_links,
+        index_url=index_url,
+        target=explicit_target,
+        timeout=timeout,
+    )
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    filename = lock_filename(profile_id, target)
+    text = render_lock(profile_id, target, distributions, environment)
+    (directory / filename).write_text(text, encoding="utf-8")
+
+    entry = {
+        "profile": profile_id,
+        "framework_version": __version__,
+        "target": target.as_dict(),
+        "path": filename,
+        "sha256": hashlib.sha256(text.encode("utf-8")).hexdigest(),
+        "distributions": len(distributions),
+        "wheels": [distribution.as_dict() for distribution in distributions],
+    }
+    index = read_lock_index(directory)
+    locks = [
+        lock
+        for lock in index["locks"]
+        if lock.get("framework_version") == __version__ and lock.get("path") != filename
+    ]
+    locks.append(entry)
+    locks.sort(key=lambda lock: (lock["profile"], lock["path"]))
+    index = {"format": LOCK_INDEX_FORMAT, "locks": locks}
+    (directory / LOCK_INDEX_NAME).write_text(
+        json.dumps(index, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    return entry
+
+
+def find_lock(
+    directory: str | Path, profile_id: str, target: LockTarget | None = None
+) -> Path | None:
+    """Return the lock for `profile_id` and `target` (default: this interpreter), if any.
+
+    The lock file's digest must match the index, so a hand-edited lock is not used.
+    """
+
+    tag = (target or current_target()).tag
+    directory = Path(directory)
+    for lock in read_lock_index(directory)["locks"]:
+        if (
+            lock.get("profile") == profile_id
+            and lock.get("framework_version") == __version__
+            and lock.get("target", {}).get("tag") == tag
+        ):
+            path = directory / lock["path"]
+            try:
+                digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            except OSError:
+                return None
+            return path if digest == lock.get("sha256") else None
+    return None
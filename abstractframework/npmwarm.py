@@ -0,0 +1,228 @@
+"""Pre-warmed local installs of the pinned npm apps.
+
+The install manifest starts the browser UIs with `npx @abstractframework/<app>`, which
+fetches and installs the package whenever npx's cache is cold or has been cleared.
+`warm_npm_apps()` installs `NPM_RELEASE_VERSIONS` once into a local prefix and records
+the binary `npx` would have run for each package:
+
+    <cache dir>/npm/<pins key>/
+        node_modules/          npm install --prefix of the pinned packages
+        warm.json              pins plus the resolved binary of each app
+
+The prefix name is derived from the pins, so a release with new pins gets a fresh
+prefix. `resolve_npm_command()` swaps `npx <package>` for the warmed binary while the
+prefix still holds the pinned version, and leaves the command alone otherwise.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+from . import NPM_RELEASE_VERSIONS
+from .cache import user_cache_dir
+
+WARM_FORMAT = 1
+WARM_RECORD = "warm.json"
+DEFAULT_WARM_TIMEOUT_S = 600.0
+
+
+class NpmWarmError(RuntimeError):
+    """Raised when the pinned npm apps cannot be installed into the warm prefix."""
+
+
+def npm_tarball_name(package: str, version: str) -> str:
+    """Return the file name `npm pack` gives a package (`@scope/name` -> `scope-name-X.tgz`)."""
+
+    return f"{package.lstrip('@').replace('/', '-')}-{version}.tgz"
+
+
+def pins_key(pins: Mapping[str, str] = NPM_RELEASE_VERSIONS) -> str:
+    """Return a short, stable key for a set of npm pins."""
+
+    text = json.dumps(dict(pins), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def warm_root() -> Path:
+    return user_cache_dir() / "npm"
+
+
+def warm_prefix(pins: Mapping[str, str] = NPM_RELEASE_VERSIONS) -> Path:
+    """Return the versioned prefix the npm apps pinned by `pins` are warmed into."""
+
+    return warm_root() / pins_key(pins)
+
+
+def _package_json(prefix: Path, package: str) -> dict[str, Any] | None:
+    try:
+        data = json.loads(
+            (prefix / "node_modules" / package / "package.json").read_text(encoding="utf-8")
+        )
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _bin_name(package: str, data: Mapping[str, Any]) -> str | None:
+    """Return the binary `npx <package>` runs: the one named after it, or the only one."""
+
+    unscoped = package.rsplit("/", 1)[-1]
+    bins = data.get("bin")
+    if isinstance(bins, str):
+        return unscoped
+    if not isinstance(bins, dict) or not bins:
+        return None
+    if unscoped in bins:
+        return unscoped
+    return next(iter(bins)) if len(bins) == 1 else None
+
+
+def _bin_path(prefix: Path, name: str) -> Path:
+    path = prefix / "node_modules" / ".bin" / name
+    if os.name == "nt":
+        return path.with_name(f"{name}.cmd")
+    return path
+
+
+def read_warm_record(prefix: str | Path | None = None) -> dict[str, Any] | None:
+    """Return the `warm.json` record of `prefix` (default: current pins), if readable."""
+
+    prefix = Path(prefix) if prefix is not None else warm_prefix()
+    try:
+        record = json.loads((prefix / WARM_RECORD).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(record, dict) or record.get("format") != WARM_FORMAT:
+        return None
+    return record
+
+
+def warm_status(
+    prefix: str | Path | None = None, pins: Mapping[str, str] = NPM_RELEASE_VERSIONS
+) -> dict[str, dict[str, Any]]:
+    """Return, per pinned package, whether its warmed binary can be used.
+
+    Each entry has a `status` of `ok`, `missing` (never warmed, or binary gone), or
+    `stale` (the prefix holds another version than the pin), the installed `version`,
+    and the `bin` path. The installed `package.json` is read, not only the record, so
+    a prefix changed behind the record's back is caught.
+    """
+
+    prefix = Path(prefix) if prefix is not None else warm_prefix(pins)
+    record = read_warm_record(prefix)
+    apps = (record or {}).get("apps", {})
+    status: dict[str, dict[str, Any]] = {}
+    for package, pinned in pins.items():
+        app = apps.get(package)
+        data = _package_json(prefix, package) if app else None
+        installed = data.get("version") if data else None
+        entry: dict[str, Any] = {"pinned": pinned, "version": installed, "bin": None}
+        if app is None or data is None:
+            entry["status"] = "missing"
+        elif installed != pinned or app.get("version") != pinned:
+            entry["status"] = "stale"
+        elif not Path(app["bin"]).is_file():
+            entry["status"] = "missing"
+        else:
+            entry["status"] = "ok"
+            entry["bin"] = app["bin"]
+        status[package] = entry
+    return status
+
+
+def resolve_npm_command(command: Sequence[str], prefix: str | Path | None = None) -> list[str]:
+    """Return `command` with `npx <package>` replaced by the warmed binary, when usable.
+
+    Commands that are not `npx` of a pinned package, and packages whose warm prefix is
+    missing or stale, are returned unchanged, so callers keep falling back to npx.
+    """
+
+    command = list(command)
+    if len(command) < 2 or command[0] != "npx" or command[1] not in NPM_RELEASE_VERSIONS:
+        return command
+    entry = warm_status(prefix).get(command[1], {})
+    if entry.get("status") != "ok":
+        return command
+    return [entry["bin"], *command[2:]]
+
+
+def _install_specs(sources: Sequence[Path], pins: Mapping[str, str]) -> list[str]:
+    specs = []
+    for package, version in pins.items():
+        name = npm_tarball_name(package, version)
+        tarball = next((Path(s) / name for s in sources if (Path(s) / name).is_file()), None)
+        specs.append(str(tarball.resolve()) if tarball is not None else f"{package}@{version}")
+    return specs
+
+
+def warm_npm_apps(
+    prefix: str | Path | None = None,
+    *,
+    sources: Sequence[str | Path] = (),
+    npm: str | None = None,
+    offline: bool = False,
+    prune: bool = True,
+    timeout: float = DEFAULT_WARM_TIMEOUT_S,
+) -> dict[str, Any]:
+    """Install the pinned npm apps into `prefix` and record their binaries.
+
+    Packages are installed from `npm pack` tarballs found in `sources` (for example a
+    bundle's `npm/` directory) and otherwise from the registry, which npm serves from
+    its own cache when it can. With `prune`, prefixes warmed for other pins next to the
+    default prefix are removed. Returns the written `warm.json` record.
+    """
+
+    npm = npm or shutil.which("npm")
+    if npm is None:
+        raise NpmWarmError("npm is not available; install Node 18+ to warm the npm apps")
+    default_prefix = prefix is None
+    prefix = Path(prefix) if prefix is not None else warm_prefix()
+    prefix.mkdir(parents=True, exist_ok=True)
+    pins = dict(NPM_RELEASE_VERSIONS)
+    specs = _install_specs([Path(source) for source in sources], pins)
+
+    command = [npm, "install", "--prefix", str(prefix), "--no-audit", "--no-fund"]
+    command += ["--offline" if offline else "--prefer-offline", *specs]
+    try:
+        result = subprocess.run(
+            command, capture_output=True, text=True, timeout=timeout, check=False
+        )
+    except subprocess.TimeoutExpired as exc:
+        raise NpmWarmError(f"npm install timed out after {timeout:g}s") from exc
+    if result.returncode != 0:
+        tail = "\n".join(result.stderr.strip().splitlines()[-5:])
+        raise NpmWarmError(f"npm install of the pinned apps failed:\n{tail}")
+
+    apps: dict[str, Any] = {}
+    for (package, version), spec in zip(pins.items(), specs):
+        data = _package_json(prefix, package)
+        if data is None:
+            raise NpmWarmError(f"npm did not install {package} into {prefix}")
+        if data.get("version") != version:
+            raise NpmWarmError(
+                f"{package} {data.get('version')} was installed, but {version} is pinned"
+            )
+        name = _bin_name(package, data)
+        if name is None or not _bin_path(prefix, name).is_file():
+            raise NpmWarmError(f"{package} {version} does not provide a binary for npx to run")
+        apps[package] = {
+            "version": version,
+            "bin": str(_bin_path(prefix, name).absolute()),
+            "source": spec,
+        }
+
+    record = {"format": WARM_FORMAT, "key": pins_key(pins), "pins": pins, "apps": apps}
+    (prefix / WARM_RECORD).write_text(
+        json.dumps(record, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    if prune and default_prefix:
+        for other in warm_root().iterdir():
+            if other.is_dir() and other.name != prefix.name:
+                shutil.rmtree(other, ignore_errors=True)
+    return record
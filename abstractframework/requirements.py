@@ -0,0 +1,105 @@
+"""`Requires-Dist` parsing and marker evaluation shared by `deps` and `footprint`.
+
+Requirements are parsed with `packaging` when it is installed. Without it, only the
+name, the extras, and an `extra == "..."` marker are understood: other markers are
+assumed to hold and version specifiers are not checked. Importing
+`packaging.requirements` is slow, so this module stays off CLI start-up and is only
+imported by the commands that evaluate requirements.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from .distributions import normalize_name
+
+try:
+    from packaging.markers import InvalidMarker, UndefinedComparison, UndefinedEnvironmentName
+    from packaging.requirements import InvalidRequirement, Requirement
+    from packaging.version import InvalidVersion, Version
+except ImportError:  # pragma: no cover - packaging ships with pip/setuptools environments
+    Requirement = None  # type: ignore[assignment,misc]
+
+_REQUIREMENT_RE = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[([^\]]*)\])?")
+_EXTRA_MARKER_RE = re.compile(r"""extra\s*==\s*['"]([^'"]+)['"]""")
+
+
+def evaluator() -> str:
+    """Return `packaging`, or `basic` when markers and specifiers cannot be evaluated."""
+
+    return "packaging" if Requirement is not None else "basic"
+
+
+@dataclass(frozen=True)
+class ParsedRequirement:
+    """One requirement line, with its normalized name and extras.
+
+    `requirement` is the `packaging` Requirement, or None without `packaging`.
+    """
+
+    text: str
+    name: str
+    extras: frozenset[str]
+    requirement: Any = None
+
+    @property
+    def marker_has_extra(self) -> bool:
+        if self.requirement is not None:
+            marker = self.requirement.marker
+            return marker is not None and "extra" in str(marker)
+        return "extra" in self.text.partition(";")[2]
+
+    def applies(self, extra: str = "") -> bool:
+        """Return whether the marker holds here with `extra` ("" for none) requested.
+
+        Markers that cannot be evaluated do not hold. Without `packaging`, only an
+        `extra == "..."` marker naming another extra rules the requirement out.
+        """
+
+        if self.requirement is not None:
+            marker = self.requirement.marker
+            try:
+                return marker is None or marker.evaluate({"extra": extra})
+            except (InvalidMarker, UndefinedComparison, UndefinedEnvironmentName):
+                return False
+        wanted = _EXTRA_MARKER_RE.search(self.text.partition(";")[2])
+        return wanted is None or normalize_name(wanted.group(1)) == normalize_name(extra)
+
+    def contains(self, version: Any) -> bool:
+        """Return whether a `parse_version()` result meets the version specifier."""
+
+        if self.requirement is None or not self.requirement.specifier:
+            return True
+        return self.requirement.specifier.contains(version, prereleases=True)
+
+
+def parse_requirement(text: str) -> ParsedRequirement | None:
+    """Parse a `Requires-Dist` line; None when it is not a valid requirement."""
+
+    if Requirement is not None:
+        try:
+            requirement = Requirement(text)
+        except InvalidRequirement:
+            return None
+        extras = frozenset(normalize_name(extra) for extra in requirement.extras)
+        return ParsedRequirement(text, normalize_name(requirement.name), extras, requirement)
+    match = _REQUIREMENT_RE.match(text.partition(";")[0])
+    if match is None:
+        return None
+    extras = frozenset(
+        normalize_name(part.strip()) for part in (match.group(2) or "").split(",") if part.strip()
+    )
+    return ParsedRequirement(text, normalize_name(match.group(1)), extras)
+
+
+def parse_version(text: str) -> Any:
+    """Return `text` as a `packaging` Version; None when unparseable or without `packaging`."""
+
+    if Requirement is None:
+        return None
+    try:
+        return Version(text)
+    except InvalidVersion:
+        return None
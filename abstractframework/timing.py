@@ -0,0 +1,148 @@
+"""Wall-clock and CPU timing spans for doctor, with Chrome trace-event export.
+
+Spans are recorded on the calling thread. Work done on other threads (the concurrent
+environment probes) is measured there and handed back to be recorded with `add()`,
+so the recorder itself needs no locking.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+
+@dataclass(frozen=True)
+class Span:
+    name: str
+    category: str
+    start: float
+    wall: float
+    cpu: float
+    thread_id: int = 0
+    thread_name: str = "MainThread"
+    args: dict[str, Any] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "start_ms": round(self.start * 1000, 3),
+            "wall_ms": round(self.wall * 1000, 3),
+            "cpu_ms": round(self.cpu * 1000, 3),
+        }
+
+
+class TimingRecorder:
+    """Collect spans relative to one origin and export them as a Chrome trace.
+
+    `start` values are seconds since the recorder was created; `wall` comes from
+    `time.perf_counter()` and `cpu` from `time.thread_time()` of the measured thread.
+    """
+
+    def __init__(self) -> None:
+        self.origin = time.perf_counter()
+        self.spans: list[Span] = []
+
+    def add(
+        self,
+        name: str,
+        category: str,
+        started: float,
+        wall: float,
+        cpu: float,
+        *,
+        thread_id: int | None = None,
+        thread_name: str | None = None,
+        **args: Any,
+    ) -> Span:
+        """Record a span measured elsewhere; `started` is a `time.perf_counter()` value."""
+
+        current = threading.current_thread()
+        span = Span(
+            name,
+            category,
+            max(0.0, started - self.origin),
+            wall,
+            cpu,
+            thread_id if thread_id is not None else threading.get_native_id(),
+            thread_name if thread_name is not None else current.name,
+            args,
+        )
+        self.spans.append(span)
+        return span
+
+    @contextmanager
+    def measure(self, name: str, category: str = "check") -> Iterator[None]:
+        """Record the wall and thread CPU time of the enclosed block, even if it raises."""
+
+        started = time.perf_counter()
+        cpu_started = time.thread_time()
+        try:
+            yield
+        finally:
+            self.add(
+                name,
+                category,
+                started,
+                time.perf_counter() - started,
+                time.thread_time() - cpu_started,
+            )
+
+    def timing(self, *names: str) -> Span | None:
+        """Return the spans recorded under `names` merged into one, or None.
+
+        Wall and CPU times are summed; the merged span starts at the earliest start.
+        """
+
+        matching = [span for span in self.spans if span.name in names]
+        if not matching:
+            return None
+        if len(matching) == 1:
+            return matching[0]
+        first = min(matching, key=lambda span: span.start)
+        return Span(
+            names[0],
+            first.category,
+            first.start,
+            sum(span.wall for span in matching),
+            sum(span.cpu for span in matching),
+            first.thread_id,
+            first.thread_name,
+        )
+
+    def chrome_trace(self, **metadata: Any) -> dict[str, Any]:
+        """Return the spans in Chrome trace-event format (`chrome://tracing`, Perfetto)."""
+
+        pid = os.getpid()
+        events: list[dict[str, Any]] = []
+        threads: dict[int, str] = {}
+        for span in self.spans:
+            threads.setdefault(span.thread_id, span.thread_name)
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": round(span.start * 1_000_000, 3),
+                    "dur": round(span.wall * 1_000_000, 3),
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": {"cpu_ms": round(span.cpu * 1000, 3), **span.args},
+                }
+            )
+        events.extend(
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in threads.items()
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": metadata}
+
+    def write_chrome_trace(self, path: str | Path, **metadata: Any) -> Path:
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(self.chrome_trace(**metadata), indent=2)
+        target.write_text(payload + "\n", encoding="utf-8")
+        return target
@@ -0,0 +1,660 @@
+"""Parallel editable build of the multi-repo development workspace.
+
+The workspace is the AbstractFramework checkout with every sibling repository cloned
+into it by `scripts/clone.sh`. The build order mirrors `scripts/build.sh`: Python
+Tier 0 -> Tier 3 (each tier only depends on earlier ones), the meta-package as
+Tier 4, and the npm UI projects. Tiers become a DAG, so every package of a tier
+builds concurrently and the npm projects build alongside the Python tiers.
+
+Concurrent `pip install` runs resolving the same third-party dependencies into one
+`site-packages` would race, so each sibling is installed with `--no-deps` (which
+only writes its own editable metadata) and one final `pip install` resolves the
+union of their third-party requirements.
+
+Builds are incremental: every node gets a fingerprint of its project manifest,
+lockfiles, git tree hash, and uncommitted changes, combined with the fingerprints of
+the nodes it depends on. A node whose fingerprint matches the last successful build
+(and whose output is still installed) is skipped, so a change invalidates exactly
+the nodes downstream of it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Sequence
+
+from .cache import ProbeCache
+from .distributions import normalize_name
+
+DEFAULT_JOBS = max(1, min(8, os.cpu_count() or 1))
+BUILD_PROFILES = ("light", "apple", "gpu")
+
+# Repositories per build tier; alternative directory casings are accepted the same
+# way `scripts/status.sh` does.
+PYTHON_TIERS: tuple[tuple[str, ...], ...] = (
+    (
+        "abstractskill",
+        "abstractsemantics",
+        "abstractmemory",
+        "abstractvision",
+        "abstractvoice",
+        "abstractmusic",
+    ),
+    ("abstractcore", "abstractruntime"),
+    ("abstractagent", "abstractgateway"),
+    ("abstractcode", "abstractassistant"),
+)
+REPO_ALIASES: dict[str, tuple[str, ...]] = {
+    "abstractskill": ("AbstractSkill",),
+    "abstractmusic": ("AbstractMusic",),
+}
+# (relative directory, label, npm dependencies). The other UI projects consume the
+# abstractuic packages, so it builds first.
+NPM_PROJECTS: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    ("abstractuic", "abstractuic  (monorepo: ui-kit, panel-chat, monitors)", ()),
+    ("abstractobserver", "abstractobserver", ("abstractuic",)),
+    ("abstractcode/web", "abstractcode/web  (@abstractframework/code)", ("abstractuic",)),
+    ("abstractflow", "abstractflow  (@abstractframework/flow)", ("abstractuic",)),
+)
+
+_APP_EXTRAS = {"apple": "[apple]", "gpu": "[gpu]"}
+_STACK_EXTRAS = {"apple": "[all-apple]", "gpu": "[all-gpu]"}
+_APP_PACKAGES = {"abstractgateway", "abstractassistant"}
+_STACK_PACKAGES = {
+    "abstractsemantics",
+    "abstractmemory",
+    "abstractvision",
+    "abstractvoice",
+    "abstractmusic",
+    "abstractcore",
+    "abstractruntime",
+    "abstractagent",
+}
+
+DEPENDENCIES_NODE = "python:dependencies"
+META_NODE = "python:abstractframework"
+BUILD_CACHE_FILE = "build-cache.json"
+
+_MANIFEST_FILES = ("pyproject.toml", "setup.cfg", "setup.py", "package.json")
+_LOCK_FILES = (
+    "package-lock.json",
+    "npm-shrinkwrap.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+    "uv.lock",
+    "poetry.lock",
+)
+# Build outputs and caches never feed a fingerprint when a directory is not in git.
+_UNHASHED_DIRS = {".git", ".venv", "node_modules", "dist", "build", "__pycache__"}
+
+
+class WorkspaceError(RuntimeError):
+    """Raised when the workspace cannot be planned (e.g. a sibling repo is missing)."""
+
+
+def resolve_profile(profile: str) -> str:
+    """Resolve a build profile name the way `AF_BUILD_PROFILE` is resolved in build.sh."""
+
+    requested = (profile or "light").lower()
+    if requested in {"light", "base"}:
+        return "light"
+    if requested == "auto":
+        if platform.system() == "Darwin":
+            return "apple"
+        return "gpu" if shutil.which("nvidia-smi") else "light"
+    if requested in {"apple", "all-apple"}:
+        return "apple"
+    if requested in {"gpu", "all-gpu"}:
+        return "gpu"
+    raise WorkspaceError(
+        f"unsupported build profile {profile!r} "
+        "(expected light, apple, gpu, all-apple, all-gpu, or auto)"
+    )
+
+
+def profile_extras(repo: str, profile: str) -> str:
+    """Return the pip extras suffix for a sibling package under a build profile."""
+
+    if repo in _APP_PACKAGES:
+        return _APP_EXTRAS.get(profile, "")
+    if repo in _STACK_PACKAGES:
+        return _STACK_EXTRAS.get(profile, "")
+    return ""
+
+
+def find_repo(root: Path, repo: str) -> Path | None:
+    """Return the directory of a sibling repository, accepting its known aliases."""
+
+    for name in (repo, *REPO_ALIASES.get(repo, ())):
+        path = root / name
+        if path.is_dir():
+            return path
+    return None
+
+
+def state_dir(root: Path) -> Path:
+    """Return where build logs and state live: inside the workspace `.venv` when it exists.
+
+    Falls back to `<root>/.abstractframework-build` so an npm-only build never
+    creates a `.venv` directory that `scripts/build.sh` would mistake for a venv.
+    """
+
+    venv = root / ".venv"
+    if (venv / "pyvenv.cfg").is_file():
+        return venv / "abstractframework-build"
+    return root / ".abstractframework-build"
+
+
+Commands = Sequence[Sequence[str]]
+
+
+@dataclass
+class BuildNode:
+    name: str
+    kind: str
+    path: Path
+    commands: Commands | Callable[[], Commands]
+    deps: tuple[str, ...] = ()
+    label: str = ""
+    # Directories whose content feeds the node's fingerprint.
+    sources: tuple[Path, ...] = ()
+    # Whether the node's output still exists; a cached node is rebuilt when it does not.
+    installed: Callable[[], bool] | None = None
+
+
+@dataclass
+class BuildResult:
+    name: str
+    kind: str
+    status: str
+    started: float = 0.0
+    elapsed: float = 0.0
+    log: Path | None = None
+    detail: str = ""
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status in {"ok", "skipped"}
+
+    def as_dict(self) -> dict[str, object]:
+        data: dict[str, object] = {
+            "name": self.name,
+            "kind": self.kind,
+            "status": self.status,
+            "started_s": round(self.started, 3),
+            "elapsed_s": round(self.elapsed, 3),
+        }
+        if self.log is not None:
+            data["log"] = str(self.log)
+        if self.detail:
+            data["detail"] = self.detail
+        return data
+
+
+def _pip(*args: str) -> list[str]:
+    return [sys.executable, "-m", "pip", "install", "--quiet", *args]
+
+
+def _git(path: Path, *args: str) -> bytes | None:
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(path), *args],
+            capture_output=True,
+            stdin=subprocess.DEVNULL,
+            check=False,
+        )
+    except OSError:
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def _hash_stat(digest: hashlib._Hash, path: Path, name: str) -> None:
+    try:
+        stat = path.stat()
+    except OSError:
+        digest.update(f"{name}\0missing\n".encode("utf-8", "surrogateescape"))
+        return
+    record = f"{name}\0{stat.st_size}\0{stat.st_mtime_ns}\n"
+    digest.update(record.encode("utf-8", "surrogateescape"))
+
+
+def source_fingerprint(path: Path) -> str:
+    """Return a digest of a project directory's build inputs.
+
+    Covers the project manifest and lockfiles by content and, inside a git checkout,
+    the directory's tree hash at `HEAD` plus the uncommitted diff and the size/mtime of
+    untracked files. Outside git, the size and mtime of every file are used instead.
+    """
+
+    digest = hashlib.sha256()
+    for name in (*_MANIFEST_FILES, *_LOCK_FILES):
+        try:
+            content = (path / name).read_bytes()
+        except OSError:
+            continue
+        digest.update(f"{name}\0{len(content)}\0".encode())
+        digest.update(content)
+
+    tree = _git(path, "rev-parse", "HEAD:./")
+    if tree is not None:
+        digest.update(b"tree\0" + tree)
+        diff = _git(path, "diff", "HEAD", "--no-ext-diff", "--binary", "--", ".")
+        digest.update(b"diff\0" + (diff or b""))
+        untracked = _git(path, "ls-files", "--others", "--exclude-standard", "-z", "--", ".") or b""
+        for name in sorted(untracked.split(b"\0")):
+            if name:
+                relative = name.decode("utf-8", "surrogateescape")
+                _hash_stat(digest, path / relative, relative)
+        return digest.hexdigest()
+
+    for directory, dirnames, filenames in os.walk(path):
+        dirnames[:] = sorted(name for name in dirnames if name not in _UNHASHED_DIRS)
+        for filename in sorted(filenames):
+            full = Path(directory) / filename
+            _hash_stat(digest, full, full.relative_to(path).as_posix())
+    return digest.hexdigest()
+
+
+def fingerprint_nodes(nodes: Sequence[BuildNode], jobs: int = DEFAULT_JOBS) -> dict[str, str]:
+    """Return each node's fingerprint: its sources, its command line, and its dependencies.
+
+    Source directories are hashed concurrently. A dependency's fingerprint is part of
+    its dependents', so any change propagates downstream.
+    """
+
+    paths = sorted({path for node in nodes for path in node.sources})
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        sources = dict(zip(paths, pool.map(source_fingerprint, paths)))
+
+    by_name = {node.name: node for node in nodes}
+    keys: dict[str, str] = {}
+
+    def _key(node: BuildNode, visiting: frozenset[str] = frozenset()) -> str:
+        if node.name in keys:
+            return keys[node.name]
+        if node.name in visiting:
+            raise WorkspaceError("build graph has a dependency cycle")
+        digest = hashlib.sha256()
+        commands = None if callable(node.commands) else [list(c) for c in node.commands]
+        header = [node.name, node.kind, node.label, sys.executable, commands]
+        digest.update(json.dumps(header).encode("utf-8", "surrogateescape"))
+        for path in node.sources:
+            digest.update(f"\0src\0{sources[path]}".encode())
+        for dep in sorted(node.deps):
+            if dep in by_name:
+                dep_key = _key(by_name[dep], visiting | {node.name})
+                digest.update(f"\0dep\0{dep}\0{dep_key}".encode())
+        keys[node.name] = digest.hexdigest()
+        return keys[node.name]
+
+    for node in nodes:
+        _key(node)
+    return keys
+
+
+def _editable_installed(distribution: str, path: Path) -> Callable[[], bool]:
+    """Return a check that `distribution` is installed in editable mode from `path`."""
+
+    def _check() -> bool:
+        import importlib.metadata
+
+        try:
+            text = importlib.metadata.distribution(distribution).read_text("direct_url.json")
+        except importlib.metadata.PackageNotFoundError:
+            return False
+        try:
+            data = json.loads(text or "")
+        except ValueError:
+            return False
+        return (
+            isinstance(data, dict)
+            and data.get("url") == path.resolve().as_uri()
+            and bool((data.get("dir_info") or {}).get("editable"))
+        )
+
+    return _check
+
+
+def third_party_requirements(distributions: dict[str, str]) -> list[str]:
+    """Return the third-party requirements of installed workspace distributions.
+
+    `distributions` maps each workspace distribution to the extras suffix it was
+    installed with (e.g. `"[all-gpu]"`). Requirements on another workspace
+    distribution are not returned, but the extras they request are applied to it.
+    Markers are evaluated for this interpreter and the selected extras.
+    """
+
+    import importlib.metadata
+
+    try:
+        from packaging.requirements import Requirement
+    except ImportError as exc:  # pragma: no cover - hatchling/setuptools bring packaging
+        raise WorkspaceError("resolving workspace dependencies needs `packaging`") from exc
+
+    names = {normalize_name(name): name for name in distributions}
+    queue: list[tuple[str, str]] = []
+    for name, suffix in distributions.items():
+        extras = [part.strip() for part in suffix.strip("[]").split(",") if part.strip()]
+        queue.extend((normalize_name(name), extra) for extra in ["", *extras])
+    requires: dict[str, list[Requirement]] = {}
+    for key, name in names.items():
+        try:
+            texts = importlib.metadata.distribution(name).requires or []
+        except importlib.metadata.PackageNotFoundError:
+            texts = []
+        requires[key] = [Requirement(text) for text in texts]
+
+    requirements: dict[str, None] = {}
+    done: set[tuple[str, str]] = set()
+    while queue:
+        key, extra = queue.pop(0)
+        if (key, extra) in done:
+            continue
+        done.add((key, extra))
+        for requirement in requires[key]:
+            marker = requirement.marker
+            if marker is not None and not marker.evaluate({"extra": extra}):
+                continue
+            dependency = normalize_name(requirement.name)
+            if dependency in names:
+                queue.extend((dependency, local_extra) for local_extra in requirement.extras)
+                continue
+            suffix = f"[{','.join(sorted(requirement.extras))}]" if requirement.extras else ""
+            if requirement.url:
+                requirements[f"{requirement.name}{suffix} @ {requirement.url}"] = None
+            else:
+                requirements[f"{requirement.name}{suffix}{requirement.specifier}"] = None
+    return list(requirements)
+
+
+def _distribution_name(path: Path) -> str:
+    """Return the project name from a sibling's pyproject.toml, or its directory name."""
+
+    try:
+        import tomllib
+    except ImportError:  # pragma: no cover - Python 3.10
+        return path.name
+    try:
+        with open(path / "pyproject.toml", "rb") as handle:
+            return str(tomllib.load(handle)["project"]["name"])
+    except (OSError, KeyError, ValueError):
+        return path.name
+
+
+def plan_workspace(
+    root: str | Path,
+    profile: str = "light",
+    *,
+    python: bool = True,
+    npm: bool = True,
+) -> tuple[list[BuildNode], list[str]]:
+    """Return the build DAG for a workspace and warnings about skipped npm projects.
+
+    Raises `WorkspaceError` when a sibling Python repository is missing.
+    """
+
+    root = Path(root).resolve()
+    resolved = resolve_profile(profile)
+    nodes: list[BuildNode] = []
+    warnings: list[str] = []
+
+    if python:
+        missing = [repo for tier in PYTHON_TIERS for repo in tier if find_repo(root, repo) is None]
+        if missing:
+            raise WorkspaceError(
+                f"sibling repo(s) not found in {root}: {', '.join(missing)}. "
+                "Run ./scripts/clone.sh first to clone all repositories."
+            )
+        installed: dict[str, str] = {}
+        previous: tuple[str, ...] = ()
+        for tier in PYTHON_TIERS:
+            current: list[str] = []
+            for repo in tier:
+                path = find_repo(root, repo)
+                assert path is not None
+                extras = profile_extras(repo, resolved)
+                distribution = _distribution_name(path)
+                installed[distribution] = extras
+                name = f"python:{repo}"
+                nodes.append(
+                    BuildNode(
+                        name,
+                        "python",
+                        path,
+                        [_pip("--no-deps", "--no-build-isolation", "-e", f"{path}{extras}")],
+                        previous,
+                        f"install -e {repo}{extras}",
+                        (path,),
+                        _editable_installed(distribution, path),
+                    )
+                )
+                current.append(name)
+            previous = tuple(current)
+        python_nodes = tuple(node.name for node in nodes)
+
+        def _dependencies() -> Commands:
+            requirements = third_party_requirements(installed)
+            return [_pip(*requirements)] if requirements else []
+
+        nodes.append(
+            BuildNode(
+                DEPENDENCIES_NODE,
+                "python",
+                root,
+                _dependencies,
+                python_nodes,
+                "install third-party dependencies",
+            )
+        )
+        nodes.append(
+            BuildNode(
+                META_NODE,
+                "python",
+                root,
+                [_pip("--no-deps", "--no-build-isolation", "-e", str(root))],
+                (DEPENDENCIES_NODE,),
+                "install -e . (AbstractFramework)",
+                (root,),
+                _editable_installed("abstractframework", root),
+            )
+        )
+
+    if npm:
+        available: set[str] = set()
+        for rel_dir, label, deps in NPM_PROJECTS:
+            path = root / rel_dir
+            if not path.is_dir():
+                warnings.append(f"{rel_dir}/ not found — skipping")
+                continue
+            commands: list[list[str]] = []
+            if platform.system() == "Darwin" and shutil.which("xattr"):
+                # Gatekeeper can quarantine native addons in downloaded workspaces.
+                commands.append(["xattr", "-dr", "com.apple.quarantine", str(path)])
+            commands.append(["npm", "install", "--no-audit", "--no-fund"])
+            if platform.system() == "Darwin" and shutil.which("xattr"):
+                commands.append(["xattr", "-dr", "com.apple.quarantine", str(path)])
+            commands.append(["npm", "run", "build"])
+            nodes.append(
+                BuildNode(
+                    f"npm:{rel_dir}",
+                    "npm",
+                    path,
+                    commands,
+                    tuple(f"npm:{dep}" for dep in deps if dep in available),
+                    label,
+                    (path,),
+                    (path / "node_modules").is_dir,
+                )
+            )
+            available.add(rel_dir)
+    return nodes, warnings
+
+
+def _run_node(node: BuildNode, log_path: Path, origin: float) -> BuildResult:
+    started = time.perf_counter()
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    status = "ok"
+    detail = ""
+    with open(log_path, "w", encoding="utf-8") as log:
+        try:
+            commands = node.commands() if callable(node.commands) else node.commands
+        except Exception as exc:  # noqa: BLE001 - reported as the node's failure
+            commands, status, detail = [], "failed", str(exc)
+            log.write(f"{detail}\n")
+        for command in commands:
+            log.write(f"$ {' '.join(command)}\n")
+            log.flush()
+            try:
+                code = subprocess.run(
+                    list(command),
+                    cwd=node.path,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    stdin=subprocess.DEVNULL,
+                    check=False,
+                ).returncode
+            except OSError as exc:
+                status, detail = "failed", f"{command[0]}: {exc.strerror or exc}"
+                log.write(f"{detail}\n")
+                break
+            if code != 0:
+                status, detail = "failed", f"`{' '.join(command[:4])}` exited with {code}"
+                break
+    return BuildResult(
+        node.name,
+        node.kind,
+        status,
+        started - origin,
+        time.perf_counter() - started,
+        log_path,
+        detail,
+    )
+
+
+def run_build(
+    nodes: Sequence[BuildNode],
+    log_dir: str | Path,
+    jobs: int = DEFAULT_JOBS,
+    on_result: Callable[[BuildResult], None] | None = None,
+    cache: ProbeCache | None = None,
+) -> list[BuildResult]:
+    """Run the build DAG with at most `jobs` nodes at a time.
+
+    A node starts once all of its dependencies succeeded; nodes downstream of a
+    failure are reported as `blocked` and never run. Each node's output goes to
+    `<log_dir>/<name>.log`. Results are returned in `nodes` order.
+
+    With a `cache`, a node whose fingerprint (see `fingerprint_nodes()`) matches its
+    last successful build and whose output is still installed is `skipped`.
+    """
+
+    log_dir = Path(log_dir)
+    by_name = {node.name: node for node in nodes}
+    results: dict[str, BuildResult] = {}
+    running: dict[Future[BuildResult], str] = {}
+    pending = list(nodes)
+    keys = fingerprint_nodes(nodes, jobs) if cache is not None else {}
+    origin = time.perf_counter()
+
+    def _finish(result: BuildResult) -> None:
+        results[result.name] = result
+        if cache is not None and result.status in {"ok", "failed"}:
+            cache.put(result.name, keys[result.name] if result.status == "ok" else None)
+        if on_result is not None:
+            on_result(result)
+
+    def _fresh(node: BuildNode) -> bool:
+        if cache is None or cache.get(node.name) != keys[node.name]:
+            return False
+        return node.installed is None or node.installed()
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs), thread_name_prefix="workspace") as pool:
+        while pending or running:
+            for node in list(pending):
+                known = [dep for dep in node.deps if dep in by_name]
+                failed = [dep for dep in known if dep in results and not results[dep].succeeded]
+                if failed:
+                    pending.remove(node)
+                    _finish(
+                        BuildResult(node.name, node.kind, "blocked", detail=f"after {failed[0]}")
+                    )
+                elif all(dep in results for dep in known) and _fresh(node):
+                    pending.remove(node)
+                    _finish(BuildResult(node.name, node.kind, "skipped", detail="unchanged"))
+                elif all(dep in results for dep in known) and len(running) < max(1, jobs):
+                    pending.remove(node)
+                    log_path = log_dir / f"{node.name.replace(':', '-').replace('/', '-')}.log"
+                    running[pool.submit(_run_node, node, log_path, origin)] = node.name
+            if not running:
+                if pending and not any(
+                    all(dep in results for dep in node.deps if dep in by_name) for node in pending
+                ):
+                    raise WorkspaceError("build graph has a dependency cycle")
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                running.pop(future)
+                _finish(future.result())
+    return [results[node.name] for node in nodes]
+
+
+@dataclass
+class BuildSummary:
+    results: list[BuildResult]
+    elapsed: float
+    warnings: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return all(result.succeeded for result in self.results)
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "ok": self.ok,
+            "elapsed_s": round(self.elapsed, 3),
+            "serial_s": round(sum(result.elapsed for result in self.results), 3),
+            "warnings": list(self.warnings),
+            "results": [result.as_dict() for result in self.results],
+        }
+
+
+def build_workspace(
+    root: str | Path,
+    profile: str = "light",
+    *,
+    jobs: int = DEFAULT_JOBS,
+    python: bool = True,
+    npm: bool = True,
+    log_dir: str | Path | None = None,
+    on_result: Callable[[BuildResult], None] | None = None,
+    force: bool = False,
+) -> BuildSummary:
+    """Plan and run a workspace build; see `plan_workspace()` and `run_build()`.
+
+    Fingerprints of successful builds are kept in `<state dir>/build-cache.json`;
+    `force=True` rebuilds every node and records fresh fingerprints.
+    """
+
+    root = Path(root).resolve()
+    nodes, warnings = plan_workspace(root, profile, python=python, npm=npm)
+    started = time.perf_counter()
+    cache = ProbeCache(state_dir(root) / BUILD_CACHE_FILE, ttl=float("inf"), refresh=force)
+    results = run_build(
+        nodes,
+        log_dir if log_dir is not None else state_dir(root) / "logs",
+        jobs,
+        on_result,
+        cache,
+    )
+    cache.save()
+    return BuildSummary(results, time.perf_counter() - started, warnings)
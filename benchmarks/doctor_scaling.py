@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark how `abstractframework doctor` latency grows with installed distributions.
+
+Creates synthetic `site-packages` directories holding N fake `*.dist-info` entries
+(plus the pinned release profile) and, for each size, times in a fresh interpreter
+(doctor runs once per CLI process, so warm `importlib.metadata` caches do not apply):
+
+- `legacy`: one `importlib.metadata.version()` call per pinned distribution (the
+  pre-index doctor behaviour; every call walks the path)
+- `doctor`: `build_doctor_report(include_environment=False)`, which scans once
+
+Interpreter start-up is excluded; only the lookup work is timed.
+
+Usage:
+  python benchmarks/doctor_scaling.py
+  python benchmarks/doctor_scaling.py --sizes 100 400 1600 --rounds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from abstractframework import PACKAGE_DISTRIBUTIONS, RELEASE_VERSIONS  # noqa: E402
+
+_LEGACY = """
+import importlib.metadata, time
+from abstractframework import PACKAGE_DISTRIBUTIONS
+start = time.perf_counter()
+for distribution in ["abstractframework", *PACKAGE_DISTRIBUTIONS.values()]:
+    try:
+        importlib.metadata.version(distribution)
+    except importlib.metadata.PackageNotFoundError:
+        pass
+print((time.perf_counter() - start) * 1000)
+"""
+
+_DOCTOR = """
+import time
+from abstractframework.cli import build_doctor_report
+start = time.perf_counter()
+build_doctor_report(include_environment=False)
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def _write_dist(site: Path, name: str, version: str) -> None:
+    info = site / f"{name}-{version}.dist-info"
+    info.mkdir()
+    (info / "METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n", encoding="utf-8"
+    )
+
+
+def _populate(site: Path, size: int) -> None:
+    for package_id, version in RELEASE_VERSIONS.items():
+        _write_dist(site, PACKAGE_DISTRIBUTIONS[package_id], version)
+    for index in range(size):
+        _write_dist(site, f"filler_distribution_{index:05d}", "1.0.0")
+
+
+def _median_ms(code: str, site: Path, rounds: int) -> float:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(site), str(ROOT)]))
+    samples = []
+    for _ in range(rounds):
+        result = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True, env=env
+        )
+        samples.append(float(result.stdout.strip()))
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 100, 200, 400, 800, 1600])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'distributions':>13}  {'legacy ms':>10}  {'doctor ms':>10}  {'speedup':>8}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            site = Path(tmp)
+            _populate(site, size)
+            legacy = _median_ms(_LEGACY, site, args.rounds)
+            doctor = _median_ms(_DOCTOR, site, args.rounds)
+        total = size + len(RELEASE_VERSIONS)
+        print(f"{total:>13}  {legacy:>10.2f}  {doctor:>10.2f}  {legacy / doctor:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""Benchmark the meta-package hot paths and gate regressions against a baseline.
+
+Every round runs in a fresh interpreter, because these paths are paid once per CLI
+process or application start-up and in-process repeats would only measure warm
+caches. Interpreter start-up is excluded; only the benchmarked statement is timed.
+
+Benchmarks:
+
+- `import`: `import abstractframework`
+- `import_cli`: `import abstractframework.cli`
+- `doctor_no_environment`: `build_doctor_report(include_environment=False)`
+- `doctor_stubbed_probes`: `build_doctor_report()` with instant Node/npm/nvidia-smi probes
+- `manifest_build`: `build_install_manifest()`
+- `manifest_json`: `manifest_json()`
+- `manifest_check`: `check_install_manifest()` against the checked-in manifest
+- `gen_llms_full`: `scripts/gen_llms_full.py` writing to the null device
+- `gen_llms_full_check`: `scripts/gen_llms_full.py --check` against the checked-in output
+
+Usage:
+  python benchmarks/hot_paths.py
+  python benchmarks/hot_paths.py --rounds 30 --output baseline.json
+  python benchmarks/hot_paths.py --compare baseline.json --threshold 0.25
+  python benchmarks/hot_paths.py --only import import_cli --compare baseline.json
+
+`--compare` exits 1 when a benchmark's `--metric` (default p50) is slower than the
+baseline by more than `--threshold` (a fraction; 0.25 = 25%). Baselines are only
+comparable on the same machine and Python version.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+_TIMER = "import time\nstart = time.perf_counter()\n"
+_REPORT = "\nprint((time.perf_counter() - start) * 1000)\n"
+
+# name -> (setup, timed statement); both run in the fresh child interpreter.
+BENCHMARKS: dict[str, tuple[str, str]] = {
+    "import": ("", "import abstractframework"),
+    "import_cli": ("", "import abstractframework.cli"),
+    "doctor_no_environment": (
+        "from abstractframework.cli import build_doctor_report",
+        "build_doctor_report(include_environment=False)",
+    ),
+    "doctor_stubbed_probes": (
+        "from abstractframework import cli\n"
+        "cli._command_version = lambda command, timeout=5.0: f'{command} 1.0'\n"
+        "cli._which = lambda command: None",
+        "cli.build_doctor_report()",
+    ),
+    "manifest_build": (
+        "from abstractframework.install_manifest import build_install_manifest",
+        "build_install_manifest()",
+    ),
+    "manifest_json": (
+        "from abstractframework.install_manifest import manifest_json",
+        "manifest_json()",
+    ),
+    "manifest_check": (
+        "from abstractframework.install_manifest import check_install_manifest",
+        f"check_install_manifest({str(ROOT / 'docs/installers/install-manifest.json')!r})",
+    ),
+    "gen_llms_full": (
+        "import contextlib, io, os, runpy, sys\n"
+        f"sys.argv = [{str(ROOT / 'scripts/gen_llms_full.py')!r}, '--output', os.devnull]",
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    runpy.run_path(sys.argv[0], run_name='__main__')",
+    ),
+    "gen_llms_full_check": (
+        "import contextlib, io, runpy, sys\n"
+        f"sys.argv = [{str(ROOT / 'scripts/gen_llms_full.py')!r}, '--check']",
+        "quiet = io.StringIO()\n"
+        "with contextlib.redirect_stdout(quiet), contextlib.redirect_stderr(quiet):\n"
+        "    with contextlib.suppress(SystemExit):\n"
+        "        runpy.run_path(sys.argv[0], run_name='__main__')",
+    ),
+}
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def _child_code(setup: str, statement: str) -> str:
+    return f"{setup}\n{_TIMER}{statement}{_REPORT}"
+
+
+def run_round(name: str) -> float:
+    """Run one round of benchmark `name` in a fresh interpreter; return milliseconds."""
+
+    setup, statement = BENCHMARKS[name]
+    paths = [str(ROOT), os.environ.get("PYTHONPATH", "")]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in paths if path))
+    result = subprocess.run(
+        [sys.executable, "-c", _child_code(setup, statement)],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=ROOT,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Return min/mean/stdev/max and the `PERCENTILES` of `samples` in milliseconds."""
+
+    stats = {
+        "rounds": len(samples),
+        "min": min(samples),
+        "max": max(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+    if len(samples) > 1:
+        cuts = statistics.quantiles(samples, n=100, method="inclusive")
+        stats.update({f"p{pct}": cuts[pct - 1] for pct in PERCENTILES})
+    else:
+        stats.update({f"p{pct}": samples[0] for pct in PERCENTILES})
+    return {key: round(value, 4) for key, value in stats.items()}
+
+
+def run_suite(names: list[str], rounds: int, warmup: int) -> dict[str, object]:
+    results: dict[str, dict[str, float]] = {}
+    for name in names:
+        for _ in range(warmup):
+            run_round(name)
+        results[name] = summarize([run_round(name) for _ in range(rounds)])
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "rounds": rounds,
+        "results": results,
+    }
+
+
+def compare(
+    current: dict[str, object], baseline: dict[str, object], metric: str, threshold: float
+) -> list[str]:
+    """Return one message per benchmark slower than `baseline` by more than `threshold`.
+
+    Benchmarks missing from either side are not compared.
+    """
+
+    regressions: list[str] = []
+    base_results = baseline.get("results", {})
+    for name, stats in current["results"].items():  # type: ignore[union-attr]
+        base = base_results.get(name) if isinstance(base_results, dict) else None
+        if not base or metric not in base or metric not in stats:
+            continue
+        limit = base[metric] * (1 + threshold)
+        if stats[metric] > limit:
+            change = (stats[metric] / base[metric] - 1) * 100 if base[metric] else float("inf")
+            regressions.append(
+                f"{name}: {metric} {stats[metric]:.2f} ms vs baseline {base[metric]:.2f} ms "
+                f"(+{change:.0f}%, threshold +{threshold * 100:.0f}%)"
+            )
+    return regressions
+
+
+def _print_results(
+    suite: dict[str, object], baseline: dict[str, object] | None, metric: str
+) -> None:
+    results: dict[str, dict[str, float]] = suite["results"]  # type: ignore[assignment]
+    base_results = (baseline or {}).get("results", {})
+    width = max(len(name) for name in results)
+    header = f"{'benchmark':<{width}}  {'min':>8}  {'p50':>8}  {'p90':>8}  {'p99':>8}  {'max':>8}"
+    if baseline is not None:
+        header += f"  {'base ' + metric:>9}  {'change':>7}"
+    print(header)
+    print("-" * len(header))
+    for name, stats in results.items():
+        line = (
+            f"{name:<{width}}  {stats['min']:>8.2f}  {stats['p50']:>8.2f}  {stats['p90']:>8.2f}"
+            f"  {stats['p99']:>8.2f}  {stats['max']:>8.2f}"
+        )
+        base = base_results.get(name) if isinstance(base_results, dict) else None
+        if baseline is not None and base and base.get(metric):
+            change = (stats[metric] / base[metric] - 1) * 100
+            line += f"  {base[metric]:>9.2f}  {change:>+6.0f}%"
+        print(line)
+    print(f"\nmilliseconds over {suite['rounds']} fresh-interpreter rounds")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=15, help="Measured rounds per benchmark")
+    parser.add_argument("--warmup", type=int, default=1, help="Unmeasured rounds per benchmark")
+    parser.add_argument(
+        "--only", nargs="+", choices=sorted(BENCHMARKS), metavar="NAME", help="Benchmarks to run"
+    )
+    parser.add_argument("--output", type=Path, help="Write results as a JSON baseline")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to compare against")
+    parser.add_argument(
+        "--metric",
+        default="p50",
+        choices=["min", "mean", *(f"p{pct}" for pct in PERCENTILES)],
+        help="Statistic compared against the baseline (default: p50)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown as a fraction of the baseline (default: 0.25)",
+    )
+    args = parser.parse_args()
+    if args.rounds < 1:
+        parser.error("--rounds must be at least 1")
+
+    baseline = json.loads(args.compare.read_text(encoding="utf-8")) if args.compare else None
+    suite = run_suite(args.only or list(BENCHMARKS), args.rounds, args.warmup)
+    _print_results(suite, baseline, args.metric)
+
+    if args.output:
+        payload = json.dumps(suite, indent=2, sort_keys=True)
+        args.output.write_text(payload + "\n", encoding="utf-8")
+        print(f"Wrote {args.output}")
+    if baseline is None:
+        return 0
+    regressions = compare(suite, baseline, args.metric, args.threshold)
+    if regressions:
+        print("\nRegressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print(f"\nNo benchmark regressed beyond +{args.threshold * 100:.0f}% on {args.metric}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -20,7 +20,16 @@
 #   ./scripts/build.sh --python       # Python packages only
 #   ./scripts/build.sh --npm          # npm packages only
 #   ./scripts/build.sh --clean        # delete .venv first (avoids pollution from other projects)
+#   ./scripts/build.sh --jobs=4       # at most 4 packages build at the same time
+#   ./scripts/build.sh --force        # rebuild packages whose sources did not change
 #   AF_BUILD_PROFILE=light|apple|gpu|auto ./scripts/build.sh
+#   AF_BUILD_JOBS=4 ./scripts/build.sh
+#
+# Packages of the same tier, and the npm projects, build concurrently via
+# `python -m abstractframework workspace build`; per-package logs are written to
+# .venv/abstractframework-build/logs/ (or .abstractframework-build/logs/ for --npm).
+# Packages whose manifest, lockfile, git tree, and profile extras are unchanged since
+# their last successful build (and everything upstream of them) are skipped.
 #
 # Prerequisites:
 #   - Python 3.10+  (required)
@@ -74,6 +83,8 @@ BUILD_PYTHON=true
 BUILD_NPM=true
 CLEAN_VENV=false
 BUILD_PROFILE="${AF_BUILD_PROFILE:-light}"
+BUILD_JOBS="${AF_BUILD_JOBS:-}"
+BUILD_FORCE=false
 
 for arg in "$@"; do
     case "$arg" in
@@ -84,6 +95,8 @@ for arg in "$@"; do
         --gpu)    BUILD_PROFILE="gpu" ;;
         --light)  BUILD_PROFILE="light" ;;
         --base)   BUILD_PROFILE="light" ;;
+        --jobs=*) BUILD_JOBS="${arg#--jobs=}" ;;
+        --force)  BUILD_FORCE=true ;;
     esac
 done
 
@@ -199,79 +212,6 @@ resolve_build_profile() {
     esac
 }
 
-build_profile_extras() {
-    local rel_dir="$1"
-    local profile="$2"
-
-    if [[ "$profile" == "light" || "$profile" == "base" ]]; then
-        printf '%s' ""
-        return 0
-    fi
-
-    case "$rel_dir" in
-        abstractgateway|abstractassistant)
-            case "$profile" in
-                apple) printf '%s' "[apple]" ;;
-                gpu) printf '%s' "[gpu]" ;;
-                *) printf '%s' "" ;;
-            esac
-            ;;
-        abstractsemantics|abstractmemory|abstractvision|abstractvoice|abstractmusic|abstractcore|abstractruntime|abstractagent)
-            case "$profile" in
-                apple) printf '%s' "[all-apple]" ;;
-                gpu) printf '%s' "[all-gpu]" ;;
-                *) printf '%s' "" ;;
-            esac
-            ;;
-        *)
-            printf '%s' ""
-            ;;
-    esac
-}
-
-macos_clear_quarantine() {
-    local target="$1"
-
-    if ! is_macos; then
-        return 0
-    fi
-    if ! command -v xattr >/dev/null 2>&1; then
-        return 0
-    fi
-    if [[ ! -e "$target" ]]; then
-        return 0
-    fi
-
-    # Gatekeeper can quarantine native addons in downloaded workspaces on macOS.
-    # Clearing only the quarantine xattr is safe and prevents dlopen failures.
-    xattr -dr com.apple.quarantine "$target" >/dev/null 2>&1 || true
-}
-
-# Check that a sibling repo directory exists; abort with a clear message if not.
-require_repo() {
-    local name="$1"
-    if [[ ! -d "$ROOT_DIR/$name" ]]; then
-        echo ""
-        printf "${C_RED}ERROR:${C_RESET} sibling repo not found: %s\n" "$ROOT_DIR/$name"
-        echo "       Run ./scripts/clone.sh first to clone all repositories."
-        af_die "missing sibling repo: $name"
-    fi
-}
-
-# Editable-install a Python package from a local directory.
-# Usage: install_editable <relative_dir> [pip_extras]
-# Example: install_editable abstractcore "[tools,media]"
-install_editable() {
-    local rel_dir="$1"
-    local extras="${2:-}"
-    local pkg_path="$ROOT_DIR/$rel_dir"
-
-    require_repo "$rel_dir"
-    echo ""
-    package_line "pip" "install -e ${rel_dir}${extras}"
-    pip install --quiet --no-build-isolation -e "${pkg_path}${extras}"
-}
-
 remove_existing_meta_package() {
     if python - <<'PY'
 from importlib.metadata import PackageNotFoundError, version
@@ -299,32 +239,21 @@ remove_source_meta_egg_info() {
     fi
 }
 
-build_npm_project() {
-    local rel_dir="$1"
-    local label="$2"
-    local pkg_dir="$ROOT_DIR/$rel_dir"
-
-    if [[ ! -d "$pkg_dir" ]]; then
-        warn_line "${rel_dir}/ not found — skipping"
-        npm_ok=false
-        return 0
+# Build the sibling packages through the meta-package's workspace builder, which
+# runs each tier (and the npm projects) concurrently and logs per package.
+# Usage: workspace_build <python> [extra flags...]
+workspace_build() {
+    local python_bin="$1"
+    shift
+    local build_args=()
+    if [[ -n "$BUILD_JOBS" ]]; then
+        build_args=(--jobs "$BUILD_JOBS")
     fi
-
-    echo ""
-    package_line "npm" "$label"
-    (
-        cd "$pkg_dir"
-        if is_macos; then
-            echo "       macOS: clearing Gatekeeper quarantine on project files"
-            macos_clear_quarantine "$pkg_dir"
-        fi
-        npm install --no-audit --no-fund 2>&1 | tail -1
-        if is_macos && [[ -d "$pkg_dir/node_modules" ]]; then
-            echo "       macOS: clearing Gatekeeper quarantine on node_modules"
-            macos_clear_quarantine "$pkg_dir/node_modules"
-        fi
-        npm run build 2>&1 | tail -1
-    ) && printf "       ${C_GREEN}✓ built${C_RESET}\n" || { printf "       ${C_YELLOW}WARNING:${C_RESET} %s build failed\n" "$label"; npm_ok=false; }
+    if $BUILD_FORCE; then
+        build_args+=(--force)
+    fi
+    PYTHONPATH="$ROOT_DIR${PYTHONPATH:+:$PYTHONPATH}" "$python_bin" -m abstractframework \
+        workspace build --root "$ROOT_DIR" ${build_args[@]+"${build_args[@]}"} "$@"
 }
 
 # ---------------------------------------------------------------------------
@@ -453,35 +382,26 @@ PY
     PYTHON_BUILD_PROFILE="$(resolve_build_profile)"
     ok_line "Using Python dependency profile: ${PYTHON_BUILD_PROFILE}"
 
-    # ── Tier 0: No internal dependencies ────────────────────────────────
-    section "Python — Tier 0  (no internal dependencies)"
-    install_editable "abstractskill"
-    install_editable "abstractsemantics" "$(build_profile_extras "abstractsemantics" "$PYTHON_BUILD_PROFILE")"
-    install_editable "abstractmemory" "$(build_profile_extras "abstractmemory" "$PYTHON_BUILD_PROFILE")"
-    install_editable "abstractvision" "$(build_profile_extras "abstractvision" "$PYTHON_BUILD_PROFILE")"
-    install_editable "abstractvoice" "$(build_profile_extras "abstractvoice" "$PYTHON_BUILD_PROFILE")"
-    install_editable "abstractmusic" "$(build_profile_extras "abstractmusic" "$PYTHON_BUILD_PROFILE")"
-
-    # ── Tier 1: Depends on Tier 0 ───────────────────────────────────────
-    section "Python — Tier 1  (depends on Tier 0)"
-    install_editable "abstractcore" "$(build_profile_extras "abstractcore" "$PYTHON_BUILD_PROFILE")"
-    install_editable "abstractruntime" "$(build_profile_extras "abstractruntime" "$PYTHON_BUILD_PROFILE")"
-
-    # ── Tier 2: Depends on Tier 0–1 ────────────────────────────────────
-    section "Python — Tier 2  (depends on Tier 0–1)"
-    install_editable "abstractagent" "$(build_profile_extras "abstractagent" "$PYTHON_BUILD_PROFILE")"
-    install_editable "abstractgateway" "$(build_profile_extras "abstractgateway" "$PYTHON_BUILD_PROFILE")"
-
-    # ── Tier 3: Depends on Tier 0–2 ────────────────────────────────────
-    section "Python — Tier 3  (depends on Tier 0–2)"
-    install_editable "abstractcode"
-    install_editable "abstractassistant" "$(build_profile_extras "abstractassistant" "$PYTHON_BUILD_PROFILE")"
-
-    # ── Tier 4: Meta-package (AbstractFramework itself) ────────────────
-    section "Python — Tier 4  (meta-package)"
+    # ── Tiers 0–4 (and npm alongside) ───────────────────────────────────
+    # Tier 0 has no internal dependencies, Tier N depends on Tiers 0..N-1, and the
+    # meta-package (Tier 4) goes last; packages within a tier build concurrently.
+    if $BUILD_NPM; then
+        section "Python + npm — Tiers 0–4 and UI packages (parallel)"
+        _workspace_flags=(--profile "$PYTHON_BUILD_PROFILE")
+    else
+        section "Python — Tiers 0–4 (parallel)"
+        _workspace_flags=(--profile "$PYTHON_BUILD_PROFILE" --python-only)
+    fi
     echo ""
-    package_line "pip" "install -e . (AbstractFramework)"
-    pip install --quiet --no-build-isolation --no-deps -e "$ROOT_DIR"
+    npm_ok=true
+    if ! workspace_build python "${_workspace_flags[@]}"; then
+        # The meta-package was removed above and is installed last, so its metadata
+        # tells a Python failure (fatal) apart from an npm-only failure (warning).
+        if ! python -c "import importlib.metadata as m; m.version('abstractframework')" 2>/dev/null; then
+            af_die "Python workspace build failed (see the logs listed above)"
+        fi
+        npm_ok=false
+    fi
 
     # ── Import safety: prevent workspace-root shadowing ─────────────────
     # Problem:
@@ -685,15 +605,14 @@ fi
 # ═══════════════════════════════════════════════════════════════════════════
 # NPM PACKAGES
 # ═══════════════════════════════════════════════════════════════════════════
-if $BUILD_NPM; then
+if $BUILD_NPM && ! $BUILD_PYTHON; then
     section "npm — Building UI packages from local source"
-
-    npm_ok=true
-
-    build_npm_project "abstractuic" "abstractuic  (monorepo: ui-kit, panel-chat, monitors)"
-    build_npm_project "abstractobserver" "abstractobserver"
-    build_npm_project "abstractcode/web" "abstractcode/web  (@abstractframework/code)"
-    build_npm_project "abstractflow" "abstractflow  (@abstractframework/flow)"
+    echo ""
+    if workspace_build python3 --npm-only; then
+        npm_ok=true
+    else
+        npm_ok=false
+    fi
 fi
 
 # ═══════════════════════════════════════════════════════════════════════════
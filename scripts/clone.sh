@@ -17,6 +17,23 @@
 # If a repo already exists locally, the script pulls updates instead of
 # re-cloning.
 #
+# Options:
+#   --jobs N, -j N     clone/update up to N repositories at once (default: 4;
+#                      AF_CLONE_JOBS). --jobs 1 processes them one at a time.
+#   --cache DIR        keep bare mirrors of every repository in DIR (AF_CLONE_CACHE).
+#                      Each mirror is refreshed once per run; new checkouts borrow its
+#                      objects (`--reference` + `--dissociate`, so the checkout does
+#                      not depend on the cache afterwards) and existing checkouts
+#                      fetch from it before pulling.
+#   --partial          without --cache, clone with `--filter=blob:none` and fetch
+#                      file contents on demand.
+#
+# AF_REPO_BASE_URL overrides https://github.com/lpalbou (e.g. a directory of local
+# bare repositories for offline setups and tests).
+#
+# Every repository logs to a temporary file; failures print the end of their log,
+# and a per-repository timing summary closes the run.
+#
 # Prerequisites:
 #   - git
 # =============================================================================
@@ -26,31 +43,60 @@ set -euo pipefail
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
+REPO_BASE_URL="${AF_REPO_BASE_URL:-https://github.com/lpalbou}"
+REPO_BASE_URL="${REPO_BASE_URL%/}"
+
 # The AbstractFramework (meta-package) repository — cloned first as root.
-AF_REPO="https://github.com/lpalbou/AbstractFramework.git"
+AF_REPO="$REPO_BASE_URL/AbstractFramework.git"
 
 # Sibling repositories — cloned INTO the AbstractFramework root.
 # Python packages (PyPI)
 SIBLING_REPOS=(
-    "https://github.com/lpalbou/abstractcore.git"
-    "https://github.com/lpalbou/abstractruntime.git"
-    "https://github.com/lpalbou/abstractagent.git"
-    "https://github.com/lpalbou/abstractflow.git"
-    "https://github.com/lpalbou/abstractcode.git"
-    "https://github.com/lpalbou/abstractgateway.git"
-    "https://github.com/lpalbou/abstractmemory.git"
-    "https://github.com/lpalbou/abstractsemantics.git"
-    "https://github.com/lpalbou/abstractvoice.git"
-    "https://github.com/lpalbou/abstractvision.git"
-    "https://github.com/lpalbou/AbstractMusic.git"
-    "https://github.com/lpalbou/abstractassistant.git"
-    "https://github.com/lpalbou/AbstractSkill.git"
+    "$REPO_BASE_URL/abstractcore.git"
+    "$REPO_BASE_URL/abstractruntime.git"
+    "$REPO_BASE_URL/abstractagent.git"
+    "$REPO_BASE_URL/abstractflow.git"
+    "$REPO_BASE_URL/abstractcode.git"
+    "$REPO_BASE_URL/abstractgateway.git"
+    "$REPO_BASE_URL/abstractmemory.git"
+    "$REPO_BASE_URL/abstractsemantics.git"
+    "$REPO_BASE_URL/abstractvoice.git"
+    "$REPO_BASE_URL/abstractvision.git"
+    "$REPO_BASE_URL/AbstractMusic.git"
+    "$REPO_BASE_URL/abstractassistant.git"
+    "$REPO_BASE_URL/AbstractSkill.git"
     # Browser UIs & npm packages
-    "https://github.com/lpalbou/abstractobserver.git"
+    "$REPO_BASE_URL/abstractobserver.git"
     # UI component library (React monorepo)
-    "https://github.com/lpalbou/abstractuic.git"
+    "$REPO_BASE_URL/abstractuic.git"
 )
 
+# ---------------------------------------------------------------------------
+# CLI flags
+# ---------------------------------------------------------------------------
+JOBS="${AF_CLONE_JOBS:-4}"
+CACHE_DIR="${AF_CLONE_CACHE:-}"
+PARTIAL=false
+TARGET_ARG=""
+
+while [[ $# -gt 0 ]]; do
+    case "$1" in
+        --jobs|-j) JOBS="${2:?--jobs needs a value}"; shift ;;
+        --jobs=*)  JOBS="${1#--jobs=}" ;;
+        --cache)   CACHE_DIR="${2:?--cache needs a directory}"; shift ;;
+        --cache=*) CACHE_DIR="${1#--cache=}" ;;
+        --partial) PARTIAL=true ;;
+        -*)        echo "ERROR: unknown option: $1"; exit 1 ;;
+        *)         TARGET_ARG="$1" ;;
+    esac
+    shift
+done
+
+if ! [[ "$JOBS" =~ ^[0-9]+$ ]] || [[ "$JOBS" -lt 1 ]]; then
+    echo "ERROR: --jobs must be a positive integer (got: $JOBS)"
+    exit 1
+fi
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -73,6 +119,78 @@ is_af_root() {
     [[ -f "$dir/pyproject.toml" ]] && grep -q 'name = "abstractframework"' "$dir/pyproject.toml" 2>/dev/null
 }
 
+# Milliseconds since the epoch (bash 5 has EPOCHREALTIME; macOS ships bash 3.2).
+now_ms() {
+    if [[ -n "${EPOCHREALTIME:-}" ]]; then
+        local now="${EPOCHREALTIME/[.,]/}"
+        printf '%s\n' "${now:0:${#now}-3}"
+    elif command -v python3 >/dev/null 2>&1; then
+        python3 -c 'import time; print(int(time.time() * 1000))'
+    else
+        printf '%s000\n' "$(date +%s)"
+    fi
+}
+
+# Create or refresh the bare mirror of a repository in CACHE_DIR; print its path.
+refresh_mirror() {
+    local repo_url="$1"
+    local mirror
+    mirror="$CACHE_DIR/$(basename "$repo_url" .git).git"
+    if [[ -d "$mirror" ]]; then
+        git -C "$mirror" remote update --prune >&2
+    else
+        git clone --quiet --mirror "$repo_url" "$mirror" >&2
+    fi
+    printf '%s\n' "$mirror"
+}
+
+# Clone or update one repository into its destination directory.
+# Usage: sync_repo <url> <destination>; prints "cloned" or "updated" on success.
+sync_repo() {
+    local repo_url="$1"
+    local dest="$2"
+    local mirror=""
+
+    if [[ -n "$CACHE_DIR" ]]; then
+        mirror="$(refresh_mirror "$repo_url")" || return 1
+    fi
+
+    if [[ -d "$dest/.git" ]]; then
+        if [[ -n "$mirror" ]]; then
+            # Pre-fetch from the mirror so the pull below only negotiates.
+            git -C "$dest" fetch --quiet "$mirror" '+refs/heads/*:refs/remotes/origin/*' >&2 \
+                || return 1
+        fi
+        (cd "$dest" && git pull --rebase --quiet) >&2 || return 1
+        echo "updated"
+        return 0
+    fi
+
+    local clone_args=(--quiet)
+    if [[ -n "$mirror" ]]; then
+        clone_args+=(--reference "$mirror" --dissociate)
+    elif $PARTIAL; then
+        clone_args+=(--filter=blob:none)
+    fi
+    git clone "${clone_args[@]}" "$repo_url" "$dest" >&2 || return 1
+    echo "cloned"
+}
+
+# Background job: sync one repository and record "<action> <elapsed ms>" in STATE_DIR.
+sync_job() {
+    local repo_url="$1"
+    local dest="$2"
+    local name="$3"
+    local started action
+    started="$(now_ms)"
+    if action="$(sync_repo "$repo_url" "$dest" 2>>"$STATE_DIR/$name.log")"; then
+        :
+    else
+        action="failed"
+    fi
+    printf '%s %s\n' "${action:-failed}" "$(( $(now_ms) - started ))" > "$STATE_DIR/$name.result"
+}
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -86,19 +204,28 @@ cloned=0
 updated=0
 failed=0
 
+STATE_DIR="$(mktemp -d "${TMPDIR:-/tmp}/af-clone.XXXXXX")"
+trap 'rm -rf "$STATE_DIR"' EXIT
+if [[ -n "$CACHE_DIR" ]]; then
+    mkdir -p "$CACHE_DIR"
+    CACHE_DIR="$(cd "$CACHE_DIR" && pwd)"
+fi
+
 # ── Resolve the root directory ──────────────────────────────────────────────
-if [[ -n "${1:-}" ]]; then
+if [[ -n "$TARGET_ARG" ]]; then
     # A target directory was supplied.
-    TARGET_DIR="$1"
+    TARGET_DIR="$TARGET_ARG"
     if is_af_root "$TARGET_DIR"; then
         echo "✓ Target is already an AbstractFramework checkout."
     else
         echo "⬇  Cloning   AbstractFramework (root)"
         mkdir -p "$(dirname "$TARGET_DIR")"
-        if git clone --quiet "$AF_REPO" "$TARGET_DIR" 2>/dev/null; then
+        sync_job "$AF_REPO" "$TARGET_DIR" "AbstractFramework"
+        if [[ "$(cut -d' ' -f1 "$STATE_DIR/AbstractFramework.result")" == "cloned" ]]; then
             cloned=$((cloned + 1))
         else
             echo "   ERROR: git clone failed for AbstractFramework"
+            tail -n 5 "$STATE_DIR/AbstractFramework.log" | sed 's/^/   /'
             exit 1
         fi
     fi
@@ -116,32 +243,65 @@ fi
 echo ""
 echo "Root directory:   $(cd "$TARGET_DIR" && pwd)"
 echo "Sibling repos:    ${#SIBLING_REPOS[@]}"
+echo "Parallel jobs:    $JOBS"
+if [[ -n "$CACHE_DIR" ]]; then
+    echo "Mirror cache:     $CACHE_DIR"
+fi
 echo ""
 
 # ── Clone / update sibling repos ───────────────────────────────────────────
+repo_names=()
+run_started="$(now_ms)"
 for repo_url in "${SIBLING_REPOS[@]}"; do
     repo_name=$(basename "$repo_url" .git)
     # Keep local checkout names aligned with PyPI package directories.
     if [[ "$repo_name" == "AbstractSkill" ]]; then
         repo_name="abstractskill"
     fi
+    repo_names+=("$repo_name")
 
     if [ -d "$TARGET_DIR/$repo_name/.git" ]; then
         echo "↻  Updating  $repo_name"
-        if (cd "$TARGET_DIR/$repo_name" && git pull --rebase --quiet 2>/dev/null); then
-            updated=$((updated + 1))
-        else
-            echo "   WARNING: git pull failed for $repo_name (resolve manually)"
-            failed=$((failed + 1))
-        fi
     else
         echo "⬇  Cloning   $repo_name"
-        if git clone --quiet "$repo_url" "$TARGET_DIR/$repo_name" 2>/dev/null; then
-            cloned=$((cloned + 1))
+    fi
+    # `wait -n` needs bash 4.3, so poll the running job count instead.
+    while [[ "$(jobs -rp | wc -l | tr -d ' ')" -ge "$JOBS" ]]; do
+        sleep 0.05
+    done
+    sync_job "$repo_url" "$TARGET_DIR/$repo_name" "$repo_name" &
+done
+wait
+run_elapsed=$(( $(now_ms) - run_started ))
+
+echo ""
+printf "  %-20s  %-8s  %8s\n" "repository" "result" "seconds"
+printf "  %s\n" "----------------------------------------"
+serial_ms=0
+for repo_name in "${repo_names[@]}"; do
+    read -r action elapsed_ms < "$STATE_DIR/$repo_name.result" || { action="failed"; elapsed_ms=0; }
+    serial_ms=$((serial_ms + elapsed_ms))
+    case "$action" in
+        cloned)  cloned=$((cloned + 1)) ;;
+        updated) updated=$((updated + 1)) ;;
+        *)       failed=$((failed + 1)) ;;
+    esac
+    printf "  %-20s  %-8s  %4d.%03d\n" "$repo_name" "$action" \
+        $((elapsed_ms / 1000)) $((elapsed_ms % 1000))
+done
+printf "  %s\n" "----------------------------------------"
+printf "  Wall time %d.%03ds (sequential sum %d.%03ds)\n" \
+    $((run_elapsed / 1000)) $((run_elapsed % 1000)) $((serial_ms / 1000)) $((serial_ms % 1000))
+
+for repo_name in "${repo_names[@]}"; do
+    if [[ "$(cut -d' ' -f1 "$STATE_DIR/$repo_name.result" 2>/dev/null)" == "failed" ]]; then
+        echo ""
+        if [ -d "$TARGET_DIR/$repo_name/.git" ]; then
+            echo "   WARNING: git pull failed for $repo_name (resolve manually)"
         else
             echo "   WARNING: git clone failed for $repo_name"
-            failed=$((failed + 1))
         fi
+        tail -n 5 "$STATE_DIR/$repo_name.log" 2>/dev/null | sed 's/^/     /'
     fi
 done
 
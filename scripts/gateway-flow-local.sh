@@ -210,64 +210,90 @@ show_log_tail() {
     tail -n 80 "$log_file" >&2 || true
 }
 
-url_ready() {
-    local url="$1"
-    "$PYTHON_BIN" - "$url" <<'PY'
+# Poll one URL from a single Python process: exponential backoff from 5 ms to 250 ms over
+# one reused HTTP connection, giving up as soon as the child process exits or the timeout
+# (seconds) elapses. Mode `contract` also validates the gateway discovery payload.
+wait_ready() {
+    local mode="$1"
+    local url="$2"
+    local timeout_s="$3"
+    local child_pid="${4:-}"
+    local token="${5:-}"
+    "$PYTHON_BIN" - "$mode" "$url" "$timeout_s" "$child_pid" "$token" <<'PY'
+import http.client
+import json
+import os
 import sys
-import urllib.request
+import time
+import urllib.parse
 
-try:
-    with urllib.request.urlopen(sys.argv[1], timeout=1.5) as response:
-        sys.exit(0 if response.status < 500 else 1)
-except Exception:
-    sys.exit(1)
-PY
-}
+mode, url, timeout_s, child_pid, token = sys.argv[1:6]
+parts = urllib.parse.urlsplit(url)
+path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+headers = {"Authorization": f"Bearer {token}"} if token else {}
+deadline = time.monotonic() + float(timeout_s)
 
-gateway_contract_ready() {
-    local url="$1"
-    local token="${2:-}"
-    "$PYTHON_BIN" - "$url" "$token" <<'PY'
-import json
-import sys
-import urllib.request
 
-url = sys.argv[1]
-token = sys.argv[2]
-headers = {}
-if token:
-    headers["Authorization"] = f"Bearer {token}"
-request = urllib.request.Request(url, headers=headers)
+def child_alive() -> bool:
+    if not child_pid:
+        return True
+    try:
+        os.kill(int(child_pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
 
-try:
-    with urllib.request.urlopen(request, timeout=2.0) as response:
-        if response.status >= 500:
-            raise RuntimeError(f"HTTP {response.status}")
-        payload = json.load(response)
-except Exception:
-    raise SystemExit(1)
-
-caps = payload.get("capabilities") if isinstance(payload, dict) else None
-contracts = caps.get("contracts") if isinstance(caps, dict) else None
-common = contracts.get("common") if isinstance(contracts, dict) else None
-flow_editor = contracts.get("flow_editor") if isinstance(contracts, dict) else None
-prompt_cache = common.get("prompt_cache") if isinstance(common, dict) else None
-durable_blocs = prompt_cache.get("durable_blocs") if isinstance(prompt_cache, dict) else None
-model_residency = common.get("model_residency") if isinstance(common, dict) else None
-runs = flow_editor.get("runs") if isinstance(flow_editor, dict) else None
-ledger = flow_editor.get("ledger") if isinstance(flow_editor, dict) else None
-
-checks = (
-    isinstance(contracts, dict),
-    isinstance(common, dict),
-    isinstance(flow_editor, dict) and bool(flow_editor.get("available", True)),
-    bool((runs or {}).get("start", {}).get("endpoint")),
-    bool((ledger or {}).get("stream", {}).get("endpoint")),
-    prompt_cache is None or isinstance(prompt_cache, dict),
-    durable_blocs is None or isinstance(durable_blocs, dict),
-    model_residency is None or isinstance(model_residency, dict),
-)
-raise SystemExit(0 if all(checks) else 1)
+
+def contract_ok(body: bytes) -> bool:
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return False
+    caps = payload.get("capabilities") if isinstance(payload, dict) else None
+    contracts = caps.get("contracts") if isinstance(caps, dict) else None
+    common = contracts.get("common") if isinstance(contracts, dict) else None
+    flow_editor = contracts.get("flow_editor") if isinstance(contracts, dict) else None
+    prompt_cache = common.get("prompt_cache") if isinstance(common, dict) else None
+    durable_blocs = prompt_cache.get("durable_blocs") if isinstance(prompt_cache, dict) else None
+    model_residency = common.get("model_residency") if isinstance(common, dict) else None
+    runs = flow_editor.get("runs") if isinstance(flow_editor, dict) else None
+    ledger = flow_editor.get("ledger") if isinstance(flow_editor, dict) else None
+    checks = (
+        isinstance(contracts, dict),
+        isinstance(common, dict),
+        isinstance(flow_editor, dict) and bool(flow_editor.get("available", True)),
+        bool((runs or {}).get("start", {}).get("endpoint")),
+        bool((ledger or {}).get("stream", {}).get("endpoint")),
+        prompt_cache is None or isinstance(prompt_cache, dict),
+        durable_blocs is None or isinstance(durable_blocs, dict),
+        model_residency is None or isinstance(model_residency, dict),
+    )
+    return all(checks)
+
+
+host = parts.hostname or "127.0.0.1"
+connection = http.client.HTTPConnection(host, parts.port or 80, timeout=2.0)
+delay = 0.005
+while True:
+    try:
+        connection.request("GET", path, headers=headers)
+        response = connection.getresponse()
+        body = response.read()
+        # Any answer below 500 means the server is up; only the contract needs a 2xx/3xx.
+        if mode == "contract":
+            ready = response.status < 400 and contract_ok(body)
+        else:
+            ready = response.status < 500
+        if ready:
+            raise SystemExit(0)
+    except (OSError, http.client.HTTPException):
+        connection.close()
+    if not child_alive() or time.monotonic() >= deadline:
+        raise SystemExit(1)
+    time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+    delay = min(delay * 2, 0.25)
 PY
 }
 
@@ -606,18 +632,7 @@ wait_for_url() {
     local url="$1"
     local timeout_s="${2:-$STARTUP_TIMEOUT_S}"
     local child_pid="${3:-}"
-    local started_at
-    started_at="$(date +%s)"
-    while true; do
-        url_ready "$url" && return 0
-        if [[ -n "$child_pid" ]] && ! kill -0 "$child_pid" >/dev/null 2>&1; then
-            return 1
-        fi
-        if (( "$(date +%s)" - started_at >= timeout_s )); then
-            return 1
-        fi
-        sleep 1
-    done
+    wait_ready url "$url" "$timeout_s" "$child_pid"
 }
 
 wait_for_gateway_contract() {
@@ -625,18 +640,7 @@ wait_for_gateway_contract() {
     local token="${2:-}"
     local timeout_s="${3:-$STARTUP_TIMEOUT_S}"
     local child_pid="${4:-}"
-    local started_at
-    started_at="$(date +%s)"
-    while true; do
-        gateway_contract_ready "$url" "$token" && return 0
-        if [[ -n "$child_pid" ]] && ! kill -0 "$child_pid" >/dev/null 2>&1; then
-            return 1
-        fi
-        if (( "$(date +%s)" - started_at >= timeout_s )); then
-            return 1
-        fi
-        sleep 1
-    done
+    wait_ready contract "$url" "$timeout_s" "$child_pid" "$token"
 }
 
 require_cmd lsof
@@ -1,10 +1,87 @@
 #!/usr/bin/env python3
+"""Generate `llms-full.txt` from key repo files.
+
+Generation is incremental. A sidecar index next to the output (`llms-full.index.json`)
+maps every input path to the byte offset, length, and SHA-256 of its section text in
+the output; `abstractframework.llms_full` reads single sections through it. When the
+section list and every section hash match the index, and the output still has the
+recorded size, the run writes nothing. Otherwise the sections are streamed to a
+temporary file beside the output, which then atomically replaces it, and the index is
+rewritten.
+
+The sections are the key files in `KEY_FILES`, followed by every other Markdown file
+under `docs/`, so new ADRs and backlog items are picked up without editing the list.
+
+The index also records an offline token estimate and a priority tier for every
+section, and defines context packs: for each token budget (`--pack-budgets`, default
+8k/32k/128k), the longest run of sections in priority order (`PACK_TIERS`, then
+`FILES` order) that fits. Every pack is a prefix of the next larger one and starts
+with the same header, so provider prompt caches can reuse the shared prefix.
+
+The BM25 search index for `abstractframework docs search` (`llms-full.search.json`)
+is kept in step: postings of unchanged sections are reused and only changed sections
+are re-tokenized.
+
+Only these root copies are committed; `setup.py` copies all three into the package
+(`abstractframework/data/`) at build time, so the `docs` commands work from a wheel.
+
+`--check` validates freshness from hashes alone: it exits 1 when an input no longer
+matches the index, the packs or search index are out of date, or the output no
+longer matches its recorded digest.
+"""
+
 from __future__ import annotations
 
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
 from pathlib import Path
+from typing import Any, BinaryIO, Callable, Mapping, Sequence, TypeVar
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+# The reader and the search index are shared with `abstractframework docs`.
+from abstractframework.docsearch import build_search_index, dump_search_index  # noqa: E402
+from abstractframework.llms_full import INDEX_FORMAT  # noqa: E402
+
+T = TypeVar("T")
+HEADER = (
+    "# AbstractFramework - llms-full\n"
+    "> Full text of key files from this repo. Sections are separated by `--- <path> ---`.\n"
+)
+PACK_HEADER = (
+    "# AbstractFramework - llms context pack\n"
+    "> Key files from this repo, most important first. "
+    "Sections are separated by `--- <path> ---`.\n"
+)
+DEFAULT_PACK_BUDGETS = (8_000, 32_000, 128_000)
 
+# Pack priority, highest first. A section belongs to the tier of the first
+# `TIER_PREFIXES` entry its path starts with, and to "core" otherwise.
+PACK_TIERS = ("core", "guides", "adr", "reference", "notes", "backlog")
+TIER_PREFIXES: tuple[tuple[str, str], ...] = (
+    ("docs/guide/", "guides"),
+    ("docs/scenarios/", "guides"),
+    ("docs/installers/", "guides"),
+    ("docs/adr/", "adr"),
+    ("abstractframework/", "reference"),
+    ("pyproject.toml", "reference"),
+    ("docs/skills/", "notes"),
+    ("docs/claude/", "notes"),
+    ("docs/comparisons/", "notes"),
+    ("docs/reports/", "notes"),
+    ("docs/backlog/", "backlog"),
+)
 
-FILES: list[str] = [
+# Key files, in `llms-full.txt` order. `docs_files()` appends every other Markdown file
+# under `docs/` (ADRs, installer notes, the rest of the backlog) in path order, so
+# `docs search` covers the whole docs tree.
+KEY_FILES: list[str] = [
     "README.md",
     "llms.txt",
     "pyproject.toml",
@@ -45,6 +122,7 @@ FILES: list[str] = [
     "docs/guide/telegram-integration.md",
     "docs/guide/email-integration.md",
     "docs/guide/process-manager-env-vars.md",
+    "docs/adr/README.md",
     "docs/backlog/overview.md",
     "docs/backlog/completed/0141_flow_browser_session_gateway_auth.md",
     "docs/backlog/planned/0142_gateway_tenant_isolation_and_shared_runtime.md",
@@ -90,25 +168,358 @@ FILES: list[str] = [
 ]
 
 
+def docs_files(root: Path, key_files: Sequence[str] = KEY_FILES) -> list[str]:
+    """Return `key_files`, then the remaining `docs/**/*.md` under `root` in path order."""
+
+    listed = set(key_files)
+    docs = sorted(path.relative_to(root).as_posix() for path in (root / "docs").rglob("*.md"))
+    return [*key_files, *(rel for rel in docs if rel not in listed)]
+
+
+FILES: list[str] = docs_files(REPO_ROOT)
+
+
+def index_path(output: Path) -> Path:
+    """Return the sidecar index path for `output` (`llms-full.txt` -> `llms-full.index.json`)."""
+
+    return output.with_name(f"{output.stem}.index.json")
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _read_input(root: Path, rel: str) -> bytes:
+    try:
+        return (root / rel).read_bytes()
+    except FileNotFoundError:
+        raise SystemExit(f"Missing file: {rel}") from None
+
+
+def _section_body(data: bytes) -> bytes:
+    # Same text as `read_text()` (universal newlines), always ending with a newline.
+    text = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    if not text.endswith("\n"):
+        text += "\n"
+    return text.encode("utf-8")
+
+
+# Each match is one estimated token: up to 6 ASCII letters, 2 other letters, 3 digits,
+# or 2 symbols; a line-break run; or indentation (2+ spaces/tabs).
+_TOKEN_PIECES = re.compile(
+    r"[A-Za-z]{1,6}|[^\W\d_A-Za-z]{1,2}|\d{1,3}|(?:[^\w\s]|_){1,2}|\n+|[ \t]{2,}"
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the BPE token count of `text` offline, without a tokenizer.
+
+    ASCII words count one token per started 6 letters, other scripts one per 2
+    characters, digit runs one per 3, symbol runs one per 2, and each line-break run
+    or indentation one. On this repo's docs it runs slightly above real tokenizers,
+    so packs stay within their budgets.
+    """
+
+    return _TOKEN_PIECES.subn("", text)[1]
+
+
+def section_tier(path: str) -> str:
+    for prefix, tier in TIER_PREFIXES:
+        if path.startswith(prefix):
+            return tier
+    return "core"
+
+
+def pack_name(budget: int) -> str:
+    return f"{budget // 1000}k" if budget % 1000 == 0 else str(budget)
+
+
+def build_packs(
+    sections: Sequence[dict[str, Any]], budgets: Sequence[int]
+) -> dict[str, dict[str, Any]]:
+    """Return `{name: {budget, tokens, sections}}`; each pack is a prefix of the next."""
+
+    ranked = sorted(
+        enumerate(sections), key=lambda item: (PACK_TIERS.index(item[1]["tier"]), item[0])
+    )
+    total = estimate_tokens(PACK_HEADER)
+    running: list[tuple[str, int]] = []
+    for _, section in ranked:
+        total += estimate_tokens(f"\n--- {section['path']} ---\n") + section["tokens"]
+        running.append((section["path"], total))
+    packs: dict[str, dict[str, Any]] = {}
+    for budget in sorted(budgets):
+        fitting = [(path, tokens) for path, tokens in running if tokens <= budget]
+        packs[pack_name(budget)] = {
+            "budget": budget,
+            "tokens": fitting[-1][1] if fitting else estimate_tokens(PACK_HEADER),
+            "sections": [path for path, _ in fitting],
+        }
+    return packs
+
+
+def input_hashes(root: Path, files: Sequence[str]) -> dict[str, str]:
+    return {rel: _sha256(_section_body(_read_input(root, rel))) for rel in files}
+
+
+def load_index(path: Path, expected_format: int | None = INDEX_FORMAT) -> dict[str, Any] | None:
+    try:
+        index = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(index, dict):
+        return None
+    if expected_format is not None and index.get("format") != expected_format:
+        return None
+    return index
+
+
+def stale_sections(index: dict[str, Any] | None, hashes: dict[str, str]) -> list[str]:
+    """Return the inputs whose section is missing from `index` or out of date."""
+
+    if index is None or index.get("header") != _sha256(HEADER.encode("utf-8")):
+        return list(hashes)
+    recorded = {section["path"]: section["sha256"] for section in index.get("sections", [])}
+    stale = [rel for rel, digest in hashes.items() if recorded.get(rel) != digest]
+    if not stale and list(recorded) != list(hashes):
+        # Same contents, but sections were added, removed, or reordered.
+        return list(hashes)
+    return stale
+
+
+def _write_sections(
+    out: BinaryIO,
+    root: Path,
+    files: Sequence[str],
+    known_tokens: Mapping[str, int] | None = None,
+) -> dict[str, Any]:
+    """Stream the sections to `out` and return their index entries.
+
+    Token counts are looked up by section hash in `known_tokens` and only estimated
+    for new text; with `known_tokens=None` they are not computed at all.
+    """
+
+    digest = hashlib.sha256()
+    offset = 0
+    sections: list[dict[str, Any]] = []
+
+    def write(chunk: bytes) -> None:
+        nonlocal offset
+        out.write(chunk)
+        digest.update(chunk)
+        offset += len(chunk)
+
+    write(HEADER.encode("utf-8"))
+    for rel in files:
+        body = _section_body(_read_input(root, rel))
+        write(f"\n--- {rel} ---\n".encode("utf-8"))
+        sha = _sha256(body)
+        section = {"path": rel, "sha256": sha, "offset": offset, "length": len(body)}
+        if known_tokens is not None:
+            section["tokens"] = known_tokens.get(sha)
+            if section["tokens"] is None:
+                section["tokens"] = estimate_tokens(body.decode("utf-8"))
+            section["tier"] = section_tier(rel)
+        sections.append(section)
+        write(body)
+    return {"size": offset, "sha256": digest.hexdigest(), "sections": sections}
+
+
+def _replace_atomically(path: Path, write: Callable[[BinaryIO], T]) -> T:
+    """Call `write(file)` on a temporary file beside `path`, then rename it over `path`."""
+
+    import tempfile
+
+    mode = path.stat().st_mode & 0o777 if path.exists() else 0o644
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            result = write(out)
+            out.flush()
+            os.fsync(out.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return result
+
+
+def _write_index(path: Path, index: dict[str, Any]) -> None:
+    payload = json.dumps(index, indent=2) + "\n"
+    _replace_atomically(path, lambda out: out.write(payload.encode("utf-8")))
+
+
+def _with_packs(index: dict[str, Any], budgets: Sequence[int]) -> dict[str, Any]:
+    # Tiers follow the current `TIER_PREFIXES`, so re-ranking needs no re-read.
+    sections = [{**section, "tier": section_tier(section["path"])} for section in index["sections"]]
+    return {
+        **index,
+        "sections": sections,
+        "pack_header": PACK_HEADER,
+        "packs": build_packs(sections, budgets),
+    }
+
+
+def _search_path(output: Path) -> Path:
+    return output.with_name(f"{output.stem}.search.json")
+
+
+def _search_is_current(output: Path, index: dict[str, Any]) -> bool:
+    # The search index starts with the digest of the llms-full.txt it was built from;
+    # the header is enough to tell whether it is current.
+    try:
+        with _search_path(output).open("rb") as handle:
+            head = handle.read(256).decode("utf-8", errors="replace")
+    except OSError:
+        return False
+    return f'"source_sha256":"{index["sha256"]}"' in head
+
+
+def _update_search(root: Path, output: Path, index: dict[str, Any]) -> list[str]:
+    """Bring the search index in step with `index`; return the re-tokenized sections."""
+
+    if _search_is_current(output, index):
+        return []
+    path = _search_path(output)
+    previous = load_index(path, expected_format=None)
+    search, tokenized = build_search_index(
+        [(section["path"], section["sha256"]) for section in index["sections"]],
+        lambda rel: _section_body(_read_input(root, rel)).decode("utf-8"),
+        previous,
+        source_sha256=index["sha256"],
+    )
+    payload = dump_search_index(search)
+    _replace_atomically(path, lambda out: out.write(payload.encode("utf-8")))
+    return tokenized
+
+
+def generate(
+    root: Path,
+    files: Sequence[str],
+    output: Path,
+    *,
+    force: bool = False,
+    budgets: Sequence[int] = DEFAULT_PACK_BUDGETS,
+) -> tuple[list[str], dict[str, Any] | None]:
+    """Regenerate `output` when needed; return `(changed inputs, index)`.
+
+    An empty list means the output was already up to date; its index is still
+    rewritten when only the pack budgets or tiers changed. Outputs that are not
+    regular files (such as the null device) are written directly, without an index.
+    """
+
+    if output.exists() and not output.is_file():
+        with output.open("wb") as out:
+            _write_sections(out, root, files)
+        return list(files), None
+
+    sidecar = index_path(output)
+    index = load_index(sidecar)
+    changed = stale_sections(index, input_hashes(root, files))
+    if index is not None and not changed and not force:
+        try:
+            if output.stat().st_size == index["size"]:
+                packed = _with_packs(index, budgets)
+                if packed != index:
+                    _write_index(sidecar, packed)
+                _update_search(root, output, packed)
+                return [], packed
+        except OSError:
+            pass
+    # `--force` also re-estimates tokens, e.g. after `estimate_tokens` changed.
+    known_tokens = {
+        section["sha256"]: section["tokens"]
+        for section in (index or {}).get("sections", [])
+        if not force
+    }
+    written = _replace_atomically(
+        output, lambda out: _write_sections(out, root, files, known_tokens)
+    )
+    index = {
+        "format": INDEX_FORMAT,
+        "output": output.name,
+        "header": _sha256(HEADER.encode("utf-8")),
+        **written,
+    }
+    index = _with_packs(index, budgets)
+    _write_index(sidecar, index)
+    _update_search(root, output, index)
+    return changed or list(files), index
+
+
+def check(
+    root: Path,
+    files: Sequence[str],
+    output: Path,
+    budgets: Sequence[int] = DEFAULT_PACK_BUDGETS,
+) -> list[str]:
+    """Return why `output` is stale (empty when fresh), without writing anything."""
+
+    index = load_index(index_path(output))
+    if index is None:
+        return [f"{index_path(output).name} is missing or unreadable"]
+    problems = [f"{rel} changed" for rel in stale_sections(index, input_hashes(root, files))]
+    if not problems and _with_packs(index, budgets) != index:
+        problems.append("context packs are out of date")
+    if not _search_is_current(output, index):
+        problems.append(f"{_search_path(output).name} is out of date")
+    try:
+        data = output.read_bytes()
+    except OSError:
+        return [*problems, f"{output.name} is missing"]
+    if len(data) != index.get("size") or _sha256(data) != index.get("sha256"):
+        problems.append(f"{output.name} does not match its index")
+    return problems
+
+
 def main() -> None:
-    repo_root = Path(__file__).resolve().parents[1]
-    out = repo_root / "llms-full.txt"
-
-    parts: list[str] = []
-    parts.append("# AbstractFramework - llms-full\n")
-    parts.append("> Full text of key files from this repo. Sections are separated by `--- <path> ---`.\n")
-
-    for rel in FILES:
-        p = repo_root / rel
-        if not p.exists():
-            raise SystemExit(f"Missing file: {rel}")
-        parts.append(f"\n--- {rel} ---\n")
-        parts.append(p.read_text(encoding="utf-8"))
-        if not parts[-1].endswith("\n"):
-            parts.append("\n")
-
-    out.write_text("".join(parts), encoding="utf-8")
-    print(f"Wrote {out} ({out.stat().st_size} bytes)")
+    parser = argparse.ArgumentParser(description="Generate llms-full.txt from key repo files.")
+    parser.add_argument(
+        "--output", type=Path, default=REPO_ROOT / "llms-full.txt", help="Output path"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit 1 if the output is stale, comparing hashes only; writes nothing",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Rewrite the output even if it is up to date"
+    )
+    parser.add_argument(
+        "--pack-budgets",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_PACK_BUDGETS),
+        metavar="TOKENS",
+        help="Token budgets of the context packs (default: 8000 32000 128000)",
+    )
+    args = parser.parse_args()
+    out = args.output
+
+    if args.check:
+        problems = check(REPO_ROOT, FILES, out, args.pack_budgets)
+        if problems:
+            print(f"{out} is out of date:", file=sys.stderr)
+            for problem in problems:
+                print(f"  - {problem}", file=sys.stderr)
+            print("Run: python scripts/gen_llms_full.py", file=sys.stderr)
+            raise SystemExit(1)
+        print(f"{out} is up to date ({len(FILES)} sections)")
+        return
+
+    changed, index = generate(
+        REPO_ROOT, FILES, out, force=args.force, budgets=args.pack_budgets
+    )
+    if not changed:
+        print(f"{out} is up to date ({len(FILES)} sections)")
+    elif index is None:
+        print(f"Wrote {out}")
+    else:
+        print(f"Wrote {out} ({index['size']} bytes, {len(changed)}/{len(FILES)} sections changed)")
+    if index is not None:
+        for name, pack in index["packs"].items():
+            print(f"  pack {name}: {len(pack['sections'])} sections, ~{pack['tokens']} tokens")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,39 @@
+"""Build hook that ships the generated `llms-full.*` files as package data.
+
+`scripts/gen_llms_full.py` writes `llms-full.txt`, its offset index, and its search
+index at the repository root, and only that copy is committed. `build_py` copies the
+three files into `abstractframework/data/` of the build, so wheels carry them for
+the `abstractframework docs` commands. The project metadata lives in `pyproject.toml`.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from setuptools import setup
+from setuptools.command.build_py import build_py
+
+ROOT = Path(__file__).resolve().parent
+LLMS_FULL_FILES = ("llms-full.txt", "llms-full.index.json", "llms-full.search.json")
+PACKAGE_DATA_DIR = Path("abstractframework") / "data"
+
+
+class BuildPyWithLlmsFull(build_py):
+    """`build_py` that also copies the root `llms-full.*` files into the package."""
+
+    def _llms_full_targets(self) -> list[tuple[Path, Path]]:
+        target = Path(self.build_lib) / PACKAGE_DATA_DIR
+        return [(ROOT / name, target / name) for name in LLMS_FULL_FILES]
+
+    def run(self) -> None:
+        super().run()
+        for source, target in self._llms_full_targets():
+            self.mkpath(str(target.parent))
+            self.copy_file(str(source), str(target))
+
+    def get_outputs(self, include_bytecode: bool = True) -> list[str]:
+        outputs = super().get_outputs(include_bytecode)
+        return [*outputs, *(str(target) for _, target in self._llms_full_targets())]
+
+
+setup(cmdclass={"build_py": BuildPyWithLlmsFull})
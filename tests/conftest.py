@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from abstractframework import __version__
+from abstractframework.cache import CACHE_ENV_VAR
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the framework cache at the test's `tmp_path`, never at the user's cache."""
+
+    path = tmp_path / "cache"
+    monkeypatch.setenv(CACHE_ENV_VAR, str(path))
+    return path
+
+
+def make_wheel(
+    directory: Path,
+    name: str,
+    version: str,
+    requires: list[str] = (),
+    tag: str = "py3-none-any",
+) -> Path:
+    """Write a minimal wheel tagged `tag`, enough for pip to resolve and install."""
+
+    info = f"{name}-{version}.dist-info"
+    files = {
+        f"{name}/__init__.py": "",
+        f"{info}/METADATA": "\n".join(
+            ["Metadata-Version: 2.1", f"Name: {name}", f"Version: {version}"]
+            + [f"Provides-Extra: {extra}" for extra in ("apple", "gpu")]
+            + [f"Requires-Dist: {requirement}" for requirement in requires]
+        )
+        + "\n",
+        f"{info}/WHEEL": "Wheel-Version: 1.0\nGenerator: test\nRoot-Is-Purelib: true\n"
+        f"Tag: {tag}\n",
+    }
+    path = directory / f"{name}-{version}-{tag}.whl"
+    with zipfile.ZipFile(path, "w") as archive:
+        for relative, text in files.items():
+            archive.writestr(relative, text)
+        archive.writestr(f"{info}/RECORD", "".join(f"{entry},,\n" for entry in files))
+    return path
+
+
+@pytest.fixture()
+def wheelhouse(tmp_path: Path) -> Path:
+    """A wheel directory standing in for an index: the meta-package and two dependencies."""
+
+    wheels = tmp_path / "wheels"
+    wheels.mkdir()
+    make_wheel(
+        wheels,
+        "abstractframework",
+        __version__,
+        ["alpha>=1", 'beta==2.*; extra == "gpu"'],
+    )
+    make_wheel(wheels, "alpha", "1.0")
+    make_wheel(wheels, "alpha", "1.2")
+    make_wheel(wheels, "beta", "2.1")
+    make_wheel(wheels, "beta", "3.0")
+    return wheels
+
+
+@pytest.fixture(scope="session")
+def built_package(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A directory holding the package as a wheel installs it, built by `setup.py build_py`."""
+
+    build = tmp_path_factory.mktemp("build")
+    result = subprocess.run(
+        [sys.executable, "setup.py", "-q", "egg_info", "--egg-base", str(build)]
+        + ["build_py", "--build-lib", str(build / "site")],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        timeout=120,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+    return build / "site"
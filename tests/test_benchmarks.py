@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _hot_paths() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("hot_paths", ROOT / "benchmarks" / "hot_paths.py")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_summarize_reports_percentiles() -> None:
+    stats = _hot_paths().summarize([float(value) for value in range(1, 101)])
+
+    assert stats["rounds"] == 100
+    assert stats["min"] == 1.0 and stats["max"] == 100.0
+    assert stats["p50"] == 50.5
+    assert stats["p90"] < stats["p95"] < stats["p99"] <= stats["max"]
+
+
+def test_compare_flags_only_regressions_beyond_threshold() -> None:
+    hot_paths = _hot_paths()
+    baseline = {"results": {"import": {"p50": 10.0}, "manifest_json": {"p50": 1.0}}}
+    current = {
+        "results": {
+            "import": {"p50": 12.0},
+            "manifest_json": {"p50": 1.5},
+            "gen_llms_full": {"p50": 99.0},
+        }
+    }
+
+    assert hot_paths.compare(current, baseline, "p50", 0.25) == [
+        "manifest_json: p50 1.50 ms vs baseline 1.00 ms (+50%, threshold +25%)"
+    ]
+    assert hot_paths.compare(current, baseline, "p50", 0.5) == []
+
+
+def test_single_round_runs_in_fresh_interpreter() -> None:
+    assert _hot_paths().run_round("manifest_build") >= 0
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import io
+import json
+import sys
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from abstractframework import NPM_RELEASE_VERSIONS, cli
+from abstractframework.bundle import (
+    BundleError,
+    build_bundle,
+    install_bundle,
+    install_command,
+    verify_bundle,
+)
+from abstractframework.locks import current_target, supported_platforms
+from abstractframework.npmwarm import npm_tarball_name
+from conftest import make_wheel
+
+
+def _npm_tarballs(directory: Path) -> Path:
+    directory.mkdir()
+    for package, version in NPM_RELEASE_VERSIONS.items():
+        data = json.dumps(
+            {"name": package, "version": version, "dependencies": {"left-pad": "^1.3.0"}}
+        ).encode("utf-8")
+        info = tarfile.TarInfo("package/package.json")
+        info.size = len(data)
+        with tarfile.open(directory / npm_tarball_name(package, version), "w:gz") as archive:
+            archive.addfile(info, io.BytesIO(data))
+    return directory
+
+
+def test_bundle_deduplicates_wheels_across_profiles(tmp_path: Path, wheelhouse: Path) -> None:
+    npm_dir = _npm_tarballs(tmp_path / "npm-src")
+    bundle = tmp_path / "bundle"
+
+    manifest = build_bundle(bundle, ["light"], wheel_dirs=[wheelhouse], npm_dirs=[npm_dir])
+    assert manifest["reused_wheels"] == 0
+    manifest = build_bundle(bundle, ["gpu"], wheel_dirs=[wheelhouse], npm_dirs=[npm_dir])
+
+    assert manifest["reused_wheels"] == 2
+    assert sorted(manifest["profiles"]) == ["gpu", "light"]
+    assert sorted(path.name for path in (bundle / "wheels").iterdir()) == sorted(
+        manifest["wheels"]
+    )
+    assert {name: wheel["profiles"] for name, wheel in manifest["wheels"].items()} == {
+        next(name for name in manifest["wheels"] if name.startswith("abstractframework-")): [
+            "gpu",
+            "light",
+        ],
+        "alpha-1.2-py3-none-any.whl": ["gpu", "light"],
+        "beta-2.1-py3-none-any.whl": ["gpu"],
+    }
+    npm = manifest["npm"]["@abstractframework/flow"]
+    assert npm["dependencies"] == {"left-pad": "^1.3.0"}
+    assert (bundle / npm["path"]).is_file()
+    assert json.loads((bundle / "bundle.json").read_text(encoding="utf-8"))["wheels"] == (
+        manifest["wheels"]
+    )
+    assert verify_bundle(bundle) == []
+
+    (bundle / "wheels" / "beta-2.1-py3-none-any.whl").write_bytes(b"tampered")
+    assert verify_bundle(bundle) == ["wheels/beta-2.1-py3-none-any.whl does not match its checksum"]
+    with pytest.raises(BundleError, match="failed verification"):
+        install_bundle(bundle, "gpu")
+
+
+def test_bundle_installs_offline_with_no_resolver(tmp_path: Path, wheelhouse: Path) -> None:
+    bundle = tmp_path / "bundle"
+    build_bundle(bundle, ["gpu"], wheel_dirs=[wheelhouse], include_npm=False)
+    target = tmp_path / "target"
+
+    command = install_command(bundle, "gpu")
+    assert {"--no-index", "--no-deps", "--require-hashes"} <= set(command)
+
+    assert install_bundle(bundle, "gpu", extra_args=["--target", str(target), "--quiet"]) == 0
+    assert (target / "beta" / "__init__.py").exists()
+
+    with pytest.raises(BundleError, match="no profile 'light'"):
+        install_command(bundle, "light")
+    with pytest.raises(BundleError, match="no gpu lock for cp39-other"):
+        install_command(bundle, "gpu", tag="cp39-other")
+
+
+def test_bundle_cli(tmp_path: Path, wheelhouse: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    bundle = tmp_path / "bundle"
+    args = ["bundle", "--profile", "light", "--output", str(bundle), "--no-npm"]
+
+    assert cli.main([*args, "--wheel-dir", str(wheelhouse)]) == 0
+    assert "wheels: 2 (0.0 MB, 0 already present)" in capsys.readouterr().out
+
+    # The bundle's own wheels are a source, so a rebuild needs no other wheel directory.
+    assert cli.main(args) == 0
+    assert "2 already present" in capsys.readouterr().out
+
+    assert cli.main(["bundle", "--profile", "light", "--output", str(tmp_path / "other")]) == 2
+    assert "no wheels found" in capsys.readouterr().err
+
+
+def test_bundle_cli_for_another_python_keeps_manylinux_wheels(
+    tmp_path: Path, wheelhouse: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    manylinux = next(
+        (tag for tag in supported_platforms() if tag.startswith("manylinux_2_17_")), None
+    )
+    if manylinux is None:
+        pytest.skip("this host does not run manylinux wheels")
+    version = "3.10" if sys.version_info[:2] != (3, 10) else "3.11"
+    abi = f"cp{version.replace('.', '')}"
+    for wheel in wheelhouse.glob("alpha-*"):
+        wheel.unlink()
+    make_wheel(wheelhouse, "alpha", "1.2", tag=f"{abi}-{abi}-{manylinux}")
+    bundle = tmp_path / "bundle"
+
+    args = ["bundle", "--profile", "light", "--output", str(bundle), "--no-npm", "--json"]
+    assert cli.main([*args, "--wheel-dir", str(wheelhouse), "--python-version", version]) == 0
+
+    manifest = json.loads(capsys.readouterr().out)
+    (entry,) = manifest["profiles"]["light"]
+    assert entry["target"]["tag"] == f"{abi}-{current_target().platforms[0]}"
+    assert f"alpha-1.2-{abi}-{abi}-{manylinux}.whl" in {
+        wheel["filename"] for wheel in entry["wheels"]
+    }
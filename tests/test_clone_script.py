@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+CLONE_SCRIPT = ROOT / "scripts" / "clone.sh"
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("git") is None or shutil.which("bash") is None,
+    reason="git and bash are required",
+)
+
+
+def _remote_names() -> list[str]:
+    text = CLONE_SCRIPT.read_text(encoding="utf-8")
+    # AbstractFramework (the root) plus every SIBLING_REPOS entry.
+    return re.findall(r'"\$REPO_BASE_URL/([^"/]+)\.git"', text)
+
+
+def _git(*args: str, cwd: Path | None = None) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _commit(repo: Path, name: str, content: str) -> None:
+    (repo / name).write_text(content, encoding="utf-8")
+    _git("add", name, cwd=repo)
+    _git("commit", "-q", "-m", f"add {name}", cwd=repo)
+
+
+@pytest.fixture
+def remotes(tmp_path: Path) -> Path:
+    """Local bare repositories standing in for GitHub."""
+
+    seed = tmp_path / "seed"
+    seed.mkdir()
+    _git("init", "-q", cwd=seed)
+    (seed / "pyproject.toml").write_text('[project]\nname = "abstractframework"\n')
+    _git("add", "pyproject.toml", cwd=seed)
+    _commit(seed, "README.md", "seed\n")
+    base = tmp_path / "remotes"
+    for name in _remote_names():
+        _git("clone", "-q", "--bare", str(seed), str(base / f"{name}.git"))
+    return base
+
+
+def _run_clone(remotes: Path, *args: str) -> subprocess.CompletedProcess[str]:
+    env = dict(os.environ, AF_REPO_BASE_URL=str(remotes))
+    env.pop("AF_CLONE_CACHE", None)
+    return subprocess.run(
+        ["bash", str(CLONE_SCRIPT), *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+
+
+def test_clone_uses_mirror_cache_and_updates_concurrently(remotes: Path, tmp_path: Path) -> None:
+    workspace = tmp_path / "workspace"
+    cache = tmp_path / "cache"
+
+    first = _run_clone(remotes, "--jobs", "4", "--cache", str(cache), str(workspace))
+
+    assert first.returncode == 0, first.stdout + first.stderr
+    assert "Cloned:  16" in first.stdout
+    assert re.search(r"abstractskill\s+cloned\s+\d+\.\d{3}", first.stdout)
+    assert "Wall time" in first.stdout
+    assert (cache / "abstractcore.git").is_dir()
+    core = workspace / "abstractcore"
+    assert (core / "README.md").is_file()
+    # --dissociate: the checkout does not borrow objects from the cache.
+    assert not (core / ".git" / "objects" / "info" / "alternates").exists()
+
+    upstream = tmp_path / "upstream-core"
+    _git("clone", "-q", str(remotes / "abstractcore.git"), str(upstream))
+    _commit(upstream, "NEW.md", "new\n")
+    _git("push", "-q", "origin", "HEAD", cwd=upstream)
+
+    second = _run_clone(remotes, "-j", "4", "--cache", str(cache), str(workspace))
+
+    assert second.returncode == 0, second.stdout + second.stderr
+    assert "Updated: 15" in second.stdout
+    assert (core / "NEW.md").is_file()
+
+
+def test_clone_partial_reports_failures(remotes: Path, tmp_path: Path) -> None:
+    shutil.rmtree(remotes / "abstractuic.git")
+    workspace = tmp_path / "workspace"
+
+    result = _run_clone(remotes, "--partial", "--jobs=1", str(workspace))
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert re.search(r"abstractuic\s+failed", result.stdout)
+    assert "WARNING: git clone failed for abstractuic" in result.stdout
+    assert "Failed:  1" in result.stdout
+    core = workspace / "abstractcore"
+    config = subprocess.run(
+        ["git", "-C", str(core), "config", "remote.origin.partialclonefilter"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert config.stdout.strip() == "blob:none"
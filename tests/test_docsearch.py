@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from abstractframework import cli
+from abstractframework.docsearch import (
+    DocsSearch,
+    build_search_index,
+    dump_search_index,
+    search_docs,
+    search_index_path,
+    tokenize,
+)
+from abstractframework.llms_full import LLMS_FULL_ENV, LlmsFullError
+
+ROOT = Path(__file__).resolve().parents[1]
+
+DOCS = {
+    "README.md": "# AbstractFramework\nDurable agents on a gateway.\n",
+    "docs/guide/prompt-caching.md": (
+        "# Prompt caching\nReuse prompt cache keys per session.\nProviders differ.\n"
+    ),
+    "docs/guide/telegram.md": "# Telegram\nConnect a Telegram bot to the gateway.\n",
+    "docs/faq.md": "Questions about providers and the prompt.\n",
+}
+
+
+def _gen_llms_full() -> ModuleType:
+    spec = importlib.util.spec_from_file_location(
+        "gen_llms_full", ROOT / "scripts" / "gen_llms_full.py"
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _generate(root: Path, docs: dict[str, str] = DOCS) -> Path:
+    for rel, text in docs.items():
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(text, encoding="utf-8")
+    output = root / "llms-full.txt"
+    _gen_llms_full().generate(root, list(docs), output)
+    return output
+
+
+def test_tokenize_folds_case_plurals_and_stopwords() -> None:
+    assert tokenize("The Providers of prompt-caches, and KEYS") == [
+        "provider",
+        "prompt",
+        "cache",
+        "key",
+    ]
+
+
+def test_search_ranks_sections_with_snippets(tmp_path: Path) -> None:
+    output = _generate(tmp_path)
+
+    hits = search_docs("prompt cache keys", path=output)
+
+    assert [hit.path for hit in hits][:2] == ["docs/guide/prompt-caching.md", "docs/faq.md"]
+    assert hits[0].line == 2
+    assert hits[0].snippet == "Reuse prompt cache keys per session."
+    assert hits[0].score > hits[1].score
+    assert search_docs("telegram bot", path=output, limit=1)[0].path == "docs/guide/telegram.md"
+    assert search_docs("the and", path=output) == []
+    assert search_docs("nonexistent", path=output) == []
+
+
+def test_search_index_updates_incrementally(tmp_path: Path) -> None:
+    sections = [(path, f"sha-{path}") for path in DOCS]
+    read: list[str] = []
+
+    def read_text(path: str) -> str:
+        read.append(path)
+        return DOCS[path]
+
+    first, tokenized = build_search_index(sections, read_text)
+    assert tokenized == list(DOCS)
+
+    read.clear()
+    changed = dict(DOCS, **{"docs/faq.md": "Telegram questions.\n"})
+    moved = [sections[3], sections[0], sections[2], sections[1]]
+    moved[0] = ("docs/faq.md", "sha-new")
+    second, tokenized = build_search_index(moved, lambda path: changed[path], first)
+    rebuilt, _ = build_search_index(moved, lambda path: changed[path])
+
+    assert tokenized == ["docs/faq.md"]
+    assert read == []
+    assert second == rebuilt
+    assert json.loads(dump_search_index(second)) == second
+
+
+def test_search_rejects_stale_index(tmp_path: Path) -> None:
+    output = _generate(tmp_path)
+    search_path = search_index_path(output)
+    index = json.loads(search_path.read_text(encoding="utf-8"))
+    search_path.write_text(json.dumps({**index, "source_sha256": "stale"}), encoding="utf-8")
+
+    search = DocsSearch(output)
+    with pytest.raises(LlmsFullError, match="does not match"):
+        search.search("prompt")
+    search.close()
+
+
+def test_generate_reindexes_only_changed_sections(tmp_path: Path) -> None:
+    gen = _gen_llms_full()
+    output = _generate(tmp_path)
+    (tmp_path / "docs" / "faq.md").write_text("Telegram groups.\n", encoding="utf-8")
+
+    gen.generate(tmp_path, list(DOCS), output)
+
+    assert gen.check(tmp_path, list(DOCS), output) == []
+    assert search_docs("groups", path=output)[0].path == "docs/faq.md"
+    search_index_path(output).unlink()
+    assert gen.check(tmp_path, list(DOCS), output) == ["llms-full.search.json is out of date"]
+
+
+def test_docs_search_cli(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    output = _generate(tmp_path)
+
+    assert cli.main(["docs", "search", "telegram", "--file", str(output), "--json"]) == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["hits"][0]["path"] == "docs/guide/telegram.md"
+    assert payload["elapsed_ms"] >= 0
+
+    assert cli.main(["docs", "search", "nothing-matches", "--file", str(output)]) == 1
+    assert "0 results" in capsys.readouterr().out
+
+
+def test_checked_in_search_index_covers_the_adrs() -> None:
+    hits = search_docs("effect system design", limit=3, path=ROOT / "llms-full.txt")
+
+    assert hits[0].path == "docs/adr/0002-effect-system-design.md"
+    assert search_docs("truncation policy", limit=1, path=ROOT / "llms-full.txt")[0].path == (
+        "docs/adr/0026-truncation-policy-and-contract.md"
+    )
+
+
+def test_docs_search_works_from_an_installed_package(
+    tmp_path: Path, built_package: Path
+) -> None:
+    env = {key: value for key, value in os.environ.items() if key != LLMS_FULL_ENV}
+    env["PYTHONPATH"] = str(built_package)
+
+    result = subprocess.run(
+        [sys.executable, "-m", "abstractframework.cli", "docs", "search", "gateway", "--json"],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        env=env,
+        timeout=60,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout)["hits"]
@@ -0,0 +1,566 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from abstractframework import cli
+
+
+def test_doctor_report_scans_distributions_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    from abstractframework.distributions import scan_distributions
+
+    calls: list[None] = []
+
+    def _counting_scan() -> dict[str, str]:
+        calls.append(None)
+        return scan_distributions()
+
+    monkeypatch.setattr(cli, "scan_distributions", _counting_scan)
+    cli.build_doctor_report(include_environment=False)
+
+    assert len(calls) == 1
+
+
+def _checks_by_id(report: dict[str, object]) -> dict[str, dict[str, str]]:
+    return {check["id"]: check for check in report["checks"]}  # type: ignore[index,union-attr]
+
+
+def test_doctor_probes_run_concurrently_under_one_deadline(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Each probe only gets past the barrier once all three are in flight, so run one
+    # at a time they would time out instead of reporting ok.
+    in_flight = threading.Barrier(3, timeout=5.0)
+
+    def _slow_version(command: str, timeout: float = 5.0) -> str | None:
+        in_flight.wait()
+        time.sleep(0.3)
+        return f"{command} 1.0"
+
+    def _which(command: str) -> str | None:
+        in_flight.wait()
+        return None
+
+    monkeypatch.setattr(cli, "_command_version", _slow_version)
+    monkeypatch.setattr(cli, "_which", _which)
+
+    start = time.monotonic()
+    report = cli.build_doctor_report(probe_timeout=5.0)
+    elapsed = time.monotonic() - start
+
+    checks = _checks_by_id(report)
+    assert checks["node"].pop("timing")["wall_ms"] >= 300
+    assert checks["node"] == {
+        "id": "node",
+        "status": "ok",
+        "message": "Node is available: node 1.0",
+    }
+    assert checks["npm"]["status"] == "ok"
+    assert checks["hardware:gpu"]["status"] == "warn"
+    assert "timed out" not in checks["hardware:gpu"]["message"]
+    assert elapsed < 4.0
+
+
+def test_doctor_probe_timeout_is_reported_as_warning(monkeypatch: pytest.MonkeyPatch) -> None:
+    release = threading.Event()
+    npm_done = threading.Event()
+
+    def _hanging_version(command: str, timeout: float = 5.0) -> str | None:
+        if command == "npm":
+            release.wait(30)
+            npm_done.set()
+        return f"{command} 1.0"
+
+    def _expiring_which(command: str) -> str | None:
+        raise subprocess.TimeoutExpired(command, 0.2)
+
+    monkeypatch.setattr(cli, "_command_version", _hanging_version)
+    monkeypatch.setattr(cli, "_which", _expiring_which)
+
+    try:
+        start = time.monotonic()
+        report = cli.build_doctor_report(probe_timeout=0.2)
+        elapsed = time.monotonic() - start
+        # The report came back while the npm probe was still blocked.
+        assert not npm_done.is_set()
+    finally:
+        release.set()
+
+    checks = _checks_by_id(report)
+    assert checks["node"]["status"] == "ok"
+    assert checks["npm"]["status"] == "warn"
+    assert checks["npm"]["message"].startswith("npm probe timed out after 0.")
+    assert checks["hardware:gpu"]["status"] == "warn"
+    assert "timed out" in checks["hardware:gpu"]["message"]
+    assert elapsed < 10.0
+
+
+def test_doctor_cli_accepts_probe_timeout(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    seen: list[float] = []
+
+    def _record_version(command: str, timeout: float = 5.0) -> str | None:
+        seen.append(timeout)
+        return None
+
+    monkeypatch.setattr(cli, "_command_version", _record_version)
+    monkeypatch.setattr(cli, "_which", lambda command: None)
+
+    cli.main(["doctor", "--json", "--probe-timeout", "1.5"])
+
+    assert seen == [1.5, 1.5]
+    assert '"status"' in capsys.readouterr().out
+
+
+def _fake_node(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[Path, list[str]]:
+    executable = tmp_path / "bin" / "node"
+    executable.parent.mkdir()
+    executable.write_text("#!/bin/sh\n", encoding="utf-8")
+    calls: list[str] = []
+
+    def _version(command: str, timeout: float = 5.0) -> str | None:
+        calls.append(command)
+        return f"{command} 1.0"
+
+    def _which(command: str) -> str | None:
+        return str(executable) if command in {"node", "npm"} else None
+
+    monkeypatch.setattr(cli, "_command_version", _version)
+    monkeypatch.setattr(cli, "_which", _which)
+    return executable, calls
+
+
+def test_doctor_npm_warm_check_is_informational_and_needs_npm(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _fake_node(tmp_path, monkeypatch)
+
+    check = _checks_by_id(cli.build_doctor_report())["npm:warm"]
+    assert check["status"] == "ok"
+    assert check["message"] == "npm apps are not pre-warmed; UIs start through npx"
+
+    monkeypatch.setattr(cli, "_command_version", lambda command, timeout=5.0: None)
+    assert "npm:warm" not in _checks_by_id(cli.build_doctor_report())
+
+
+def test_doctor_cache_serves_warm_runs_without_probing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from abstractframework.cache import ProbeCache
+
+    _, calls = _fake_node(tmp_path, monkeypatch)
+    cache_path = tmp_path / "cache" / "doctor-probes.json"
+
+    cold = _checks_by_id(cli.build_doctor_report(cache=ProbeCache(cache_path)))
+    assert sorted(calls) == ["node", "npm"]
+    assert not any(check.get("cached") for check in cold.values())
+
+    calls.clear()
+    monkeypatch.setattr(cli, "scan_distributions", lambda: pytest.fail("scanned on warm run"))
+    warm = _checks_by_id(cli.build_doctor_report(cache=ProbeCache(cache_path)))
+    assert calls == []
+    assert warm["node"]["cached"] is True
+    assert warm["npm"]["message"] == "npm is available: npm 1.0"
+    assert warm["package:abstractcore"]["cached"] is True
+    assert "cached" not in warm["hardware:gpu"]
+
+
+def test_doctor_cache_refresh_ttl_and_executable_identity(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from abstractframework.cache import ProbeCache
+
+    executable, calls = _fake_node(tmp_path, monkeypatch)
+    cache_path = tmp_path / "doctor-probes.json"
+    cli.build_doctor_report(cache=ProbeCache(cache_path))
+
+    calls.clear()
+    cli.build_doctor_report(cache=ProbeCache(cache_path, refresh=True))
+    assert sorted(calls) == ["node", "npm"]
+
+    calls.clear()
+    cli.build_doctor_report(cache=ProbeCache(cache_path, ttl=0))
+    assert sorted(calls) == ["node", "npm"]
+
+    calls.clear()
+    executable.write_text("#!/bin/sh\n# upgraded\n", encoding="utf-8")
+    cli.build_doctor_report(cache=ProbeCache(cache_path))
+    assert sorted(calls) == ["node", "npm"]
+
+
+def test_doctor_cli_no_cache_does_not_write(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    cache_dir: Path,
+) -> None:
+    _fake_node(tmp_path, monkeypatch)
+
+    cli.main(["doctor", "--json", "--no-cache"])
+    assert not cache_dir.exists()
+
+    cli.main(["doctor", "--json"])
+    capsys.readouterr()
+    cli.main(["doctor", "--json"])
+    report = json.loads(capsys.readouterr().out)
+    assert (cache_dir / "doctor-probes.json").exists()
+    assert _checks_by_id(report)["node"]["cached"] is True
+
+
+def test_doctor_report_times_every_check(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _slow_version(command: str, timeout: float = 5.0) -> str | None:
+        time.sleep(0.1 if command == "npm" else 0)
+        return f"{command} 1.0"
+
+    monkeypatch.setattr(cli, "_command_version", _slow_version)
+    monkeypatch.setattr(cli, "_which", lambda command: None)
+
+    report = cli.build_doctor_report()
+
+    def _assert_timing(timing: dict[str, float], keys: set[str]) -> None:
+        assert set(timing) == keys
+        assert all(isinstance(value, (int, float)) and value >= 0 for value in timing.values())
+
+    checks = _checks_by_id(report)
+    for check in checks.values():
+        _assert_timing(check["timing"], {"start_ms", "wall_ms", "cpu_ms"})  # type: ignore[arg-type]
+    assert checks["npm"]["timing"]["wall_ms"] >= 100
+    timing = dict(report["timing"])  # type: ignore[call-overload]
+    phases = timing.pop("phases")
+    _assert_timing(timing, {"wall_ms", "cpu_ms"})
+    assert set(phases) == {"distributions", "probes"}
+    for phase in phases.values():
+        _assert_timing(phase, {"start_ms", "wall_ms", "cpu_ms"})
+
+
+def test_doctor_cli_timings_view_and_chrome_trace(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setattr(cli, "_command_version", lambda command, timeout=5.0: f"{command} 1.0")
+    monkeypatch.setattr(cli, "_which", lambda command: None)
+    trace_path = tmp_path / "doctor-trace.json"
+
+    cli.main(["doctor", "--no-cache", "--timings", "--trace", str(trace_path)])
+
+    out = capsys.readouterr().out
+    assert "wall ms" in out and "cpu ms" in out
+    assert "(distributions)" in out
+    assert out.splitlines()[-2].startswith("total")
+    trace = json.loads(trace_path.read_text(encoding="utf-8"))
+    spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    names = {event["name"] for event in spans}
+    assert {"python", "distributions", "node", "npm", "hardware:gpu", "doctor"} <= names
+    main_thread = next(event["tid"] for event in spans if event["name"] == "python")
+    probes = [event for event in spans if event["cat"] == "probe"]
+    assert len(probes) == 3
+    assert all(event["tid"] != main_thread for event in probes)
+    assert all(event["dur"] >= 0 and "cpu_ms" in event["args"] for event in spans)
+    assert any(event["ph"] == "M" for event in trace["traceEvents"])
+
+
+def _write_distribution(
+    site: Path, name: str, version: str, requires: list[str], files: dict[str, bytes]
+) -> None:
+    info = site / f"{name}-{version}.dist-info"
+    info.mkdir(parents=True)
+    metadata = ["Metadata-Version: 2.1", f"Name: {name}", f"Version: {version}"]
+    metadata.extend(f"Requires-Dist: {requirement}" for requirement in requires)
+    (info / "METADATA").write_text("\n".join(metadata) + "\n", encoding="utf-8")
+    record = [f"{info.name}/METADATA,,", f"{info.name}/RECORD,,"]
+    for relative, content in files.items():
+        target = site / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
+        record.append(f"{relative},,{len(content)}")
+    (info / "RECORD").write_text("\n".join(record) + "\n", encoding="utf-8")
+
+
+def test_doctor_footprint_aggregates_by_profile(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    import os
+
+    from abstractframework import __version__
+
+    site = tmp_path / "site"
+    _write_distribution(
+        site,
+        "abstractframework",
+        __version__,
+        [
+            "abstractcore==2.13.38",
+            'abstractgateway[gpu]==0.2.28; extra == "gpu"',
+            'not-installed-apple-stack; extra == "apple"',
+        ],
+        {},
+    )
+    _write_distribution(
+        site,
+        "abstractcore",
+        "2.13.38",
+        ["tinydep", 'heavydep; extra == "gpu"'],
+        {"abstractcore/__init__.py": b"BALLAST = b'x' * (32 << 20)\n"},
+    )
+    _write_distribution(
+        site,
+        "abstractgateway",
+        "0.2.28",
+        ['abstractcore[gpu]; extra == "gpu"'],
+        {"abstractgateway/__init__.py": b"import abstractcore\n"},
+    )
+    _write_distribution(site, "tinydep", "1.0", [], {"tinydep.py": b"x" * 10})
+    _write_distribution(site, "heavydep", "1.0", [], {"heavydep/data.bin": b"x" * 4096})
+    monkeypatch.syspath_prepend(str(site))
+    paths = [str(site), os.environ.get("PYTHONPATH", "")]
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join(path for path in paths if path))
+    monkeypatch.setattr(cli, "_command_version", lambda command, timeout=5.0: None)
+    monkeypatch.setattr(cli, "_which", lambda command: None)
+
+    cli.main(["doctor", "--json", "--no-cache", "--footprint"])
+    footprint = json.loads(capsys.readouterr().out)["footprint"]
+
+    components = {row["component"]: row for row in footprint["components"]}
+    assert set(components) == {"abstractcore", "abstractgateway"}
+    core = components["abstractcore"]
+    assert core["closure"] == ["abstractcore", "tinydep"]
+    assert core["files"] == 3
+    tinydep = footprint["distributions"]["tinydep"]
+    assert core["closure_disk_bytes"] == core["disk_bytes"] + tinydep["disk_bytes"]
+    if os.name != "nt":
+        assert core["import_rss_bytes"] >= 16 << 20
+
+    profiles = {profile["id"]: profile for profile in footprint["profiles"]}
+    assert profiles["light"]["components"] == ["abstractcore"]
+    assert profiles["light"]["distributions"] == 3
+    assert profiles["gpu"]["components"] == ["abstractcore", "abstractgateway"]
+    assert profiles["gpu"]["distributions"] == 5
+    assert profiles["gpu"]["disk_bytes"] - profiles["light"]["disk_bytes"] >= 4096
+    assert profiles["apple"]["missing"] == ["not-installed-apple-stack"]
+
+
+def test_dependency_check_evaluates_markers_specifiers_and_extras(tmp_path: Path) -> None:
+    from abstractframework.deps import check_dependencies
+
+    site = tmp_path / "site"
+    _write_distribution(
+        site,
+        "gateway",
+        "1.0",
+        [
+            "runtime>=0.4",
+            'runtime[gpu]; extra == "gpu"',
+            'winonly; sys_platform == "never"',
+            "not a requirement!",
+        ],
+        {},
+    )
+    _write_distribution(
+        site, "runtime", "0.3", ['cudastack>=2; extra == "gpu"', 'unused; extra == "apple"'], {}
+    )
+    _write_distribution(site, "cudastack", "1.5", [], {})
+    legacy = site / "legacy.egg-info"
+    legacy.mkdir()
+    (legacy / "PKG-INFO").write_text("Name: legacy\nVersion: 2.0\n", encoding="utf-8")
+    (legacy / "requires.txt").write_text("gateway<1\n\n[gpu]\nabsent\n", encoding="utf-8")
+
+    result = check_dependencies([str(site)], roots=['gateway[gpu]; python_version >= "3"'])
+
+    assert result["distributions"] == 4
+    assert result["extras"] == {"gateway": ["gpu"], "runtime": ["gpu"]}
+    problems = {(p["requirer"], p["kind"]): p for p in result["problems"]}
+    assert set(problems) == {
+        ("gateway", "conflict"),
+        ("gateway", "invalid"),
+        ("legacy", "conflict"),
+        ("runtime", "conflict"),
+    }
+    assert problems["gateway", "conflict"]["message"] == (
+        "gateway 1.0 requires runtime>=0.4, but runtime 0.3 is installed"
+    )
+    assert problems["runtime", "conflict"]["requirement"] == 'cudastack>=2; extra == "gpu"'
+
+    result = check_dependencies([str(site)], roots=["missing-root"], root_name="profile:x")
+    assert result["extras"] == {}
+    assert {"kind": "missing", "requirer": "profile:x"}.items() <= next(
+        p for p in result["problems"] if p["requirer"] == "profile:x"
+    ).items()
+
+
+@pytest.mark.parametrize("with_packaging", [True, False])
+def test_requirement_parsing_is_shared_and_degrades_without_packaging(
+    monkeypatch: pytest.MonkeyPatch, with_packaging: bool
+) -> None:
+    from abstractframework import deps, footprint, requirements
+
+    if not with_packaging:
+        monkeypatch.setattr(requirements, "Requirement", None)
+    assert deps.parse_requirement is footprint.parse_requirement is requirements.parse_requirement
+
+    parsed = requirements.parse_requirement('Runtime_Core[GPU, Apple]>=1; extra == "Cuda"')
+    assert parsed is not None
+    assert (parsed.name, parsed.extras) == ("runtime-core", frozenset({"gpu", "apple"}))
+    assert parsed.marker_has_extra
+    assert parsed.applies("cuda") and not parsed.applies() and not parsed.applies("gpu")
+    plain = requirements.parse_requirement("runtime")
+    assert plain is not None and plain.applies() and not plain.marker_has_extra
+    assert requirements.evaluator() == ("packaging" if with_packaging else "basic")
+
+
+def test_dependency_checks_have_one_check_per_distribution() -> None:
+    def _problem(kind: str, requirer: str, requirement: str) -> dict[str, str]:
+        return {
+            "kind": kind,
+            "requirer": requirer,
+            "requirement": requirement,
+            "message": f"{requirer} {kind} {requirement}",
+        }
+
+    result = {
+        "evaluator": "fallback",
+        "distributions": 3,
+        "requirements": 4,
+        "problems": [
+            _problem("conflict", "Gateway", "runtime>=0.4"),
+            _problem("invalid", "gateway", "not a requirement!"),
+            _problem("invalid", "legacy", "broken"),
+        ],
+    }
+
+    checks = cli._dependency_checks(result, cached=False)
+
+    assert [check.id for check in checks] == ["deps:gateway", "deps:legacy", "deps:evaluator"]
+    gateway = checks[0]
+    assert gateway.status == "error"
+    assert gateway.message == "Gateway conflict runtime>=0.4; gateway invalid not a requirement!"
+    assert gateway.detail == "Requirements: runtime>=0.4 | not a requirement!"
+    assert (checks[1].status, checks[1].detail) == ("warn", "Requirement: broken")
+
+    result = {**result, "evaluator": "packaging", "problems": []}
+    assert [check.id for check in cli._dependency_checks(result, cached=False)] == ["deps"]
+
+
+def test_doctor_deps_is_cached_against_the_environment(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from abstractframework import __version__, deps
+    from abstractframework.cache import ProbeCache
+
+    calls: list[list[str]] = []
+
+    def _check(paths: object = None, roots: list[str] = (), root_name: str = "") -> dict:
+        calls.append(list(roots))
+        problem = {"kind": "missing", "requirer": "gateway", "requirement": "absent"}
+        return {
+            "evaluator": "packaging",
+            "distributions": 1,
+            "requirements": 1,
+            "extras": {},
+            "problems": [{**problem, "message": "gateway requires absent"}],
+        }
+
+    monkeypatch.setattr(deps, "check_dependencies", _check)
+    cache_path = tmp_path / "doctor-probes.json"
+
+    cold = cli.build_doctor_report(False, cache=ProbeCache(cache_path), deps=True, profile="gpu")
+    warm = cli.build_doctor_report(False, cache=ProbeCache(cache_path), deps=True, profile="gpu")
+
+    assert calls == [[f"abstractframework[gpu]=={__version__}"]]
+    assert cold["deps"]["profile"] == "gpu"
+    assert "cached" not in _checks_by_id(cold)["deps:gateway"]
+    assert _checks_by_id(warm)["deps:gateway"]["cached"] is True
+    assert _checks_by_id(warm)["deps:gateway"]["message"] == "gateway requires absent"
+    assert warm["status"] == "error"
+    assert "deps" not in cli.build_doctor_report(False, cache=ProbeCache(cache_path))
+
+
+def _fake_host(root: Path) -> None:
+    cpuinfo = []
+    for socket in ("0", "1"):
+        for core in ("0", "1"):
+            for _ in range(2):
+                cpuinfo.append(
+                    f"processor\t: {len(cpuinfo)}\nmodel name\t: Test CPU\n"
+                    f"physical id\t: {socket}\ncore id\t\t: {core}\n"
+                    "flags\t\t: fpu sse4_2 avx avx2 fma avx512f\n"
+                )
+    files = {
+        "proc/cpuinfo": "\n".join(cpuinfo),
+        "proc/meminfo": "MemTotal:       33554432 kB\nMemAvailable:   16777216 kB\n",
+        "proc/self/cgroup": "0::/app.slice\n",
+        "sys/fs/cgroup/app.slice/cgroup.controllers": "cpu memory\n",
+        "sys/fs/cgroup/app.slice/cpu.max": "150000 100000\n",
+        "sys/fs/cgroup/app.slice/memory.max": f"{8 << 30}\n",
+        "sys/fs/cgroup/app.slice/memory.current": f"{6 << 30}\n",
+    }
+    for relative, text in files.items():
+        (root / relative).parent.mkdir(parents=True, exist_ok=True)
+        (root / relative).write_text(text, encoding="utf-8")
+
+
+def test_capacity_probe_reads_proc_and_cgroup_limits(tmp_path: Path) -> None:
+    from abstractframework.capacity import probe_capacity
+
+    _fake_host(tmp_path / "host")
+
+    capacity = probe_capacity(
+        tmp_path / "host", disk_dir=tmp_path / "disk", disk_sample_bytes=1 << 20
+    )
+
+    cpu = capacity["cpu"]
+    assert (cpu["model"], cpu["physical_cores"], cpu["sockets"]) == ("Test CPU", 4, 2)
+    assert cpu["simd"] == ["avx", "avx2", "avx512", "fma", "sse4.2"]
+    assert capacity["memory"] == {"total_bytes": 32 << 30, "available_bytes": 16 << 30}
+    assert capacity["cgroup"]["version"] == 2
+    assert capacity["cgroup"]["cpu_limit"] == 1.5
+    assert capacity["effective"]["cpus"] == min(2, cpu["usable"])
+    assert capacity["effective"]["memory_bytes"] == 8 << 30
+    assert capacity["effective"]["available_memory_bytes"] == 2 << 30
+    assert capacity["disk"]["bytes"] == 1 << 20 and capacity["disk"]["read_mb_s"] > 0
+    assert list((tmp_path / "disk").iterdir()) == []
+
+
+def test_capacity_recommends_a_manifest_profile_with_reasons() -> None:
+    from abstractframework.capacity import GIB, recommend_profile
+    from abstractframework.install_manifest import build_install_manifest
+
+    profiles = build_install_manifest()["profiles"]
+
+    def _host(system: str, memory: int, nvidia: bool = False, apple: bool = False) -> dict:
+        return {
+            "system": system,
+            "cpu": {"simd": ["avx2"]},
+            "cgroup": {"cpu_limit": None, "memory_limit_bytes": None},
+            "gpu": {"nvidia_smi": nvidia, "apple_silicon": apple},
+            "effective": {"cpus": 16, "memory_bytes": memory},
+        }
+
+    gpu = recommend_profile(_host("Linux", 64 * GIB, nvidia=True), profiles)
+    assert gpu["profile"] == "gpu"
+    assert [verdict["id"] for verdict in gpu["profiles"]] == ["light", "apple", "gpu"]
+
+    cpu_only = recommend_profile(_host("Linux", 64 * GIB), profiles)
+    assert cpu_only["profile"] == "light"
+    assert "llama.cpp" in cpu_only["reasoning"][-1]
+
+    small_mac = recommend_profile(_host("Darwin", 8 * GIB, apple=True), profiles)
+    assert small_mac["profile"] == "light"
+    apple = next(verdict for verdict in small_mac["profiles"] if verdict["id"] == "apple")
+    assert apple["reasons"] == ["8.0 GiB memory is below 16.0 GiB"]
+    assert recommend_profile(_host("Darwin", 32 * GIB, apple=True), profiles)["profile"] == "apple"
+
+
+def test_doctor_cli_capacity_reports_recommendation(capsys: pytest.CaptureFixture[str]) -> None:
+    cli.main(["doctor", "--json", "--no-cache", "--no-environment", "--capacity"])
+    report = json.loads(capsys.readouterr().out)
+
+    recommended = report["capacity"]["recommendation"]["profile"]
+    assert recommended in {"light", "apple", "gpu"}
+    check = _checks_by_id(report)["capacity"]
+    assert check["message"] == f"Recommended install profile: {recommended}"
+    assert "wall_ms" in check["timing"]
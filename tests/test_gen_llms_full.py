@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _gen_llms_full() -> ModuleType:
+    spec = importlib.util.spec_from_file_location(
+        "gen_llms_full", ROOT / "scripts" / "gen_llms_full.py"
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _docs(root: Path) -> list[str]:
+    (root / "docs").mkdir()
+    (root / "README.md").write_text("# Title\n", encoding="utf-8")
+    (root / "docs" / "guide.md").write_text("Guide text without newline", encoding="utf-8")
+    return ["README.md", "docs/guide.md"]
+
+
+def test_generate_streams_sections_and_records_byte_ranges(tmp_path: Path) -> None:
+    gen = _gen_llms_full()
+    files = _docs(tmp_path)
+    output = tmp_path / "llms-full.txt"
+
+    changed, index = gen.generate(tmp_path, files, output)
+
+    data = output.read_bytes()
+    assert changed == files
+    assert data.decode("utf-8") == (
+        gen.HEADER
+        + "\n--- README.md ---\n# Title\n"
+        + "\n--- docs/guide.md ---\nGuide text without newline\n"
+    )
+    sections = {section["path"]: section for section in index["sections"]}
+    guide = sections["docs/guide.md"]
+    assert data[guide["offset"] : guide["offset"] + guide["length"]] == (
+        b"Guide text without newline\n"
+    )
+    assert json.loads(gen.index_path(output).read_text(encoding="utf-8")) == index
+    assert gen.index_path(output).name == "llms-full.index.json"
+    assert gen.check(tmp_path, files, output) == []
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_generate_skips_unchanged_inputs_and_rewrites_on_change(tmp_path: Path) -> None:
+    gen = _gen_llms_full()
+    files = _docs(tmp_path)
+    output = tmp_path / "llms-full.txt"
+    gen.generate(tmp_path, files, output)
+    os.utime(output, (0, 0))
+
+    assert gen.generate(tmp_path, files, output)[0] == []
+    assert output.stat().st_mtime == 0
+
+    (tmp_path / "docs" / "guide.md").write_text("New guide\n", encoding="utf-8")
+    assert gen.check(tmp_path, files, output) == ["docs/guide.md changed"]
+    assert gen.generate(tmp_path, files, output)[0] == ["docs/guide.md"]
+    assert output.read_text(encoding="utf-8").endswith("--- docs/guide.md ---\nNew guide\n")
+    assert gen.check(tmp_path, files, output) == []
+
+    assert gen.generate(tmp_path, files[::-1], output)[0] == files[::-1]
+    assert gen.generate(tmp_path, files, output, force=True)[0] == files
+
+
+def test_check_detects_edited_output_and_missing_inputs(tmp_path: Path) -> None:
+    gen = _gen_llms_full()
+    files = _docs(tmp_path)
+    output = tmp_path / "llms-full.txt"
+
+    assert gen.check(tmp_path, files, output) == ["llms-full.index.json is missing or unreadable"]
+    gen.generate(tmp_path, files, output)
+    output.write_text(output.read_text(encoding="utf-8") + "edit\n", encoding="utf-8")
+    assert gen.check(tmp_path, files, output) == ["llms-full.txt does not match its index"]
+
+    with pytest.raises(SystemExit, match="Missing file: docs/missing.md"):
+        gen.check(tmp_path, [*files, "docs/missing.md"], output)
+
+
+def test_docs_files_appends_the_rest_of_the_docs_tree(tmp_path: Path) -> None:
+    gen = _gen_llms_full()
+    key_files = _docs(tmp_path)
+    (tmp_path / "docs" / "adr").mkdir()
+    (tmp_path / "docs" / "adr" / "0002-b.md").write_text("B\n", encoding="utf-8")
+    (tmp_path / "docs" / "adr" / "0001-a.md").write_text("A\n", encoding="utf-8")
+    (tmp_path / "docs" / "notes.txt").write_text("not markdown\n", encoding="utf-8")
+
+    assert gen.docs_files(tmp_path, key_files) == [
+        "README.md",
+        "docs/guide.md",
+        "docs/adr/0001-a.md",
+        "docs/adr/0002-b.md",
+    ]
+    assert set(gen.KEY_FILES) < set(gen.FILES)
+    assert "docs/adr/0002-effect-system-design.md" in gen.FILES
+
+
+def test_checked_in_packs_rank_adrs_after_guides_and_before_the_backlog() -> None:
+    gen = _gen_llms_full()
+    index = json.loads((ROOT / "llms-full.index.json").read_text(encoding="utf-8"))
+    tiers = {section["path"]: section["tier"] for section in index["sections"]}
+
+    assert tiers["docs/adr/0001-layered-architecture.md"] == "adr"
+    largest = max(index["packs"].values(), key=lambda pack: pack["budget"])["sections"]
+    ranks = [gen.PACK_TIERS.index(tiers[path]) for path in largest]
+    assert ranks == sorted(ranks)
+    assert "docs/adr/README.md" in largest
+    assert "guides" in {tiers[path] for path in largest}
+
+
+def test_generate_writes_non_regular_outputs_directly(tmp_path: Path) -> None:
+    gen = _gen_llms_full()
+    files = _docs(tmp_path)
+
+    changed, index = gen.generate(tmp_path, files, Path(os.devnull))
+
+    assert changed == files
+    assert index is None
+
+
+def test_estimate_tokens_is_offline_and_monotonic() -> None:
+    gen = _gen_llms_full()
+
+    assert gen.estimate_tokens("") == 0
+    assert gen.estimate_tokens("hello world") == 2
+    assert gen.estimate_tokens("internationalization") == 4
+    assert gen.estimate_tokens("x = 12345\n    y") == 7
+    assert gen.estimate_tokens("one two three " * 10) > gen.estimate_tokens("one two three")
+
+
+def test_packs_follow_tiers_fit_budgets_and_nest(tmp_path: Path) -> None:
+    gen = _gen_llms_full()
+    (tmp_path / "docs" / "backlog").mkdir(parents=True)
+    (tmp_path / "docs" / "guide").mkdir()
+    (tmp_path / "docs" / "adr").mkdir()
+    texts = {
+        "docs/backlog/item.md": "backlog " * 40,
+        "docs/adr/0001-layers.md": "decision " * 40,
+        "docs/guide/setup.md": "guide " * 40,
+        "README.md": "readme " * 40,
+        "abstractframework/cli.py": "code " * 40,
+    }
+    (tmp_path / "abstractframework").mkdir()
+    for rel, text in texts.items():
+        (tmp_path / rel).write_text(text, encoding="utf-8")
+    output = tmp_path / "llms-full.txt"
+
+    _, index = gen.generate(tmp_path, list(texts), output, budgets=(100, 200, 10_000))
+
+    tiers = {section["path"]: section["tier"] for section in index["sections"]}
+    assert tiers["docs/adr/0001-layers.md"] == "adr"
+    packs = index["packs"]
+    assert list(packs) == ["100", "200", "10k"]
+    assert packs["10k"]["sections"] == [
+        "README.md",
+        "docs/guide/setup.md",
+        "docs/adr/0001-layers.md",
+        "abstractframework/cli.py",
+        "docs/backlog/item.md",
+    ]
+    for pack in packs.values():
+        assert pack["tokens"] <= pack["budget"]
+        assert pack["sections"] == packs["10k"]["sections"][: len(pack["sections"])]
+    assert len(packs["100"]["sections"]) < len(packs["200"]["sections"])
+
+    os.utime(output, (0, 0))
+    changed, index = gen.generate(tmp_path, list(texts), output, budgets=(50,))
+    assert changed == []
+    assert output.stat().st_mtime == 0
+    assert list(index["packs"]) == ["50"]
+    assert gen.check(tmp_path, list(texts), output, budgets=(50,)) == []
+    assert gen.check(tmp_path, list(texts), output) == ["context packs are out of date"]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from abstractframework import cli
+from abstractframework.gitstatus import (
+    STATUS_GROUPS,
+    RepoStatus,
+    parse_porcelain_v2,
+    workspace_status,
+)
+
+_PORCELAIN = """\
+# branch.oid 0123456789abcdef0123456789abcdef01234567
+# branch.head main
+# branch.upstream origin/main
+# branch.ab +2 -1
+1 M. N... 100644 100644 100644 aaaa bbbb staged.py
+1 .M N... 100644 100644 100644 aaaa bbbb modified.py
+1 MM N... 100644 100644 100644 aaaa bbbb both.py
+2 R. N... 100644 100644 100644 aaaa bbbb R100 new.py\told.py
+? notes.txt
+? tmp/scratch.py
+! ignored.log
+"""
+
+
+def test_parse_porcelain_v2_counts_branch_and_changes(tmp_path: Path) -> None:
+    status = parse_porcelain_v2(_PORCELAIN, RepoStatus("repo", tmp_path))
+
+    assert (status.branch, status.upstream) == ("main", "origin/main")
+    assert (status.ahead, status.behind) == (2, 1)
+    assert (status.staged, status.unstaged, status.untracked) == (3, 2, 2)
+    assert status.has_changes
+
+
+def test_parse_porcelain_v2_detached_head(tmp_path: Path) -> None:
+    status = parse_porcelain_v2("# branch.head (detached)\n", RepoStatus("repo", tmp_path))
+
+    assert status.branch == "HEAD"
+    assert status.upstream is None
+    assert not status.has_changes
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_workspace_status_groups_and_short_json(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "README.md").write_text("root\n", encoding="utf-8")
+    _git(tmp_path, "add", "README.md")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    (tmp_path / ".git" / "info" / "exclude").write_text("/AbstractMusic/\n", encoding="utf-8")
+    clone = tmp_path / "AbstractMusic"
+    clone.mkdir()
+    _git(clone, "init", "-q")
+    (clone / "new.py").write_text("x = 1\n", encoding="utf-8")
+
+    groups = workspace_status(tmp_path, jobs=4)
+
+    assert [title for title, _ in groups] == [title for title, _ in STATUS_GROUPS]
+    statuses = {status.name: status for _, repos in groups for status in repos}
+    assert statuses["abstractmusic"].path == clone.resolve()
+    assert statuses["abstractmusic"].untracked == 1
+    assert statuses["abstractframework"].cloned and not statuses["abstractframework"].has_changes
+    assert not statuses["abstractcore"].cloned
+
+    assert cli.main(["workspace", "status", "--root", str(tmp_path), "--short", "--json"]) == 0
+    payload = json.loads(capsys.readouterr().out)
+    shown = [repo["name"] for group in payload["groups"] for repo in group["repos"]]
+    assert shown == ["abstractmusic"]
+    assert (payload["total"], payload["dirty"]) == (16, 1)
+
+    assert cli.main(["workspace", "status", "--root", str(tmp_path), "--short"]) == 0
+    assert "\033[" not in capsys.readouterr().out
+    assert cli.main(["workspace", "status", "--root", str(tmp_path), "--color", "always"]) == 0
+    out = capsys.readouterr().out
+    assert "\033[1;33mabstractmusic" in out
+    assert "\033[31m1 untracked\033[0m" in out
+
+
+def test_status_line_colours_match_status_sh() -> None:
+    status = RepoStatus("abstractcore", Path("."), branch="main", staged=1, ahead=2, behind=1)
+    status.unpushed = ["abc1234 wip"]
+
+    assert cli._status_line(status) == [
+        "  abstractcore              main  1 staged, ↑2 unpushed, ↓1 behind",
+        "      abc1234 wip",
+    ]
+    line, commit = cli._status_line(status, color=True)
+    assert line == (
+        "  \033[1;33mabstractcore            \033[0m  \033[36mmain\033[0m  "
+        "\033[32m1 staged\033[0m, \033[33m↑2 unpushed\033[0m, \033[33m↓1 behind\033[0m"
+    )
+    assert commit == "      \033[2mabc1234 wip\033[0m"
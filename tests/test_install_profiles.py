@@ -176,6 +176,68 @@ def test_generated_install_manifest_matches_checked_in_manifest() -> None:
     assert manifest_path.read_text(encoding="utf-8") == manifest_json()
 
 
+def test_checked_in_manifest_digest_sidecar_is_current() -> None:
+    from abstractframework.install_manifest import manifest_digest, read_digest
+
+    manifest_path = ROOT / "docs" / "installers" / "install-manifest.json"
+    sidecar = manifest_path.with_name("install-manifest.json.sha256").read_text(encoding="utf-8")
+
+    assert read_digest(manifest_path) == manifest_digest()
+    assert sidecar.split() == [manifest_digest().split(":", 1)[1], "install-manifest.json"]
+
+
+def test_manifest_serialization_is_memoized_and_digest_checked_first(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from abstractframework import install_manifest
+
+    assert install_manifest.manifest_bytes() is install_manifest.manifest_bytes()
+    assert install_manifest.manifest_json() == install_manifest.manifest_bytes().decode("utf-8")
+
+    manifest_path = tmp_path / "install-manifest.json"
+    install_manifest.write_install_manifest(manifest_path)
+    assert install_manifest.check_install_manifest(manifest_path)[0] is True
+
+    install_manifest.digest_path(manifest_path).write_text(
+        f"{'0' * 64}  install-manifest.json\n", encoding="utf-8"
+    )
+
+    def _no_full_read(self: Path) -> bytes:
+        raise AssertionError("manifest was read despite a stale digest")
+
+    monkeypatch.setattr(Path, "read_bytes", _no_full_read)
+    ok, message = install_manifest.check_install_manifest(manifest_path)
+    assert ok is False
+    assert "digest sha256:000" in message
+    monkeypatch.undo()
+
+    install_manifest.write_install_manifest(manifest_path)
+    manifest_path.write_text(manifest_path.read_text(encoding="utf-8").replace("0", "1"))
+    assert install_manifest.check_install_manifest(manifest_path)[0] is False
+
+
+def test_cli_builds_the_manifest_once_per_invocation(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    from abstractframework import cli
+
+    calls = []
+    build = cli.build_install_manifest
+
+    def _counting_build() -> dict[str, object]:
+        calls.append(1)
+        return build()
+
+    monkeypatch.setattr(cli, "build_install_manifest", _counting_build)
+    assert cli.main(["docs"]) == 0
+    assert len(calls) == 1
+
+    calls.clear()
+    cli.build_doctor_report(include_environment=False, deps=True, profile="light", capacity=True)
+    assert len(calls) == 1
+    capsys.readouterr()
+
+
 def test_install_manifest_profiles_are_generated_from_root_pins() -> None:
     from abstractframework import NPM_RELEASE_VERSIONS
     from abstractframework.install_manifest import build_install_manifest
@@ -219,3 +281,55 @@ def test_cli_manifest_check_and_doctor_report() -> None:
         (ROOT / "pyproject.toml").read_text(encoding="utf-8")
     )["project"]["version"]
     assert {check["status"] for check in report["checks"]} <= {"ok", "warn", "error"}
+
+
+def test_manifest_diff_reports_changes_and_minimal_commands(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    import copy
+
+    from abstractframework.cli import main
+    from abstractframework.install_manifest import build_install_manifest, diff_install_manifest
+
+    current = build_install_manifest()
+    assert diff_install_manifest(current)["unchanged"] is True
+    assert all(
+        commands == {"pip": [], "npm": []}
+        for commands in diff_install_manifest(current)["commands"].values()
+    )
+
+    old = copy.deepcopy(current)
+    packages = {item["id"]: item for item in old["python_packages"]}
+    packages["abstractcore"]["version"] = "0.0.1"
+    old["python_packages"].remove(packages["abstractmusic"])
+    old["python_packages"].append(
+        {"id": "legacy", "distribution": "legacy-dist", "version": "1.0", "registry": "pypi"}
+    )
+    old["profiles"][2]["platforms"] = ["linux"]
+    old_path = tmp_path / "old-manifest.json"
+    old_path.write_text(json.dumps(old), encoding="utf-8")
+
+    assert main(["manifest", "--diff", str(old_path)]) == 0
+    delta = json.loads(capsys.readouterr().out)
+
+    assert delta["unchanged"] is False
+    assert delta["python_packages"]["changed"] == [
+        {"id": "abstractcore", "distribution": "abstractcore", "from": "0.0.1", "to": "2.13.38"}
+    ]
+    assert [item["id"] for item in delta["python_packages"]["added"]] == ["abstractmusic"]
+    assert [item["id"] for item in delta["python_packages"]["removed"]] == ["legacy"]
+    assert delta["npm_apps"] == {"added": [], "removed": [], "changed": []}
+    assert delta["profiles"]["changed"] == [
+        {"id": "gpu", "fields": {"platforms": {"from": ["linux"], "to": ["linux", "windows"]}}}
+    ]
+    gpu_requirement = current["profiles"][2]["pip_requirements"][0]
+    assert delta["commands"]["gpu"] == {
+        "pip": [
+            ["pip", "uninstall", "-y", "legacy-dist"],
+            ["pip", "install", gpu_requirement, "abstractmusic==0.1.13", "abstractcore==2.13.38"],
+        ],
+        "npm": [],
+    }
+
+    old_path.write_text("[]", encoding="utf-8")
+    assert main(["manifest", "--diff", str(old_path)]) == 2
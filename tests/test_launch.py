@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+import socket
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from abstractframework.launch import (
+    LaunchError,
+    Probe,
+    Service,
+    default_services,
+    gateway_contract_ok,
+    launch_services,
+)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _http_server(name: str, port: int) -> Service:
+    command = [sys.executable, "-m", "http.server", str(port), "--bind", "127.0.0.1"]
+    return Service(name, command, "127.0.0.1", port, (Probe("ui", "/"),))
+
+
+def test_gateway_contract_ok() -> None:
+    contracts = {
+        "common": {"prompt_cache": {"durable_blocs": {}}},
+        "flow_editor": {
+            "runs": {"start": {"endpoint": "/api/runs"}},
+            "ledger": {"stream": {"endpoint": "/api/ledger"}},
+        },
+    }
+    body = json.dumps({"capabilities": {"contracts": contracts}}).encode()
+
+    assert gateway_contract_ok(body)
+    contracts["flow_editor"]["available"] = False
+    assert not gateway_contract_ok(json.dumps({"capabilities": {"contracts": contracts}}).encode())
+    assert not gateway_contract_ok(b"<html>")
+    assert not gateway_contract_ok(b"{}")
+
+
+def test_default_services_follow_the_manifest() -> None:
+    # The test cache directory has no `npm warm` prefix, so Flow falls back to npx.
+    gateway, flow = default_services(
+        ("gateway", "flow"), host="0.0.0.0", ports={"gateway": 9090}, token="secret"
+    )
+
+    assert gateway.command == ["abstractgateway", "serve", "--host", "0.0.0.0", "--port", "9090"]
+    assert gateway.env["ABSTRACTGATEWAY_AUTH_TOKEN"] == "secret"
+    assert gateway.connect_host == "127.0.0.1"
+    assert [probe.label for probe in gateway.probes] == ["health", "contract"]
+    assert flow.command[:3] == ["npx", "--yes", "@abstractframework/flow"]
+    assert flow.command[-2:] == ["--gateway-url", "http://127.0.0.1:9090"]
+    assert "ABSTRACTGATEWAY_AUTH_TOKEN" in flow.unset_env
+
+    with pytest.raises(LaunchError, match="bogus"):
+        default_services(("bogus",))
+
+
+def test_launch_services_reports_stage_timings(tmp_path: Path) -> None:
+    launch = launch_services(
+        [_http_server("a", _free_port()), _http_server("b", _free_port())],
+        tmp_path / "logs",
+        timeout=30,
+    )
+    try:
+        assert launch.ready, launch.as_dict()
+        for report in launch.reports.values():
+            assert [stage.label for stage in report.stages] == ["ui"]
+            assert report.ready_at is not None and report.ready_at <= launch.elapsed
+            assert report.stages[0].attempts >= 1
+        assert launch.first_exit() is None
+    finally:
+        launch.stop()
+    assert all(process.poll() is not None for process in launch.processes.values())
+
+
+def test_url_probes_accept_client_errors_but_contract_probes_do_not(tmp_path: Path) -> None:
+    # http.server answers 404 for a missing path.
+    page = replace(_http_server("page", _free_port()), probes=(Probe("ui", "/missing"),))
+    contract = replace(
+        _http_server("contract", _free_port()),
+        probes=(Probe("contract", "/missing", validate=lambda body: True),),
+    )
+
+    launch = launch_services([page], tmp_path / "logs", timeout=30)
+    launch.stop()
+    assert launch.ready, launch.as_dict()
+
+    launch = launch_services([contract], tmp_path / "logs", timeout=1)
+    launch.stop()
+    assert launch.reports["contract"].status == "timeout"
+
+
+def test_launch_services_stops_everything_when_a_service_exits(tmp_path: Path) -> None:
+    crash = Service(
+        "crash",
+        [sys.executable, "-c", "import sys; print('boom'); sys.exit(3)"],
+        "127.0.0.1",
+        _free_port(),
+        (Probe("ui", "/"),),
+    )
+    # Never answers: only the exit of `crash` can end the wait before the timeout.
+    idle = Service(
+        "idle",
+        [sys.executable, "-c", "import time; time.sleep(60)"],
+        "127.0.0.1",
+        _free_port(),
+        (Probe("ui", "/"),),
+    )
+
+    launch = launch_services([crash, idle], tmp_path / "logs", timeout=30)
+
+    assert not launch.ready
+    assert launch.elapsed < 10
+    assert launch.reports["crash"].status == "exited"
+    assert "exited with 3" in launch.reports["crash"].detail
+    assert launch.reports["idle"].status == "aborted"
+    assert launch.processes["idle"].poll() is not None
+    assert "boom" in (tmp_path / "logs" / "crash.log").read_text(encoding="utf-8")
+
+
+def test_launch_services_reports_missing_executables(tmp_path: Path) -> None:
+    missing = Service("missing", ["abstractframework-missing-binary"], "127.0.0.1", 1, ())
+
+    launch = launch_services([missing], tmp_path / "logs")
+
+    assert launch.reports["missing"].status == "failed"
+    assert "abstractframework-missing-binary" in launch.reports["missing"].detail
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from abstractframework import cli
+from abstractframework.llms_full import LLMS_FULL_ENV, LlmsFull, LlmsFullError, read_sections
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _generate(root: Path) -> Path:
+    spec = importlib.util.spec_from_file_location(
+        "gen_llms_full", ROOT / "scripts" / "gen_llms_full.py"
+    )
+    assert spec is not None and spec.loader is not None
+    gen = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(gen)
+
+    (root / "docs" / "guide").mkdir(parents=True)
+    files = {
+        "README.md": "# Title\n",
+        "docs/guide/a.md": "Guide A\n",
+        "docs/guide/b.md": "Guide B — unicode\n",
+        "docs/faq.md": "FAQ",
+    }
+    for rel, text in files.items():
+        (root / rel).write_text(text, encoding="utf-8")
+    output = root / "llms-full.txt"
+    gen.generate(root, list(files), output)
+    return output
+
+
+def test_reader_returns_sections_by_path_and_glob(tmp_path: Path) -> None:
+    output = _generate(tmp_path)
+
+    with LlmsFull(output) as docs:
+        assert docs.paths == ["README.md", "docs/guide/a.md", "docs/guide/b.md", "docs/faq.md"]
+        assert docs.read("docs/faq.md", verify=True) == "FAQ\n"
+        assert docs.select("docs/guide/*", "README.md") == {
+            "README.md": "# Title\n",
+            "docs/guide/a.md": "Guide A\n",
+            "docs/guide/b.md": "Guide B — unicode\n",
+        }
+        with pytest.raises(KeyError, match="docs/missing"):
+            docs.select("docs/missing*")
+
+    assert read_sections("docs/guide/a.md", path=output) == {"docs/guide/a.md": "Guide A\n"}
+
+
+def test_reader_rejects_stale_or_missing_index(tmp_path: Path) -> None:
+    output = _generate(tmp_path)
+    output.write_text(output.read_text(encoding="utf-8") + "extra\n", encoding="utf-8")
+
+    with pytest.raises(LlmsFullError, match="gen_llms_full.py"):
+        LlmsFull(output).read("README.md")
+    with pytest.raises(LlmsFullError, match="cannot read"):
+        LlmsFull(tmp_path / "other.txt")
+
+
+def test_reader_verify_detects_edited_section(tmp_path: Path) -> None:
+    output = _generate(tmp_path)
+    data = output.read_bytes()
+    output.write_bytes(data.replace(b"Guide A", b"Guide Z"))
+
+    with LlmsFull(output) as docs:
+        assert docs.read("docs/guide/a.md") == "Guide Z\n"
+        with pytest.raises(LlmsFullError, match="index hash"):
+            docs.read("docs/guide/a.md", verify=True)
+
+
+def test_docs_cli_show_and_list(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    output = _generate(tmp_path)
+
+    assert cli.main(["docs", "show", "docs/guide/b.md", "--file", str(output)]) == 0
+    assert capsys.readouterr().out == "--- docs/guide/b.md ---\nGuide B — unicode\n"
+
+    assert cli.main(["docs", "list", "--file", str(output), "--json"]) == 0
+    entries = json.loads(capsys.readouterr().out)
+    assert [entry["path"] for entry in entries][:2] == ["README.md", "docs/guide/a.md"]
+
+    assert cli.main(["docs", "show", "nope", "--file", str(output)]) == 2
+    assert "no llms-full section" in capsys.readouterr().err
+
+
+def test_checked_in_llms_full_is_indexed() -> None:
+    with LlmsFull(ROOT / "llms-full.txt") as docs:
+        assert docs.read("README.md").startswith("# AbstractFramework")
+
+
+def test_docs_commands_work_from_an_installed_package(
+    tmp_path: Path, built_package: Path
+) -> None:
+    # Only the built package directory, as a wheel installs it: no checkout around it.
+    env = {key: value for key, value in os.environ.items() if key != LLMS_FULL_ENV}
+    env["PYTHONPATH"] = str(built_package)
+
+    def run(*args: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [sys.executable, "-m", "abstractframework.cli", "docs", *args, "--json"],
+            capture_output=True,
+            text=True,
+            cwd=tmp_path,
+            env=env,
+            timeout=60,
+            check=False,
+        )
+
+    listed = run("list")
+    assert listed.returncode == 0, listed.stderr
+    assert "README.md" in {section["path"] for section in json.loads(listed.stdout)}
+    shipped = built_package / "abstractframework" / "data"
+    assert sorted(path.name for path in shipped.iterdir()) == [
+        "llms-full.index.json",
+        "llms-full.search.json",
+        "llms-full.txt",
+    ]
+    assert (shipped / "llms-full.txt").read_bytes() == (ROOT / "llms-full.txt").read_bytes()
+    assert not (ROOT / "abstractframework" / "data").exists()
+
+
+def test_context_packs_share_a_stable_prefix(tmp_path: Path) -> None:
+    output = _generate(tmp_path)
+
+    with LlmsFull(output) as docs:
+        assert list(docs.packs) == ["8k", "32k", "128k"]
+        small, large = docs.pack("8k"), docs.pack("128k", verify=True)
+        assert small.startswith(docs.pack_header)
+        assert "--- docs/faq.md ---\nFAQ\n" in small
+        assert large.startswith(small)
+        with pytest.raises(KeyError, match="available: 8k, 32k, 128k"):
+            docs.pack("1k")
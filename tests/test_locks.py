@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from abstractframework import __version__, cli
+from abstractframework.install_manifest import build_install_manifest
+from abstractframework.locks import (
+    LockError,
+    LockTarget,
+    current_target,
+    find_lock,
+    lock_target,
+    read_lock_index,
+    supported_platforms,
+    write_lock,
+)
+from conftest import make_wheel
+
+
+def test_lock_pins_every_wheel_by_hash_offline(tmp_path: Path, wheelhouse: Path) -> None:
+    locks = tmp_path / "locks"
+
+    entry = write_lock(locks, "gpu", find_links=wheelhouse)
+
+    assert [(wheel["name"], wheel["version"]) for wheel in entry["wheels"]] == [
+        ("abstractframework", __version__),
+        ("alpha", "1.2"),
+        ("beta", "2.1"),
+    ]
+    text = (locks / entry["path"]).read_text(encoding="utf-8")
+    assert "alpha==1.2 \\\n    --hash=sha256:" in text
+    assert entry["path"] == f"gpu-{entry['target']['tag']}.txt"
+    assert find_lock(locks, "gpu") == locks / entry["path"]
+
+    # The lock installs with no resolver and no index.
+    target = tmp_path / "target"
+    subprocess.run(
+        [sys.executable, "-m", "pip", "install", "--no-deps", "--require-hashes", "--no-index"]
+        + ["--only-binary=:all:", "--find-links", str(wheelhouse), "--target", str(target)]
+        + ["--disable-pip-version-check", "--quiet", "-r", str(locks / entry["path"])],
+        check=True,
+    )
+    assert (target / "beta" / "__init__.py").exists()
+
+    (locks / entry["path"]).write_text(text.replace("1.2", "1.0"), encoding="utf-8")
+    assert find_lock(locks, "gpu") is None
+
+
+def test_lock_index_keeps_one_entry_per_profile_and_target(
+    tmp_path: Path, wheelhouse: Path
+) -> None:
+    locks = tmp_path / "locks"
+    write_lock(locks, "light", find_links=wheelhouse)
+    write_lock(locks, "light", find_links=wheelhouse)
+    other = LockTarget("3.12", ("manylinux2014_aarch64",))
+    write_lock(locks, "light", find_links=wheelhouse, target=other)
+
+    index = read_lock_index(locks)
+    assert [lock["target"]["tag"] for lock in index["locks"]].count(
+        "cp312-manylinux2014_aarch64"
+    ) == 1
+    assert len(index["locks"]) == 2
+    assert "beta" not in {wheel["name"] for lock in index["locks"] for wheel in lock["wheels"]}
+    assert find_lock(locks, "light", other) == locks / "light-cp312-manylinux2014_aarch64.txt"
+    # Locks are not published with the manifest, so it must not point at them.
+    assert "locks" not in build_install_manifest()
+
+
+def test_manifest_lock_cli_reports_resolution_errors(
+    tmp_path: Path, wheelhouse: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    args = ["manifest", "--lock", "light", "--lock-dir", str(tmp_path / "locks")]
+
+    assert cli.main([*args, "--find-links", str(wheelhouse)]) == 0
+    assert "(2 distributions, " in capsys.readouterr().out
+
+    assert cli.main([*args, "--find-links", str(tmp_path)]) == 2
+    assert "could not resolve profile light" in capsys.readouterr().err
+    assert json.loads((tmp_path / "locks" / "index.json").read_text())["format"] == 1
+
+
+def test_cross_python_lock_accepts_manylinux_wheels(
+    tmp_path: Path, wheelhouse: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manylinux = next(
+        (tag for tag in supported_platforms() if tag.startswith("manylinux_2_17_")), None
+    )
+    if manylinux is None:
+        pytest.skip("this host does not run manylinux wheels")
+    version = "3.10" if sys.version_info[:2] != (3, 10) else "3.11"
+    abi = f"cp{version.replace('.', '')}"
+    for wheel in wheelhouse.glob("alpha-*"):
+        wheel.unlink()
+    make_wheel(wheelhouse, "alpha", "1.2", tag=f"{abi}-{abi}-{manylinux}")
+    native = current_target().platforms[0]
+
+    assert lock_target() is None
+    target = lock_target(version)
+    assert target is not None and target.platforms[0] == native and manylinux in target.platforms
+    entry = write_lock(tmp_path / "locks", "light", find_links=wheelhouse, target=target)
+    assert f"alpha-1.2-{abi}-{abi}-{manylinux}.whl" in {
+        wheel["filename"] for wheel in entry["wheels"]
+    }
+    assert entry["target"]["tag"] == f"{abi}-{native}"
+
+    # The native tag alone is what sysconfig reports, and it rejects manylinux wheels.
+    with pytest.raises(LockError, match="could not resolve profile light"):
+        write_lock(
+            tmp_path / "native",
+            "light",
+            find_links=wheelhouse,
+            target=LockTarget(version, (native,)),
+        )
+
+    monkeypatch.setitem(sys.modules, "packaging", None)
+    with pytest.raises(LockError, match="pass --platform"):
+        lock_target(version)
+    assert lock_target(version, ["manylinux2014_x86_64"]).platforms == ("manylinux2014_x86_64",)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import io
+import json
+import shutil
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from abstractframework import NPM_RELEASE_VERSIONS, cli
+from abstractframework.launch import default_services
+from abstractframework.npmwarm import (
+    NpmWarmError,
+    npm_tarball_name,
+    resolve_npm_command,
+    warm_npm_apps,
+    warm_prefix,
+    warm_status,
+)
+
+pytestmark = pytest.mark.skipif(shutil.which("npm") is None, reason="npm is not installed")
+
+
+def _add(archive: tarfile.TarFile, name: str, data: bytes, mode: int = 0o644) -> None:
+    info = tarfile.TarInfo(f"package/{name}")
+    info.size = len(data)
+    info.mode = mode
+    archive.addfile(info, io.BytesIO(data))
+
+
+def _npm_tarballs(directory: Path) -> Path:
+    """Write `npm pack`-style tarballs of the pinned apps, each with a Node binary."""
+
+    directory.mkdir()
+    for package, version in NPM_RELEASE_VERSIONS.items():
+        unscoped = package.rsplit("/", 1)[-1]
+        manifest = {"name": package, "version": version, "bin": {unscoped: "cli.js"}}
+        with tarfile.open(directory / npm_tarball_name(package, version), "w:gz") as archive:
+            _add(archive, "package.json", json.dumps(manifest).encode("utf-8"))
+            _add(archive, "cli.js", b"#!/usr/bin/env node\nconsole.log('ok')\n", 0o755)
+    return directory
+
+
+def test_warm_prefix_is_preferred_over_npx_while_fresh(tmp_path: Path) -> None:
+    prefix = warm_prefix()
+    stale_prefix = prefix.parent / "0123456789abcdef"
+    stale_prefix.mkdir(parents=True)
+
+    record = warm_npm_apps(sources=[_npm_tarballs(tmp_path / "npm")], offline=True)
+
+    assert record["pins"] == NPM_RELEASE_VERSIONS
+    assert not stale_prefix.exists()
+    flow_bin = record["apps"]["@abstractframework/flow"]["bin"]
+    assert Path(flow_bin).is_file()
+    assert {entry["status"] for entry in warm_status().values()} == {"ok"}
+    assert resolve_npm_command(["npx", "@abstractframework/flow", "--port", "1"]) == [
+        flow_bin,
+        "--port",
+        "1",
+    ]
+    (flow,) = default_services(("flow",))
+    assert flow.command[0] == flow_bin
+    assert cli._npm_warm_check().status == "ok"
+
+    installed = prefix / "node_modules" / "@abstractframework" / "flow" / "package.json"
+    installed.write_text(json.dumps({"name": "@abstractframework/flow", "version": "0.0.1"}))
+
+    assert warm_status()["@abstractframework/flow"]["status"] == "stale"
+    assert resolve_npm_command(["npx", "@abstractframework/flow"]) == [
+        "npx",
+        "@abstractframework/flow",
+    ]
+    check = cli._npm_warm_check()
+    assert check.status == "warn"
+    assert "@abstractframework/flow 0.0.1 (pinned 0.3.19)" in check.message
+
+    installed.write_text(json.dumps({"name": "@abstractframework/flow", "version": "0.3.19"}))
+    shutil.rmtree(prefix / "node_modules" / "@abstractframework" / "observer")
+    check = cli._npm_warm_check()
+    assert check.status == "warn"
+    assert check.message.endswith("missing from the warm prefix: @abstractframework/observer")
+
+
+def test_npm_warm_cli(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert cli._npm_warm_check().status == "ok"
+    (flow,) = default_services(("flow",))
+    assert flow.command[:3] == ["npx", "--yes", "@abstractframework/flow"]
+
+    assert cli.main(["npm", "warm", "--offline"]) == 2
+    assert "npm install of the pinned apps failed" in capsys.readouterr().err
+
+    npm_dir = _npm_tarballs(tmp_path / "npm")
+    assert cli.main(["npm", "warm", "--from", str(npm_dir), "--offline", "--json"]) == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["prefix"] == str(warm_prefix())
+    assert sorted(payload["apps"]) == sorted(NPM_RELEASE_VERSIONS)
+
+
+def test_warm_rejects_a_package_without_the_pinned_version(tmp_path: Path) -> None:
+    npm_dir = _npm_tarballs(tmp_path / "npm")
+    package, version = next(iter(NPM_RELEASE_VERSIONS.items()))
+    with tarfile.open(npm_dir / npm_tarball_name(package, version), "w:gz") as archive:
+        _add(archive, "package.json", json.dumps({"name": package, "version": "9.9.9"}).encode())
+
+    with pytest.raises(NpmWarmError, match="9.9.9 was installed"):
+        warm_npm_apps(tmp_path / "prefix", sources=[npm_dir], offline=True)
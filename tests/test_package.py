@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _run_python(code: str, *, extra_path: Path | None = None) -> subprocess.CompletedProcess[str]:
+    paths = [str(ROOT)]
+    if extra_path is not None:
+        paths.insert(0, str(extra_path))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(paths))
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        check=False,
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+
+
+def _fake_abstractcore(tmp_path: Path) -> Path:
+    package = tmp_path / "abstractcore"
+    package.mkdir()
+    (package / "__init__.py").write_text(
+        "__version__ = '0.0.0-test'\n"
+        "class GenerateResponse:\n"
+        "    pass\n"
+        "def create_llm(*args, **kwargs):\n"
+        "    return 'fake-llm'\n",
+        encoding="utf-8",
+    )
+    return tmp_path
+
+
+def test_import_does_not_load_abstractcore(tmp_path: Path) -> None:
+    result = _run_python(
+        "import sys\n"
+        "import abstractframework\n"
+        "import abstractframework.cli\n"
+        "import abstractframework.install_manifest\n"
+        "assert 'abstractcore' not in sys.modules, sorted(sys.modules)\n"
+        "assert 'abstractframework.footprint' not in sys.modules\n",
+        extra_path=_fake_abstractcore(tmp_path),
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_doctor_and_launch_paths_do_not_load_the_bundle_tooling() -> None:
+    result = _run_python(
+        "import sys\n"
+        "import abstractframework.cli\n"
+        "import abstractframework.launch\n"
+        "loaded = {'abstractframework.bundle', 'abstractframework.locks'} & set(sys.modules)\n"
+        "assert not loaded, sorted(loaded)\n"
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_convenience_reexports_resolve_on_first_access(tmp_path: Path) -> None:
+    result = _run_python(
+        "import sys\n"
+        "import abstractframework\n"
+        "assert 'create_llm' in dir(abstractframework)\n"
+        "assert abstractframework.create_llm() == 'fake-llm'\n"
+        "assert 'abstractcore' in sys.modules\n"
+        "from abstractframework import GenerateResponse\n"
+        "assert GenerateResponse.__module__ == 'abstractcore'\n",
+        extra_path=_fake_abstractcore(tmp_path),
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_star_import_without_abstractcore(tmp_path: Path) -> None:
+    # A `None` entry in sys.modules makes abstractcore unimportable and unfindable.
+    result = _run_python(
+        "import sys\n"
+        "sys.modules['abstractcore'] = None\n"
+        "from abstractframework import *\n"
+        "assert 'RELEASE_VERSIONS' in dir()\n"
+        "assert 'create_llm' not in dir()\n"
+    )
+    assert result.returncode == 0, result.stderr
+
+    result = _run_python(
+        "from abstractframework import *\n"
+        "assert create_llm() == 'fake-llm'\n",
+        extra_path=_fake_abstractcore(tmp_path),
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_unknown_attribute_raises_attribute_error() -> None:
+    import abstractframework
+
+    with pytest.raises(AttributeError, match="does_not_exist"):
+        abstractframework.does_not_exist  # type: ignore[attr-defined]  # noqa: B018
+
+
+def _fake_component(
+    site: Path, name: str, version: str, body: str = "", *, dist_info: bool = True
+) -> None:
+    package = site / name
+    package.mkdir()
+    (package / "__init__.py").write_text(f"{body}\n__version__ = {version!r}\n", encoding="utf-8")
+    if dist_info:
+        info = site / f"{name}-{version}.dist-info"
+        info.mkdir()
+        (info / "METADATA").write_text(
+            f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n", encoding="utf-8"
+        )
+
+
+def test_installed_packages_reads_metadata_without_importing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import abstractframework
+
+    _fake_component(tmp_path, "fakevoice", "1.2.3", "raise RuntimeError('must not import')")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(
+        abstractframework,
+        "PACKAGE_DISTRIBUTIONS",
+        {"fakevoice": "fakevoice", "fakemissing": "fakemissing"},
+    )
+
+    assert abstractframework.get_installed_packages() == {"fakevoice": "1.2.3"}
+    assert "fakevoice" not in sys.modules
+
+
+def test_installed_packages_deep_mode_isolates_broken_and_slow_imports(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import abstractframework
+
+    _fake_component(tmp_path, "fakeok", "2.0.0", dist_info=False)
+    _fake_component(tmp_path, "fakebroken", "0.1.0", "raise ImportError('boom')")
+    _fake_component(tmp_path, "fakeslow", "0.1.0", "import time; time.sleep(30)")
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+    monkeypatch.setattr(
+        abstractframework,
+        "PACKAGE_DISTRIBUTIONS",
+        {"fakeok": "fakeok", "fakebroken": "fakebroken", "fakeslow": "fakeslow"},
+    )
+
+    installed = abstractframework.get_installed_packages(deep=True, timeout=2.0)
+
+    assert installed == {"fakeok": "2.0.0"}
+    assert "fakeok" not in sys.modules
+
+
+def test_distribution_index_scans_once_and_matches_metadata(tmp_path: Path) -> None:
+    from abstractframework.distributions import lookup_version, scan_distributions
+
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    _fake_component(first, "Abstract_Runtime", "0.4.29")
+    _fake_component(second, "abstract_runtime", "0.1.0")
+    develop = second / "legacy_pkg.egg-info"
+    develop.mkdir()
+    (develop / "PKG-INFO").write_text(
+        "Metadata-Version: 1.2\nName: legacy.pkg\nVersion: 3.1.4\n\nlong description\n",
+        encoding="utf-8",
+    )
+
+    index = scan_distributions([str(first), str(second), str(tmp_path / "missing")])
+
+    assert lookup_version(index, "AbstractRuntime") is None
+    assert lookup_version(index, "abstract-runtime") == "0.4.29"
+    assert lookup_version(index, "Legacy_Pkg") == "3.1.4"
+    assert lookup_version(index, "not-installed") is None
+
+
+def test_distribution_index_agrees_with_importlib_metadata() -> None:
+    import importlib.metadata
+
+    from abstractframework.distributions import lookup_version, scan_distributions
+
+    index = scan_distributions()
+    for dist in importlib.metadata.distributions():
+        name = dist.metadata["Name"]
+        assert lookup_version(index, name) == importlib.metadata.version(name)
+
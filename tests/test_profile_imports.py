@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from abstractframework import cli
+from abstractframework.importtime import check_budget, parse_importtime, profile_import
+
+_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _json
+import time:       300 |        420 |     json.scanner
+import time:       500 |        920 |   json.decoder
+import time:        80 |       1100 | json
+some warning printed by a module
+import time:        40 |         40 | abstractcore
+"""
+
+
+def test_parse_importtime_builds_nested_tree() -> None:
+    roots = parse_importtime(_SAMPLE)
+
+    assert [root.module for root in roots] == ["json", "abstractcore"]
+    json_node = roots[0]
+    assert (json_node.self_us, json_node.cumulative_us) == (80, 1100)
+    assert [child.module for child in json_node.children] == ["_json", "json.decoder"]
+    assert [child.module for child in json_node.children[1].children] == ["json.scanner"]
+    assert [node.module for node in json_node.walk()] == [
+        "json",
+        "_json",
+        "json.decoder",
+        "json.scanner",
+    ]
+
+
+def _fake_site(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    site = tmp_path / "site"
+    core = site / "abstractcore"
+    core.mkdir(parents=True)
+    (core / "__init__.py").write_text("import json\nfrom . import models\n", encoding="utf-8")
+    (core / "models.py").write_text("import email.parser\n", encoding="utf-8")
+    broken = site / "abstractmusic"
+    broken.mkdir()
+    (broken / "__init__.py").write_text("raise RuntimeError('boom')\n", encoding="utf-8")
+    paths = [str(site), os.environ.get("PYTHONPATH", "")]
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join(path for path in paths if path))
+    return site
+
+
+def test_profile_import_reports_tree_offenders_and_status(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _fake_site(tmp_path, monkeypatch)
+
+    profile = profile_import("abstractcore", top=3)
+    assert profile.status == "ok"
+    assert profile.tree is not None and profile.tree.module == "abstractcore"
+    assert "abstractcore.models" in {node.module for node in profile.tree.walk()}
+    assert profile.cumulative_ms is not None and profile.cumulative_ms >= profile.self_ms
+    assert len(profile.offenders()) == 3
+    if os.name != "nt":
+        assert profile.peak_rss_mb is not None and profile.peak_rss_mb > 0
+
+    broken = profile_import("abstractmusic")
+    assert broken.status == "error"
+    assert broken.error == "RuntimeError: boom"
+    assert profile_import("abstractagent").status == "missing"
+
+
+def test_import_budget_flags_slow_and_heavy_components() -> None:
+    from abstractframework.importtime import ImportNode, ImportProfile
+
+    fast = ImportProfile("abstractcore", "ok", ImportNode("abstractcore", 10, 50_000), 0, 2 << 20)
+    slow = ImportProfile("abstractvoice", "ok", ImportNode("abstractvoice", 10, 900_000))
+    missing = ImportProfile("abstractmusic", "missing")
+    budget = {"abstractcore": {"import_ms": 100, "peak_rss_mb": 1}, "default": {"import_ms": 500}}
+
+    violations = check_budget([fast, slow, missing], budget)
+
+    assert violations == [
+        "abstractcore: peak RSS 2.0 MB, budget 1 MB",
+        "abstractvoice: import took 900.0 ms, budget 500 ms",
+    ]
+
+
+def test_import_budget_flags_components_that_fail_to_import() -> None:
+    from abstractframework.importtime import ImportProfile
+
+    profiles = [
+        ImportProfile("abstractcore", "timeout", error="import exceeded 60s"),
+        ImportProfile("abstractvoice", "error", error="RuntimeError: boom"),
+        ImportProfile("abstractagent", "missing", error="No module named 'abstractagent'"),
+        ImportProfile("abstractmusic", "missing"),
+    ]
+    budget = {"abstractcore": 1500, "abstractagent": 800, "default": {"import_ms": 500}}
+
+    assert check_budget(profiles, budget) == [
+        "abstractcore: import timeout: import exceeded 60s",
+        "abstractvoice: import error: RuntimeError: boom",
+        "abstractagent: import missing: No module named 'abstractagent'",
+    ]
+
+
+def test_profile_imports_cli_json_and_budget_exit_code(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    _fake_site(tmp_path, monkeypatch)
+    budget = tmp_path / "budget.json"
+    budget.write_text(json.dumps({"abstractcore": 0.001}), encoding="utf-8")
+
+    assert cli.main(["profile-imports", "abstractcore", "--json", "--tree"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    (component,) = report["components"]
+    assert component["tree"]["module"] == "abstractcore"
+    assert component["top_offenders"]
+
+    assert cli.main(["profile-imports", "abstractcore", "--budget", str(budget)]) == 1
+    out = capsys.readouterr().out
+    assert "Import budget exceeded" in out
+    assert "abstractcore: import took" in out
+
+    assert cli.main(["profile-imports", "not-a-component"]) == 2
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from abstractframework import cli
+from abstractframework.cache import ProbeCache
+from abstractframework.workspace import (
+    DEPENDENCIES_NODE,
+    META_NODE,
+    PYTHON_TIERS,
+    BuildNode,
+    WorkspaceError,
+    plan_workspace,
+    run_build,
+    source_fingerprint,
+)
+
+
+def _sleep_then_touch(path: Path, seconds: float = 0.3) -> list[str]:
+    code = f"import pathlib, time; time.sleep({seconds}); pathlib.Path({str(path)!r}).touch()"
+    return [sys.executable, "-c", code]
+
+
+def _fake_workspace(root: Path) -> Path:
+    for tier in PYTHON_TIERS:
+        for repo in tier:
+            (root / repo).mkdir(parents=True)
+    return root
+
+
+def test_run_build_runs_independent_nodes_concurrently(tmp_path: Path) -> None:
+    nodes = [
+        BuildNode(name, "python", tmp_path, [_sleep_then_touch(tmp_path / name)])
+        for name in ("a", "b", "c")
+    ]
+    nodes.append(
+        BuildNode("d", "python", tmp_path, [[sys.executable, "-c", "pass"]], ("a", "b", "c"))
+    )
+
+    results = run_build(nodes, tmp_path / "logs", jobs=3)
+
+    assert [result.status for result in results] == ["ok"] * 4
+    first_tier = results[:3]
+    assert max(result.started for result in first_tier) < min(
+        result.started + result.elapsed for result in first_tier
+    )
+    assert results[3].started >= max(result.started + result.elapsed for result in first_tier)
+    assert (tmp_path / "logs" / "a.log").read_text(encoding="utf-8").startswith("$ ")
+
+
+def test_run_build_blocks_dependents_of_a_failure(tmp_path: Path) -> None:
+    fail = [sys.executable, "-c", "import sys; print('boom'); sys.exit(3)"]
+    nodes = [
+        BuildNode("python:a", "python", tmp_path, [fail]),
+        BuildNode("python:b", "python", tmp_path, [[sys.executable, "-c", "pass"]], ("python:a",)),
+        BuildNode("npm:ui", "npm", tmp_path, [[sys.executable, "-c", "pass"]]),
+    ]
+    seen: list[str] = []
+
+    results = run_build(nodes, tmp_path / "logs", jobs=2, on_result=lambda r: seen.append(r.name))
+
+    assert [result.status for result in results] == ["failed", "blocked", "ok"]
+    assert "exited with 3" in results[0].detail
+    assert "boom" in (tmp_path / "logs" / "python-a.log").read_text(encoding="utf-8")
+    assert results[1].detail == "after python:a"
+    assert sorted(seen) == ["npm:ui", "python:a", "python:b"]
+
+
+def test_plan_workspace_orders_tiers_and_applies_profile_extras(tmp_path: Path) -> None:
+    root = _fake_workspace(tmp_path)
+    (root / "abstractuic").mkdir()
+    (root / "abstractflow").mkdir()
+
+    nodes, warnings = plan_workspace(root, "gpu")
+    by_name = {node.name: node for node in nodes}
+
+    assert by_name["python:abstractskill"].deps == ()
+    assert set(by_name["python:abstractcore"].deps) == {f"python:{r}" for r in PYTHON_TIERS[0]}
+    assert by_name["python:abstractcore"].label == "install -e abstractcore[all-gpu]"
+    assert by_name["python:abstractgateway"].label == "install -e abstractgateway[gpu]"
+    assert by_name["python:abstractcode"].label == "install -e abstractcode"
+    assert by_name[META_NODE].deps == (DEPENDENCIES_NODE,)
+    assert by_name["npm:abstractflow"].deps == ("npm:abstractuic",)
+    assert "npm:abstractobserver" not in by_name
+    assert any("abstractobserver" in warning for warning in warnings)
+
+
+def test_plan_workspace_reports_missing_repos(tmp_path: Path) -> None:
+    with pytest.raises(WorkspaceError, match="abstractcore"):
+        plan_workspace(tmp_path)
+
+    nodes, _ = plan_workspace(tmp_path, python=False)
+    assert nodes == []
+
+
+def test_workspace_build_cli_json(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    exit_code = cli.main(["workspace", "build", "--root", str(tmp_path), "--npm-only", "--json"])
+
+    payload = json.loads(capsys.readouterr().out)
+    assert exit_code == 0
+    assert payload["ok"] is True
+    assert payload["results"] == []
+    assert len(payload["warnings"]) == 4
+    assert not (tmp_path / ".venv").exists()
+
+
+def test_workspace_build_cli_missing_repos(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    exit_code = cli.main(["workspace", "build", "--root", str(tmp_path), "--python-only"])
+
+    assert exit_code == 2
+    assert "clone.sh" in capsys.readouterr().err
+
+
+def _counting_node(
+    tmp_path: Path, name: str, source: Path, deps: tuple[str, ...] = ()
+) -> BuildNode:
+    counter = tmp_path / f"{name}.count"
+    code = (
+        f"import pathlib; p = pathlib.Path({str(counter)!r}); "
+        "p.write_text(p.read_text() + 'x' if p.exists() else 'x')"
+    )
+    command = [sys.executable, "-c", code]
+    return BuildNode(name, "python", source, [command], deps, sources=(source,))
+
+
+def test_run_build_skips_unchanged_nodes_and_invalidates_downstream(tmp_path: Path) -> None:
+    upstream, downstream, other = (tmp_path / name for name in ("up", "down", "other"))
+    for source in (upstream, downstream, other):
+        source.mkdir()
+        (source / "pyproject.toml").write_text("[project]\nname = 'x'\n", encoding="utf-8")
+    nodes = [
+        _counting_node(tmp_path, "up", upstream),
+        _counting_node(tmp_path, "down", downstream, ("up",)),
+        _counting_node(tmp_path, "other", other),
+    ]
+    cache_path = tmp_path / "state" / "build-cache.json"
+
+    def build(force: bool = False) -> list[str]:
+        cache = ProbeCache(cache_path, ttl=float("inf"), refresh=force)
+        results = run_build(nodes, tmp_path / "logs", jobs=2, cache=cache)
+        cache.save()
+        return [result.status for result in results]
+
+    assert build() == ["ok", "ok", "ok"]
+    assert build() == ["skipped", "skipped", "skipped"]
+
+    (upstream / "pyproject.toml").write_text("[project]\nname = 'y'\n", encoding="utf-8")
+    assert build() == ["ok", "ok", "skipped"]
+    assert build(force=True) == ["ok", "ok", "ok"]
+    assert (tmp_path / "other.count").read_text(encoding="utf-8") == "xx"
+
+
+def test_run_build_rebuilds_cached_node_whose_output_is_gone(tmp_path: Path) -> None:
+    source = tmp_path / "src"
+    source.mkdir()
+    output = tmp_path / "output"
+    node = BuildNode(
+        "npm:ui",
+        "npm",
+        source,
+        [[sys.executable, "-c", f"import pathlib; pathlib.Path({str(output)!r}).mkdir()"]],
+        sources=(source,),
+        installed=output.is_dir,
+    )
+    cache = ProbeCache(tmp_path / "cache.json", ttl=float("inf"))
+
+    assert run_build([node], tmp_path / "logs", cache=cache)[0].status == "ok"
+    assert run_build([node], tmp_path / "logs", cache=cache)[0].status == "skipped"
+    output.rmdir()
+    assert run_build([node], tmp_path / "logs", cache=cache)[0].status == "ok"
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_source_fingerprint_tracks_git_tree_and_worktree(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    (repo / "pkg").mkdir(parents=True)
+    (repo / "pkg" / "module.py").write_text("VALUE = 1\n", encoding="utf-8")
+    git = ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@example.com"]
+    subprocess.run([*git, "init", "-q"], check=True)
+    subprocess.run([*git, "add", "."], check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "init"], check=True)
+
+    clean = source_fingerprint(repo)
+    assert source_fingerprint(repo) == clean
+
+    (repo / "pkg" / "module.py").write_text("VALUE = 2\n", encoding="utf-8")
+    edited = source_fingerprint(repo)
+    assert edited != clean
+
+    subprocess.run([*git, "commit", "-q", "-am", "edit"], check=True)
+    assert source_fingerprint(repo) not in {clean, edited}